@@ -13,13 +13,16 @@
 #   [Github](https://github.com/blockworks-foundation)
 #   [Email](mailto:hello@blockworks.foundation)
 
+import collections
+import concurrent.futures
+import itertools
 import pandas
 import typing
 
 from dataclasses import dataclass
 from decimal import Decimal
 from solana.publickey import PublicKey
-from solana.rpc.types import MemcmpOpts
+from solana.rpc.types import DataSliceOpts, MemcmpOpts
 
 from .accountinfo import AccountInfo
 from .addressableaccount import AddressableAccount
@@ -347,157 +350,11 @@ class Account(AddressableAccount):
         group: Group,
         cache: Cache,
     ) -> "Account":
-        meta_data = Metadata.from_layout(layout.meta_data)
-        owner: PublicKey = layout.owner
-        info: str = layout.info
-        mngo_token = group.liquidity_incentive_token
-        in_margin_basket: typing.Sequence[bool] = list(
-            [bool(in_basket) for in_basket in layout.in_margin_basket]
-        )
-        active_in_basket: typing.List[bool] = []
-        slots: typing.List[AccountSlot] = []
-        placed_orders_all_markets: typing.List[typing.List[PlacedOrder]] = [
-            [] for _ in range(len(group.slot_indices) - 1)
-        ]
-        for index, order_market in enumerate(layout.order_market):
-            if order_market != 0xFF:
-                side = Side.from_value(layout.order_side[index])
-                id = layout.order_ids[index]
-                client_id = layout.client_order_ids[index]
-                placed_order = PlacedOrder(id, client_id, side)
-                placed_orders_all_markets[int(order_market)] += [placed_order]
-
-        quote_token_bank: TokenBank = group.shared_quote
-        quote_token: Token = group.shared_quote_token
-
-        for index in range(len(group.slots_by_index)):
-            group_slot = group.slots_by_index[index]
-            if group_slot is not None:
-                instrument = group_slot.base_instrument
-                token_bank = group_slot.base_token_bank
-                raw_deposit: Decimal = Decimal(0)
-                intrinsic_deposit: Decimal = Decimal(0)
-                raw_borrow: Decimal = Decimal(0)
-                intrinsic_borrow: Decimal = Decimal(0)
-                if token_bank is not None:
-                    raw_deposit = layout.deposits[index]
-                    root_bank_cache: typing.Optional[
-                        RootBankCache
-                    ] = token_bank.root_bank_cache_from_cache(cache, index)
-                    if root_bank_cache is None:
-                        raise Exception(
-                            f"No root bank cache found for token {token_bank} at index {index}"
-                        )
-                    intrinsic_deposit = root_bank_cache.deposit_index * raw_deposit
-                    raw_borrow = layout.borrows[index]
-                    intrinsic_borrow = root_bank_cache.borrow_index * raw_borrow
-
-                deposit = InstrumentValue(
-                    instrument, instrument.shift_to_decimals(intrinsic_deposit)
-                )
-                borrow = InstrumentValue(
-                    instrument, instrument.shift_to_decimals(intrinsic_borrow)
-                )
-
-                perp_open_orders = PerpOpenOrders(placed_orders_all_markets[index])
-
-                perp_account = PerpAccount.from_layout(
-                    layout.perp_accounts[index],
-                    instrument,
-                    quote_token,
-                    perp_open_orders,
-                    group_slot.perp_lot_size_converter,
-                    mngo_token,
-                )
-                spot_open_orders = layout.spot_open_orders[index]
-                account_slot: AccountSlot = AccountSlot(
-                    index,
-                    instrument,
-                    token_bank,
-                    quote_token_bank,
-                    raw_deposit,
-                    deposit,
-                    raw_borrow,
-                    borrow,
-                    spot_open_orders,
-                    perp_account,
-                )
-
-                slots += [account_slot]
-                active_in_basket += [True]
-            else:
-                active_in_basket += [False]
-
-        quote_index: int = len(layout.deposits) - 1
-        raw_quote_deposit: Decimal = layout.deposits[quote_index]
-        quote_root_bank_cache: typing.Optional[
-            RootBankCache
-        ] = quote_token_bank.root_bank_cache_from_cache(cache, quote_index)
-        if quote_root_bank_cache is None:
-            raise Exception(
-                f"No root bank cache found for quote token {quote_token_bank} at index {index}"
-            )
-        intrinsic_quote_deposit = (
-            quote_root_bank_cache.deposit_index * raw_quote_deposit
-        )
-        quote_deposit = InstrumentValue(
-            quote_token, quote_token.shift_to_decimals(intrinsic_quote_deposit)
-        )
-        raw_quote_borrow: Decimal = layout.borrows[quote_index]
-        intrinsic_quote_borrow = quote_root_bank_cache.borrow_index * raw_quote_borrow
-        quote_borrow = InstrumentValue(
-            quote_token, quote_token.shift_to_decimals(intrinsic_quote_borrow)
-        )
-        quote: AccountSlot = AccountSlot(
-            len(layout.deposits) - 1,
-            quote_token_bank.token,
-            quote_token_bank,
-            quote_token_bank,
-            raw_quote_deposit,
-            quote_deposit,
-            raw_quote_borrow,
-            quote_borrow,
-            None,
-            None,
-        )
-
-        msrm_amount: Decimal = layout.msrm_amount
-        being_liquidated: bool = bool(layout.being_liquidated)
-        is_bankrupt: bool = bool(layout.is_bankrupt)
-        advanced_orders: PublicKey = layout.advanced_orders
-        not_upgradable: bool = bool(layout.not_upgradable)
-        delegate: PublicKey = layout.delegate
-
-        return Account(
-            account_info,
-            version,
-            meta_data,
-            group.name,
-            group.address,
-            owner,
-            info,
-            quote,
-            in_margin_basket,
-            active_in_basket,
-            slots,
-            msrm_amount,
-            being_liquidated,
-            is_bankrupt,
-            advanced_orders,
-            not_upgradable,
-            delegate,
-        )
+        return AccountParser(group, cache).from_layout(layout, account_info, version)
 
     @staticmethod
     def parse(account_info: AccountInfo, group: Group, cache: Cache) -> "Account":
-        data = account_info.data
-        if len(data) != layouts.MANGO_ACCOUNT.sizeof():
-            raise Exception(
-                f"Account data length ({len(data)}) does not match expected size ({layouts.MANGO_ACCOUNT.sizeof()})"
-            )
-
-        layout = layouts.MANGO_ACCOUNT.parse(data)
-        return Account.from_layout(layout, account_info, Version.V3, group, cache)
+        return AccountParser(group, cache).parse(account_info)
 
     @staticmethod
     def load(context: Context, address: PublicKey, group: Group) -> "Account":
@@ -508,76 +365,99 @@ class Account(AddressableAccount):
         return Account.parse(account_info, group, cache)
 
     @staticmethod
-    def load_all(context: Context, group: Group) -> typing.Sequence["Account"]:
-        # entropy_group is just after the METADATA, which is the first entry.
-        group_offset = layouts.METADATA.sizeof()
-        # owner is just after entropy_group in the layout, and it's a PublicKey which is 32 bytes.
-        filters = [MemcmpOpts(offset=group_offset, bytes=encode_key(group.address))]
+    def load_all(
+        context: Context, group: Group, worker_count: int = 0
+    ) -> typing.Sequence["Account"]:
+        return list(Account.stream_all(context, group, worker_count))
 
-        account_infos = AccountInfo.load_by_program(
+    # Like `load_all()`, but `Account`s are yielded as they are read and parsed instead of all at the
+    # end. If `worker_count` is more than zero, parsing is spread across that many processes.
+    @staticmethod
+    def stream_all(
+        context: Context, group: Group, worker_count: int = 0
+    ) -> typing.Iterator["Account"]:
+        account_infos = AccountInfo.load_by_program_streaming(
             context,
             context.entropy_program_address,
-            memcmp_opts=filters,
+            memcmp_opts=Account.__group_filters(group),
             data_size=layouts.MANGO_ACCOUNT.sizeof(),
         )
-        cache: Cache = group.fetch_cache(context)
-        accounts: typing.List[Account] = []
-        for account_info in account_infos:
-            account = Account.parse(account_info, group, cache)
-            accounts += [account]
-        return accounts
+        yield from Account.__parse_all(context, group, account_infos, worker_count)
+
+    # A two-phase scan of all the accounts in the group. Only the `data_slice` of each account is
+    # fetched at first, and just the accounts whose slice `predicate` accepts are then fetched in
+    # full and parsed. (The `AccountInfo` passed to `predicate` holds only the slice as its `data`.)
+    @staticmethod
+    def stream_all_matching(
+        context: Context,
+        group: Group,
+        data_slice: DataSliceOpts,
+        predicate: typing.Callable[[AccountInfo], bool],
+        worker_count: int = 0,
+    ) -> typing.Iterator["Account"]:
+        account_infos = AccountInfo.load_by_program_prefiltered(
+            context,
+            context.entropy_program_address,
+            data_slice,
+            predicate,
+            memcmp_opts=Account.__group_filters(group),
+            data_size=layouts.MANGO_ACCOUNT.sizeof(),
+        )
+        yield from Account.__parse_all(context, group, account_infos, worker_count)
 
     @staticmethod
     def load_all_for_owner(
         context: Context, owner: PublicKey, group: Group
     ) -> typing.Sequence["Account"]:
-        # entropy_group is just after the METADATA, which is the first entry.
-        group_offset = layouts.METADATA.sizeof()
         # owner is just after entropy_group in the layout, and it's a PublicKey which is 32 bytes.
-        owner_offset = group_offset + 32
+        owner_offset = layouts.METADATA.sizeof() + 32
         filters = [
-            MemcmpOpts(offset=group_offset, bytes=encode_key(group.address)),
+            *Account.__group_filters(group),
             MemcmpOpts(offset=owner_offset, bytes=encode_key(owner)),
         ]
 
-        account_infos = AccountInfo.load_by_program(
+        account_infos = AccountInfo.load_by_program_streaming(
             context,
             context.entropy_program_address,
             memcmp_opts=filters,
             data_size=layouts.MANGO_ACCOUNT.sizeof(),
         )
-        cache: Cache = group.fetch_cache(context)
-        accounts: typing.List[Account] = []
-        for account_info in account_infos:
-            account = Account.parse(account_info, group, cache)
-            accounts += [account]
-        return accounts
+        return list(Account.__parse_all(context, group, account_infos))
 
     @staticmethod
     def load_all_for_delegate(
         context: Context, delegate: PublicKey, group: Group
     ) -> typing.Sequence["Account"]:
-        # entropy_group is just after the METADATA, which is the first entry.
-        group_offset = layouts.METADATA.sizeof()
         # delegate is a PublicKey which is 32 bytes that ends 5 bytes before the end of the layout
         delegate_offset = layouts.MANGO_ACCOUNT.sizeof() - 37
         filters = [
-            MemcmpOpts(offset=group_offset, bytes=encode_key(group.address)),
+            *Account.__group_filters(group),
             MemcmpOpts(offset=delegate_offset, bytes=encode_key(delegate)),
         ]
 
-        account_infos = AccountInfo.load_by_program(
+        account_infos = AccountInfo.load_by_program_streaming(
             context,
             context.entropy_program_address,
             memcmp_opts=filters,
             data_size=layouts.MANGO_ACCOUNT.sizeof(),
         )
+        return list(Account.__parse_all(context, group, account_infos))
+
+    @staticmethod
+    def __group_filters(group: Group) -> typing.List[MemcmpOpts]:
+        # entropy_group is just after the METADATA, which is the first entry.
+        group_offset = layouts.METADATA.sizeof()
+        return [MemcmpOpts(offset=group_offset, bytes=encode_key(group.address))]
+
+    @staticmethod
+    def __parse_all(
+        context: Context,
+        group: Group,
+        account_infos: typing.Iterable[AccountInfo],
+        worker_count: int = 0,
+    ) -> typing.Iterator["Account"]:
         cache: Cache = group.fetch_cache(context)
-        accounts: typing.List[Account] = []
-        for account_info in account_infos:
-            account = Account.parse(account_info, group, cache)
-            accounts += [account]
-        return accounts
+        yield from AccountParser(group, cache).parse_all(account_infos, worker_count)
 
     @staticmethod
     def load_for_owner_by_address(
@@ -1449,6 +1329,263 @@ class Account(AddressableAccount):
         return f"{self}"
 
 
+# # 🥭 AccountParser class
+#
+# An `AccountParser` turns `AccountInfo`s into `Account`s for a single `Group` and `Cache`.
+#
+# Everything an account takes from the group - slot instruments and token banks, root bank cache
+# indices, perp lot size converters, the quote and liquidity incentive tokens - is the same for every
+# account in that group, so it's looked up once here and shared by all the accounts parsed.
+#
+# `parse_all()` streams `Account`s out as they're parsed, either in this process or, for big
+# `getProgramAccounts` results, spread over a pool of `worker_count` processes. Accounts always come
+# out in the same order as the `AccountInfo`s went in.
+#
+class AccountParser:
+    # How many `AccountInfo`s are sent to a worker process at a time.
+    WORKER_CHUNK_SIZE: int = 64
+
+    # How many chunks per worker process can be waiting to be parsed or yielded at a time.
+    WORKER_CHUNKS_IN_FLIGHT: int = 2
+
+    def __init__(self, group: Group, cache: Cache) -> None:
+        self.group: Group = group
+        self.cache: Cache = cache
+        self.mngo_token: Token = group.liquidity_incentive_token
+        self.quote_token_bank: TokenBank = group.shared_quote
+        self.quote_token: Token = group.shared_quote_token
+        self.slots_by_index: typing.Sequence[
+            typing.Optional[GroupSlot]
+        ] = group.slots_by_index
+        self.root_bank_caches_by_index: typing.Sequence[
+            typing.Optional[RootBankCache]
+        ] = [
+            slot.base_token_bank.root_bank_cache_from_cache(cache, index)
+            if slot is not None and slot.base_token_bank is not None
+            else None
+            for index, slot in enumerate(self.slots_by_index)
+        ]
+        self.quote_root_bank_cache: typing.Optional[
+            RootBankCache
+        ] = self.quote_token_bank.root_bank_cache_from_cache(cache, layouts.QUOTE_INDEX)
+
+    def parse(self, account_info: AccountInfo) -> Account:
+        data = account_info.data
+        if len(data) != layouts.MANGO_ACCOUNT.sizeof():
+            raise Exception(
+                f"Account data length ({len(data)}) does not match expected size ({layouts.MANGO_ACCOUNT.sizeof()})"
+            )
+
+        layout = layouts.MANGO_ACCOUNT.parse(data)
+        return self.from_layout(layout, account_info, Version.V3)
+
+    def parse_all(
+        self, account_infos: typing.Iterable[AccountInfo], worker_count: int = 0
+    ) -> typing.Iterator[Account]:
+        if worker_count <= 0:
+            for account_info in account_infos:
+                yield self.parse(account_info)
+            return
+
+        # Only a few chunks per worker are submitted at a time, and the next chunk is only read from
+        # `account_infos` once the oldest has been yielded, so a slow consumer doesn't have every
+        # `AccountInfo` read and parsed in memory waiting for it.
+        in_flight_limit = worker_count * AccountParser.WORKER_CHUNKS_IN_FLIGHT
+        account_info_iterator = iter(account_infos)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=_start_account_parser_worker,
+            initargs=(self.group, self.cache),
+        ) as executor:
+            in_flight: typing.Deque[
+                concurrent.futures.Future[typing.Sequence[Account]]
+            ] = collections.deque()
+            while True:
+                while len(in_flight) < in_flight_limit:
+                    chunk = list(
+                        itertools.islice(
+                            account_info_iterator, AccountParser.WORKER_CHUNK_SIZE
+                        )
+                    )
+                    if len(chunk) == 0:
+                        break
+                    in_flight.append(
+                        executor.submit(_parse_chunk_in_account_parser_worker, chunk)
+                    )
+
+                if len(in_flight) == 0:
+                    return
+
+                yield from in_flight.popleft().result()
+
+    def from_layout(
+        self, layout: typing.Any, account_info: AccountInfo, version: Version
+    ) -> Account:
+        meta_data = Metadata.from_layout(layout.meta_data)
+        owner: PublicKey = layout.owner
+        info: str = layout.info
+        in_margin_basket: typing.Sequence[bool] = list(
+            [bool(in_basket) for in_basket in layout.in_margin_basket]
+        )
+        active_in_basket: typing.List[bool] = []
+        slots: typing.List[AccountSlot] = []
+        placed_orders_all_markets: typing.List[typing.List[PlacedOrder]] = [
+            [] for _ in range(len(self.group.slot_indices) - 1)
+        ]
+        for index, order_market in enumerate(layout.order_market):
+            if order_market != 0xFF:
+                side = Side.from_value(layout.order_side[index])
+                id = layout.order_ids[index]
+                client_id = layout.client_order_ids[index]
+                placed_order = PlacedOrder(id, client_id, side)
+                placed_orders_all_markets[int(order_market)] += [placed_order]
+
+        quote_token_bank: TokenBank = self.quote_token_bank
+        quote_token: Token = self.quote_token
+
+        for index, group_slot in enumerate(self.slots_by_index):
+            if group_slot is not None:
+                instrument = group_slot.base_instrument
+                token_bank = group_slot.base_token_bank
+                raw_deposit: Decimal = Decimal(0)
+                intrinsic_deposit: Decimal = Decimal(0)
+                raw_borrow: Decimal = Decimal(0)
+                intrinsic_borrow: Decimal = Decimal(0)
+                if token_bank is not None:
+                    raw_deposit = layout.deposits[index]
+                    root_bank_cache: typing.Optional[
+                        RootBankCache
+                    ] = self.root_bank_caches_by_index[index]
+                    if root_bank_cache is None:
+                        raise Exception(
+                            f"No root bank cache found for token {token_bank} at index {index}"
+                        )
+                    intrinsic_deposit = root_bank_cache.deposit_index * raw_deposit
+                    raw_borrow = layout.borrows[index]
+                    intrinsic_borrow = root_bank_cache.borrow_index * raw_borrow
+
+                deposit = InstrumentValue(
+                    instrument, instrument.shift_to_decimals(intrinsic_deposit)
+                )
+                borrow = InstrumentValue(
+                    instrument, instrument.shift_to_decimals(intrinsic_borrow)
+                )
+
+                perp_open_orders = PerpOpenOrders(placed_orders_all_markets[index])
+
+                perp_account = PerpAccount.from_layout(
+                    layout.perp_accounts[index],
+                    instrument,
+                    quote_token,
+                    perp_open_orders,
+                    group_slot.perp_lot_size_converter,
+                    self.mngo_token,
+                )
+                spot_open_orders = layout.spot_open_orders[index]
+                account_slot: AccountSlot = AccountSlot(
+                    index,
+                    instrument,
+                    token_bank,
+                    quote_token_bank,
+                    raw_deposit,
+                    deposit,
+                    raw_borrow,
+                    borrow,
+                    spot_open_orders,
+                    perp_account,
+                )
+
+                slots += [account_slot]
+                active_in_basket += [True]
+            else:
+                active_in_basket += [False]
+
+        quote_index: int = len(layout.deposits) - 1
+        raw_quote_deposit: Decimal = layout.deposits[quote_index]
+        quote_root_bank_cache: typing.Optional[
+            RootBankCache
+        ] = self.quote_root_bank_cache
+        if quote_root_bank_cache is None:
+            raise Exception(
+                f"No root bank cache found for quote token {quote_token_bank} at index {quote_index}"
+            )
+        intrinsic_quote_deposit = (
+            quote_root_bank_cache.deposit_index * raw_quote_deposit
+        )
+        quote_deposit = InstrumentValue(
+            quote_token, quote_token.shift_to_decimals(intrinsic_quote_deposit)
+        )
+        raw_quote_borrow: Decimal = layout.borrows[quote_index]
+        intrinsic_quote_borrow = quote_root_bank_cache.borrow_index * raw_quote_borrow
+        quote_borrow = InstrumentValue(
+            quote_token, quote_token.shift_to_decimals(intrinsic_quote_borrow)
+        )
+        quote: AccountSlot = AccountSlot(
+            len(layout.deposits) - 1,
+            quote_token_bank.token,
+            quote_token_bank,
+            quote_token_bank,
+            raw_quote_deposit,
+            quote_deposit,
+            raw_quote_borrow,
+            quote_borrow,
+            None,
+            None,
+        )
+
+        msrm_amount: Decimal = layout.msrm_amount
+        being_liquidated: bool = bool(layout.being_liquidated)
+        is_bankrupt: bool = bool(layout.is_bankrupt)
+        advanced_orders: PublicKey = layout.advanced_orders
+        not_upgradable: bool = bool(layout.not_upgradable)
+        delegate: PublicKey = layout.delegate
+
+        return Account(
+            account_info,
+            version,
+            meta_data,
+            self.group.name,
+            self.group.address,
+            owner,
+            info,
+            quote,
+            in_margin_basket,
+            active_in_basket,
+            slots,
+            msrm_amount,
+            being_liquidated,
+            is_bankrupt,
+            advanced_orders,
+            not_upgradable,
+            delegate,
+        )
+
+    def __str__(self) -> str:
+        return f"« AccountParser for group '{self.group.name}' [{self.group.address}] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# Each `AccountParser` worker process builds its own parser once, when it starts, rather than having
+# the `Group` and `Cache` pickled and sent along with every `AccountInfo`.
+_worker_account_parser: typing.Optional[AccountParser] = None
+
+
+def _start_account_parser_worker(group: Group, cache: Cache) -> None:
+    global _worker_account_parser
+    _worker_account_parser = AccountParser(group, cache)
+
+
+def _parse_chunk_in_account_parser_worker(
+    account_infos: typing.Sequence[AccountInfo],
+) -> typing.Sequence[Account]:
+    if _worker_account_parser is None:
+        raise Exception("AccountParser worker process has not been started.")
+    parser: AccountParser = _worker_account_parser
+    return [parser.parse(account_info) for account_info in account_infos]
+
+
 @dataclass
 class Valuation:
     account: Account
@@ -0,0 +1,229 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+import collections
+import concurrent.futures
+import logging
+import threading
+import time
+import typing
+
+from dataclasses import dataclass
+
+
+# A fetcher takes a list of addresses and returns the slot the data came from, and one account
+# value (or None, for a missing account) per address, in the same order.
+AccountFetcher = typing.Callable[
+    [typing.Sequence[str]], typing.Tuple[int, typing.Sequence[typing.Any]]
+]
+
+
+@dataclass
+class _CachedAccount:
+    value: typing.Any
+    slot: int
+    fetched_at: float
+
+
+# # 🥭 AccountCache class
+#
+# An `AccountCache` sits in front of the `BetterClient`'s `get_account_info()` and
+# `get_multiple_accounts()` calls. It does two things:
+# * If several threads ask for the same account at the same time, only one request for it is sent
+#   to the RPC node and all the threads share its result.
+# * Account data is kept for up to `ttl` seconds (and at most `maximum_size` accounts, evicting the
+#   least recently used) and served from memory if it's asked for again in that time.
+#
+# Cached data is never served if it comes from a slot older than `latest_slot()`, which is usually
+# the `latest_slot` of the client's `SlotHolder`. When a `CheckingSlotHolder` is told to require data
+# from a fresh slot (for instance after one of our transactions is processed) every older cached
+# entry is ignored and refetched.
+#
+class AccountCache:
+    def __init__(
+        self, ttl: float, maximum_size: int, latest_slot: typing.Callable[[], int]
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        self.ttl: float = ttl
+        self.maximum_size: int = maximum_size
+        self.latest_slot: typing.Callable[[], int] = latest_slot
+        self.hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+        self.__entries: typing.OrderedDict[
+            typing.Tuple[str, str], _CachedAccount
+        ] = collections.OrderedDict()
+        self.__in_flight: typing.Dict[
+            typing.Tuple[str, str],
+            concurrent.futures.Future[typing.Tuple[int, typing.Any]],
+        ] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self.__entries)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    # `variant` distinguishes requests for the same address that return different data, such as
+    # requests with a different commitment, encoding or data slice.
+    def load(
+        self,
+        variant: str,
+        addresses: typing.Sequence[str],
+        fetch: AccountFetcher,
+    ) -> typing.Tuple[int, typing.Sequence[typing.Any]]:
+        values: typing.List[typing.Any] = [None] * len(addresses)
+        slots: typing.List[int] = [0] * len(addresses)
+        to_fetch: typing.List[int] = []
+        owned: typing.Dict[
+            typing.Tuple[str, str],
+            concurrent.futures.Future[typing.Tuple[int, typing.Any]],
+        ] = {}
+        duplicates: typing.List[
+            typing.Tuple[int, concurrent.futures.Future[typing.Tuple[int, typing.Any]]]
+        ] = []
+        joined: typing.List[
+            typing.Tuple[int, concurrent.futures.Future[typing.Tuple[int, typing.Any]]]
+        ] = []
+
+        with self.__lock:
+            latest_slot: int = self.latest_slot()
+            now: float = time.monotonic()
+            for index, address in enumerate(addresses):
+                key = (variant, address)
+                entry = self.__entries.get(key)
+                if (
+                    entry is not None
+                    and (now - entry.fetched_at) <= self.ttl
+                    and entry.slot >= latest_slot
+                ):
+                    self.__entries.move_to_end(key)
+                    self.hits += 1
+                    values[index] = entry.value
+                    slots[index] = entry.slot
+                elif key in owned:
+                    # Same address twice in one request - only fetch it once.
+                    duplicates += [(index, owned[key])]
+                elif key in self.__in_flight:
+                    self.coalesced += 1
+                    joined += [(index, self.__in_flight[key])]
+                else:
+                    self.misses += 1
+                    future: concurrent.futures.Future[
+                        typing.Tuple[int, typing.Any]
+                    ] = concurrent.futures.Future()
+                    self.__in_flight[key] = future
+                    owned[key] = future
+                    to_fetch += [index]
+
+        if len(to_fetch) > 0:
+            # Every future this call owns must be resolved or failed, whatever happens, or any thread
+            # that joined it would wait forever.
+            failure: BaseException = Exception(
+                f"Fetch of {len(to_fetch)} '{variant}' accounts did not complete."
+            )
+            try:
+                slot = self.__fetch_and_store(
+                    variant, addresses, to_fetch, fetch, values, slots
+                )
+                for index in to_fetch:
+                    owned[(variant, addresses[index])].set_result((slot, values[index]))
+            except BaseException as exception:
+                failure = exception
+                raise
+            finally:
+                with self.__lock:
+                    for key, owned_future in owned.items():
+                        if self.__in_flight.get(key) is owned_future:
+                            del self.__in_flight[key]
+                for owned_future in owned.values():
+                    if not owned_future.done():
+                        owned_future.set_exception(failure)
+
+        for index, in_flight in [*duplicates, *joined]:
+            slots[index], values[index] = in_flight.result()
+
+        # A fetch that was already in flight may have been sent before `latest_slot` moved on, so
+        # anything it returned from an older slot is fetched again.
+        stale: typing.List[int] = [
+            index for index, _ in joined if slots[index] < latest_slot
+        ]
+        if len(stale) > 0:
+            with self.__lock:
+                self.misses += len(stale)
+            self.__fetch_and_store(variant, addresses, stale, fetch, values, slots)
+
+        return min(slots, default=0), values
+
+    # Fetches the `addresses` at `indices`, puts the results into `values` and `slots` at the same
+    # indices, and caches them. Returns the slot the data came from.
+    def __fetch_and_store(
+        self,
+        variant: str,
+        addresses: typing.Sequence[str],
+        indices: typing.Sequence[int],
+        fetch: AccountFetcher,
+        values: typing.List[typing.Any],
+        slots: typing.List[int],
+    ) -> int:
+        slot, fetched = fetch([addresses[index] for index in indices])
+        if len(fetched) != len(indices):
+            raise Exception(
+                f"Fetching {len(indices)} '{variant}' accounts returned {len(fetched)} values."
+            )
+
+        fetched_at: float = time.monotonic()
+        with self.__lock:
+            for index, value in zip(indices, fetched):
+                key = (variant, addresses[index])
+                entry = self.__entries.get(key)
+                if entry is None or entry.slot <= slot:
+                    self.__entries[key] = _CachedAccount(value, slot, fetched_at)
+                    self.__entries.move_to_end(key)
+                values[index] = value
+                slots[index] = slot
+            while len(self.__entries) > self.maximum_size:
+                self.__entries.popitem(last=False)
+
+        return slot
+
+    def __str__(self) -> str:
+        return f"« AccountCache [{self.size} of {self.maximum_size} accounts, TTL {self.ttl} seconds] hits: {self.hits}, misses: {self.misses}, coalesced: {self.coalesced} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 NullAccountCache class
+#
+# A `NullAccountCache` doesn't cache or coalesce anything - it just passes every request through.
+#
+class NullAccountCache(AccountCache):
+    def __init__(self) -> None:
+        super().__init__(0, 0, lambda: 0)
+
+    def load(
+        self,
+        variant: str,
+        addresses: typing.Sequence[str],
+        fetch: AccountFetcher,
+    ) -> typing.Tuple[int, typing.Sequence[typing.Any]]:
+        return fetch(addresses)
+
+    def __str__(self) -> str:
+        return "« NullAccountCache »"
@@ -14,9 +14,10 @@
 #   [Email](mailto:hello@blockworks.foundation)
 
 
+import asyncio
+import concurrent.futures
 import json
 import logging
-import time
 import typing
 
 from decimal import Decimal
@@ -99,35 +100,71 @@ class AccountInfo:
             data: bytes = decode_binary(accountinfo_data["data"])
             return AccountInfo(address, executable, lamports, owner, rent_epoch, data)
 
+    # This is a tricky one to get right.
+    # Some errors this can generate:
+    #  413 Client Error: Payload Too Large for url
+    #  Error response from server: 'Too many inputs provided; max 100', code: -32602
+    #
+    # Addresses are split into chunks of `gma_chunk_size`, and up to `gma_concurrency` chunks are
+    # requested at the same time. Every call waits on the `Context`'s shared rate limiter first, so
+    # running concurrently doesn't mean running faster than the RPC node allows. Results are always
+    # returned in the same order as the addresses.
     @staticmethod
     def load_multiple(
         context: Context, addresses: typing.Sequence[PublicKey]
     ) -> typing.Sequence["AccountInfo"]:
-        # This is a tricky one to get right.
-        # Some errors this can generate:
-        #  413 Client Error: Payload Too Large for url
-        #  Error response from server: 'Too many inputs provided; max 100', code: -32602
         chunk_size: int = int(context.gma_chunk_size)
-        sleep_between_calls: float = float(context.gma_chunk_pause)
-        multiple: typing.List[AccountInfo] = []
         chunks: typing.Sequence[
             typing.Sequence[PublicKey]
         ] = AccountInfo._split_list_into_chunks(addresses, chunk_size)
-        for counter, chunk in enumerate(chunks):
+
+        def __load_chunk(
+            chunk: typing.Sequence[PublicKey],
+        ) -> typing.Sequence[typing.Dict[str, typing.Any]]:
+            context.gma_rate_limiter.wait()
             result: typing.Sequence[
                 typing.Dict[str, typing.Any]
             ] = context.client.get_multiple_accounts([*chunk])
-            response_value_list = zip(result, chunk)
-            for index, pair in enumerate(response_value_list):
-                if pair[0] is None:
-                    raise Exception(
-                        f"Failed to fetch account {chunk[index]} at index {index}"
-                    )
-                multiple += [AccountInfo._from_response_values(pair[0], pair[1])]
-            if (sleep_between_calls > 0.0) and (counter < (len(chunks) - 1)):
-                time.sleep(sleep_between_calls)
+            return result
 
-        return multiple
+        results: typing.Sequence[typing.Sequence[typing.Dict[str, typing.Any]]]
+        workers: int = min(context.gma_concurrency, len(chunks))
+        if workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(__load_chunk, chunks))
+        else:
+            results = [__load_chunk(chunk) for chunk in chunks]
+
+        return AccountInfo._from_chunked_responses(results, chunks)
+
+    # The asyncio version of `load_multiple()`, with the same chunking, concurrency and rate limits.
+    @staticmethod
+    async def load_multiple_async(
+        context: Context, addresses: typing.Sequence[PublicKey]
+    ) -> typing.Sequence["AccountInfo"]:
+        chunk_size: int = int(context.gma_chunk_size)
+        chunks: typing.Sequence[
+            typing.Sequence[PublicKey]
+        ] = AccountInfo._split_list_into_chunks(addresses, chunk_size)
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(
+            max(context.gma_concurrency, 1)
+        )
+
+        async def __load_chunk(
+            chunk: typing.Sequence[PublicKey],
+        ) -> typing.Sequence[typing.Dict[str, typing.Any]]:
+            async with semaphore:
+                await context.gma_rate_limiter.wait_async()
+                result: typing.Sequence[
+                    typing.Dict[str, typing.Any]
+                ] = await context.async_client.get_multiple_accounts([*chunk])
+                return result
+
+        results: typing.Sequence[
+            typing.Sequence[typing.Dict[str, typing.Any]]
+        ] = await asyncio.gather(*[__load_chunk(chunk) for chunk in chunks])
+
+        return AccountInfo._from_chunked_responses(results, chunks)
 
     @staticmethod
     def load_by_program(
@@ -150,6 +187,54 @@ class AccountInfo:
 
         return list(all_account_infos)
 
+    # Like `load_by_program()`, but each `AccountInfo` is yielded as soon as it has been read from
+    # the response, instead of holding the whole (possibly huge) response in memory and returning
+    # everything at the end.
+    @staticmethod
+    def load_by_program_streaming(
+        context: Context,
+        pubkey: typing.Union[str, PublicKey],
+        data_slice: typing.Optional[DataSliceOpts] = None,
+        data_size: typing.Optional[int] = None,
+        memcmp_opts: typing.Optional[typing.List[MemcmpOpts]] = None,
+    ) -> typing.Iterator["AccountInfo"]:
+        for result in context.client.get_program_accounts_streaming(
+            pubkey, data_slice=data_slice, data_size=data_size, memcmp_opts=memcmp_opts
+        ):
+            yield AccountInfo._from_response_values(
+                result["account"], PublicKey(result["pubkey"])
+            )
+
+    # A two-phase program account scan. First only the `data_slice` of each account is fetched, and
+    # `predicate` is called with each of those partial `AccountInfo`s (whose `data` is just the
+    # slice). The full data of only the accounts that pass is then fetched with
+    # `getMultipleAccounts`, in batches, while the first phase is still streaming in.
+    #
+    # This is worthwhile when the fields needed to pick accounts are a small part of them, and
+    # `memcmp` filters on the server can't do the picking.
+    @staticmethod
+    def load_by_program_prefiltered(
+        context: Context,
+        pubkey: typing.Union[str, PublicKey],
+        data_slice: DataSliceOpts,
+        predicate: typing.Callable[["AccountInfo"], bool],
+        data_size: typing.Optional[int] = None,
+        memcmp_opts: typing.Optional[typing.List[MemcmpOpts]] = None,
+    ) -> typing.Iterator["AccountInfo"]:
+        batch_size: int = int(context.gma_chunk_size) * max(context.gma_concurrency, 1)
+        matching: typing.List[PublicKey] = []
+        for partial in AccountInfo.load_by_program_streaming(
+            context, pubkey, data_slice, data_size, memcmp_opts
+        ):
+            if predicate(partial):
+                matching += [partial.address]
+                if len(matching) >= batch_size:
+                    yield from AccountInfo.load_multiple(context, matching)
+                    matching = []
+
+        if len(matching) > 0:
+            yield from AccountInfo.load_multiple(context, matching)
+
     @staticmethod
     def _from_response_values(
         response_values: typing.Dict[str, typing.Any], address: PublicKey
@@ -161,6 +246,22 @@ class AccountInfo:
         data = decode_binary(response_values["data"])
         return AccountInfo(address, executable, lamports, owner, rent_epoch, data)
 
+    @staticmethod
+    def _from_chunked_responses(
+        results: typing.Sequence[typing.Sequence[typing.Dict[str, typing.Any]]],
+        chunks: typing.Sequence[typing.Sequence[PublicKey]],
+    ) -> typing.Sequence["AccountInfo"]:
+        multiple: typing.List[AccountInfo] = []
+        for result, chunk in zip(results, chunks):
+            for index, pair in enumerate(zip(result, chunk)):
+                if pair[0] is None:
+                    raise Exception(
+                        f"Failed to fetch account {chunk[index]} at index {index}"
+                    )
+                multiple += [AccountInfo._from_response_values(pair[0], pair[1])]
+
+        return multiple
+
     @staticmethod
     def from_response(response: RPCResponse, address: PublicKey) -> "AccountInfo":
         return AccountInfo._from_response_values(response["result"]["value"], address)
@@ -0,0 +1,555 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+import asyncio
+import httpx
+import logging
+import threading
+import time
+import typing
+
+from solana.blockhash import Blockhash
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from solana.rpc.providers.async_base import AsyncBaseProvider
+from solana.rpc.types import DataSliceOpts, RPCMethod, RPCResponse, TxOpts
+from solana.transaction import Transaction
+
+from .client import (
+    _STUB_TRANSACTION_SIGNATURE,
+    BetterClient,
+    BlockhashNotFoundException,
+    CompoundException,
+    CompoundRPCCaller,
+    FailedToFetchBlockhashException,
+    NodeIsBehindException,
+    RateLimitException,
+    RPCCaller,
+    StaleSlotException,
+    TransactionAlreadyProcessedException,
+    UnspecifiedCommitment,
+    UnspecifiedEncoding,
+)
+
+
+TResult = typing.TypeVar("TResult")
+
+
+# # 🥭 AsyncRPCCaller class
+#
+# An `AsyncRPCCaller` is the asyncio counterpart to an `RPCCaller`. It shares its `RPCCaller`'s
+# configuration, slot holder and response handling, so it raises exactly the same exceptions for
+# exactly the same responses, but it sends requests using a non-blocking `httpx.AsyncClient`.
+#
+# `httpx` connections are bound to the event loop they were opened on, so a fresh connection pool
+# is created whenever the `AsyncRPCCaller` is used from a different event loop, and the old pool is
+# closed if its loop is still running. Synchronous callers should use `AsyncBetterClient.run()`
+# rather than `asyncio.run()` so every call shares one long-lived loop and one connection pool.
+#
+class AsyncRPCCaller(AsyncBaseProvider):
+    def __init__(self, rpc_caller: RPCCaller) -> None:
+        self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        self.rpc_caller: RPCCaller = rpc_caller
+        self.__session: typing.Optional[httpx.AsyncClient] = None
+        self.__session_loop: typing.Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def name(self) -> str:
+        return self.rpc_caller.name
+
+    @property
+    def cluster_rpc_url(self) -> str:
+        return self.rpc_caller.cluster_rpc_url
+
+    def __current_session(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self.__session is None or self.__session_loop is not loop:
+            self.__close_session_on_other_loop()
+            timeout: typing.Optional[float] = (
+                self.rpc_caller.http_request_timeout
+                if self.rpc_caller.http_request_timeout >= 0
+                else None
+            )
+            keepalive_expiry: typing.Optional[float] = (
+                self.rpc_caller.http_idle_timeout
+                if self.rpc_caller.http_idle_timeout >= 0
+                else None
+            )
+            self.__session = httpx.AsyncClient(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.rpc_caller.http_pool_size,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
+            self.__session_loop = loop
+        return self.__session
+
+    # A session's connections can only be closed on the loop that opened them. If that loop has
+    # already finished there's nothing left to close them with, so they are just dropped.
+    def __close_session_on_other_loop(self) -> None:
+        session, session_loop = self.__session, self.__session_loop
+        self.__session = None
+        self.__session_loop = None
+        if session is None or session_loop is None:
+            return
+        if session_loop.is_running() and not session_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.aclose(), session_loop)
+        else:
+            self._logger.debug(
+                f"Dropping HTTP session for {self.name} - its event loop has finished."
+            )
+
+    async def is_connected(self) -> bool:
+        try:
+            response = await self.__current_session().get(self.rpc_caller.health_uri)
+            response.raise_for_status()
+        except (IOError, httpx.HTTPError) as err:
+            self._logger.error(f"Health check failed with error: {err}")
+            return False
+
+        return response.status_code == httpx.codes.OK
+
+    async def close(self) -> None:
+        if (
+            self.__session is not None
+            and self.__session_loop is asyncio.get_running_loop()
+        ):
+            await self.__session.aclose()
+        self.__session = None
+        self.__session_loop = None
+
+    async def make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
+        # No pauses specified means this funcitonality is turned off.
+        stale_data_pauses_before_retry = self.rpc_caller.stale_data_pauses_before_retry
+        if len(stale_data_pauses_before_retry) == 0:
+            return await self.__make_request(method, *params)
+
+        at_least_one_submission: bool = False
+        last_stale_slot_exception: StaleSlotException
+        for pause in [*stale_data_pauses_before_retry, 0]:
+            try:
+                return await self.__make_request(method, *params)
+            except TransactionAlreadyProcessedException as transaction_already_processed_exception:
+                if not at_least_one_submission:
+                    raise transaction_already_processed_exception
+
+                # See `RPCCaller.make_request()` for why this is returned.
+                return {
+                    "jsonrpc": "2.0",
+                    "id": 0,
+                    "result": _STUB_TRANSACTION_SIGNATURE,
+                }
+            except StaleSlotException as exception:
+                last_stale_slot_exception = exception
+                self._logger.debug(
+                    f"Will retry after pause of {pause} seconds after getting stale slot: {exception}"
+                )
+                await asyncio.sleep(pause)
+            at_least_one_submission = True
+
+        # They've all failed.
+        raise last_stale_slot_exception
+
+    async def __make_request(
+        self, method: RPCMethod, *params: typing.Any
+    ) -> RPCResponse:
+        request_kwargs = self.rpc_caller._before_request(
+            method=method, params=params, is_async=True
+        )
+        started_at: float = time.monotonic()
+        try:
+            raw_response = await self.__current_session().post(**request_kwargs)
+
+            self.rpc_caller._raise_if_rate_limited(method, raw_response.status_code)
+
+            # Not a rate-limit problem, but maybe there was some other error?
+            raw_response.raise_for_status()
+
+            response = self.rpc_caller._process_response_text(
+                method, params, raw_response.text
+            )
+        except (
+            httpx.HTTPStatusError,
+            httpx.TransportError,
+            RateLimitException,
+            NodeIsBehindException,
+            StaleSlotException,
+        ):
+            self.rpc_caller.provider_statistics.record_error()
+            raise
+
+        self.rpc_caller.provider_statistics.record_success(
+            time.monotonic() - started_at,
+            self.rpc_caller._slot_from_response(method, response),
+        )
+        return response
+
+    def __str__(self) -> str:
+        return f"« AsyncRPCCaller [{self.cluster_rpc_url}] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 AsyncCompoundRPCCaller class
+#
+# An `AsyncCompoundRPCCaller` is the asyncio counterpart to a `CompoundRPCCaller`. It doesn't keep
+# its own list of providers - it uses the provider ordering of the `CompoundRPCCaller` it wraps, and
+# a successful fallback rebases that shared ordering. That way synchronous and asynchronous calls
+# always agree on which provider is currently the head.
+#
+class AsyncCompoundRPCCaller(AsyncBaseProvider):
+    def __init__(self, rpc_caller: CompoundRPCCaller) -> None:
+        self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        self.rpc_caller: CompoundRPCCaller = rpc_caller
+        self.name: str = rpc_caller.name
+        self.__async_callers: typing.Dict[int, AsyncRPCCaller] = {
+            id(provider): AsyncRPCCaller(provider)
+            for provider in rpc_caller.all_providers
+        }
+
+    @property
+    def current(self) -> AsyncRPCCaller:
+        return self.__async_callers[id(self.rpc_caller.current)]
+
+    @property
+    def all_providers(self) -> typing.Sequence[AsyncRPCCaller]:
+        return [
+            self.__async_callers[id(provider)]
+            for provider in self.rpc_caller.all_providers
+        ]
+
+    def shift_to_next_provider(self) -> None:
+        self.rpc_caller.shift_to_next_provider()
+
+    async def make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
+        self.rpc_caller.rank_if_due()
+        if self.rpc_caller.should_hedge(method):
+            return await self.__make_hedged_request(method, *params)
+
+        all_exceptions: typing.List[Exception] = []
+        for provider in self.all_providers:
+            try:
+                started_at: float = time.monotonic()
+                result = await provider.make_request(method, *params)
+                self.rpc_caller.record_read_latency(
+                    method, time.monotonic() - started_at
+                )
+                self.rpc_caller.rebase_on_provider(provider.rpc_caller)
+                return result
+            except (
+                httpx.HTTPStatusError,
+                httpx.TransportError,
+                RateLimitException,
+                NodeIsBehindException,
+                StaleSlotException,
+                FailedToFetchBlockhashException,
+            ) as exception:
+                all_exceptions += [exception]
+                self._logger.info(
+                    f"Moving to next provider - {provider} gave {exception}"
+                )
+
+        if len(all_exceptions) == 1:
+            raise all_exceptions[0]
+
+        raise CompoundException(self.name, all_exceptions)
+
+    async def __make_hedged_request(
+        self, method: RPCMethod, *params: typing.Any
+    ) -> RPCResponse:
+        providers: typing.Sequence[AsyncRPCCaller] = self.all_providers
+        started_at: float = time.monotonic()
+        in_flight: typing.Dict[asyncio.Task[RPCResponse], AsyncRPCCaller] = {}
+        all_exceptions: typing.List[Exception] = []
+        next_provider_index: int = 0
+
+        def __send_to_next_provider() -> None:
+            nonlocal next_provider_index
+            provider: AsyncRPCCaller = providers[next_provider_index]
+            next_provider_index += 1
+            task = asyncio.create_task(provider.make_request(method, *params))
+            in_flight[task] = provider
+
+        __send_to_next_provider()
+        try:
+            while len(in_flight) > 0:
+                can_hedge: bool = next_provider_index < len(providers)
+                completed, _ = await asyncio.wait(
+                    in_flight,
+                    timeout=self.rpc_caller.hedge_delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if len(completed) == 0:
+                    self.rpc_caller.hedged_requests += 1
+                    self._logger.debug(
+                        f"Hedging {method} - sending to {providers[next_provider_index]} as well"
+                    )
+                    __send_to_next_provider()
+                    continue
+
+                for task in completed:
+                    provider = in_flight.pop(task)
+                    try:
+                        result = task.result()
+                    except (
+                        httpx.HTTPStatusError,
+                        httpx.TransportError,
+                        RateLimitException,
+                        NodeIsBehindException,
+                        StaleSlotException,
+                        FailedToFetchBlockhashException,
+                    ) as exception:
+                        all_exceptions += [exception]
+                        self._logger.info(
+                            f"Moving to next provider - {provider} gave {exception}"
+                        )
+                        if next_provider_index < len(providers):
+                            __send_to_next_provider()
+                        continue
+
+                    self.rpc_caller.record_read_latency(
+                        method, time.monotonic() - started_at
+                    )
+                    self.rpc_caller.rebase_on_provider(provider.rpc_caller)
+                    return result
+        finally:
+            # Unlike threads, slower tasks can be cancelled once we have an answer.
+            for task in in_flight:
+                task.cancel()
+
+        if len(all_exceptions) == 1:
+            raise all_exceptions[0]
+
+        raise CompoundException(self.name, all_exceptions)
+
+    async def is_connected(self) -> bool:
+        # All we need for this to be true is for one of our providers to be connected.
+        for provider in self.all_providers:
+            if await provider.is_connected():
+                return True
+        return False
+
+    async def close(self) -> None:
+        for provider in self.all_providers:
+            await provider.close()
+
+    def __str__(self) -> str:
+        return f"« AsyncCompoundRPCCaller with {len(self.__async_callers)} providers - current head is: {self.current} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 _ProviderAsyncClient class
+#
+# `AsyncClient.__init__()` always creates its own `AsyncHTTPProvider`, with its own `httpx.AsyncClient`
+# session. An `AsyncBetterClient` sends everything through its `AsyncCompoundRPCCaller` instead, so
+# this builds the `AsyncClient` around that provider without creating a session that would never be
+# used or closed.
+#
+class _ProviderAsyncClient(AsyncClient):
+    def __init__(self, provider: AsyncBaseProvider, commitment: Commitment) -> None:
+        super(AsyncClient, self).__init__(commitment, False)
+        self._provider = provider
+
+
+# # 🥭 AsyncBetterClient class
+#
+# An `AsyncBetterClient` provides asyncio versions of the `BetterClient` methods that are on the
+# latency-critical paths - loading accounts and sending transactions - so that independent calls can
+# actually overlap their network round trips instead of running one after another.
+#
+# It takes all its configuration from the `BetterClient` it wraps, and shares that client's providers,
+# slot holder and transaction monitor.
+#
+# It deliberately doesn't use a blockhash cache: callers that send several transactions together
+# should fetch one recent blockhash and pass it to each `send_transaction()` call.
+#
+# Synchronous code can run coroutines using `run()`. That runs them on an event loop owned by the
+# `AsyncBetterClient`, started on its own thread the first time it's needed and kept running until
+# `dispose()`, so the `httpx` connection pools are reused from one call to the next.
+#
+class AsyncBetterClient:
+    def __init__(self, client: BetterClient) -> None:
+        self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        self.client: BetterClient = client
+        self.rpc_caller: AsyncCompoundRPCCaller = AsyncCompoundRPCCaller(
+            client.rpc_caller
+        )
+        self.compatible_client: AsyncClient = _ProviderAsyncClient(
+            self.rpc_caller, client.commitment
+        )
+        self.__loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        self.__loop_thread: typing.Optional[threading.Thread] = None
+        self.__loop_lock: threading.Lock = threading.Lock()
+
+    @property
+    def commitment(self) -> Commitment:
+        return self.client.commitment
+
+    @property
+    def encoding(self) -> str:
+        return self.client.encoding
+
+    async def close(self) -> None:
+        await self.rpc_caller.close()
+
+    def run(
+        self, coroutine: typing.Coroutine[typing.Any, typing.Any, TResult]
+    ) -> TResult:
+        loop = self.__event_loop()
+        try:
+            running_loop: typing.Optional[
+                asyncio.AbstractEventLoop
+            ] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            coroutine.close()
+            raise Exception(
+                "AsyncBetterClient.run() cannot be called from a coroutine running on its own event loop."
+            )
+
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def __event_loop(self) -> asyncio.AbstractEventLoop:
+        with self.__loop_lock:
+            if self.__loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="AsyncBetterClient", daemon=True
+                )
+                thread.start()
+                self.__loop = loop
+                self.__loop_thread = thread
+            return self.__loop
+
+    def dispose(self) -> None:
+        with self.__loop_lock:
+            loop, thread = self.__loop, self.__loop_thread
+            self.__loop = None
+            self.__loop_thread = None
+
+        if loop is None or thread is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self.close(), loop).result()
+        except Exception as exception:
+            self._logger.warning(f"Failed to close HTTP sessions: {exception}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def get_account_info(
+        self,
+        pubkey: typing.Union[PublicKey, str],
+        commitment: Commitment = UnspecifiedCommitment,
+        encoding: str = UnspecifiedEncoding,
+        data_slice: typing.Optional[DataSliceOpts] = None,
+    ) -> typing.Any:
+        resolved_commitment, resolved_encoding = self.__resolve_defaults(
+            commitment, encoding
+        )
+        response = await self.compatible_client.get_account_info(
+            pubkey, resolved_commitment, resolved_encoding, data_slice
+        )
+        return response["result"]
+
+    async def get_multiple_accounts(
+        self,
+        pubkeys: typing.List[typing.Union[PublicKey, str]],
+        commitment: Commitment = UnspecifiedCommitment,
+        encoding: str = UnspecifiedEncoding,
+        data_slice: typing.Optional[DataSliceOpts] = None,
+    ) -> typing.Any:
+        resolved_commitment, resolved_encoding = self.__resolve_defaults(
+            commitment, encoding
+        )
+        response = await self.compatible_client.get_multiple_accounts(
+            pubkeys, resolved_commitment, resolved_encoding, data_slice
+        )
+        return response["result"]["value"]
+
+    async def get_recent_blockhash(
+        self, commitment: Commitment = UnspecifiedCommitment
+    ) -> Blockhash:
+        resolved_commitment, _ = self.__resolve_defaults(commitment)
+        response = await self.compatible_client.get_recent_blockhash(
+            resolved_commitment
+        )
+        return Blockhash(response["result"]["value"]["blockhash"])
+
+    async def send_transaction(
+        self,
+        transaction: Transaction,
+        *signers: Keypair,
+        opts: TxOpts = TxOpts(preflight_commitment=UnspecifiedCommitment),
+        recent_blockhash: typing.Optional[Blockhash] = None,
+    ) -> str:
+        # The same blockhash failover as `BetterClient.send_transaction()` - see the comments there.
+        last_exception: BlockhashNotFoundException
+        for provider in self.rpc_caller.all_providers:
+            try:
+                proper_opts = self.client._resolve_transaction_options(opts)
+                response = await self.compatible_client.send_transaction(
+                    transaction,
+                    *signers,
+                    opts=proper_opts,
+                    recent_blockhash=recent_blockhash,
+                )
+                signature: str = str(response["result"])
+                self._logger.debug(f"Transaction signature: {signature}")
+
+                if signature != _STUB_TRANSACTION_SIGNATURE:
+                    self.client.transaction_monitor.monitor(signature)
+                else:
+                    self._logger.error("Could not get status for stub signature")
+
+                return signature
+            except BlockhashNotFoundException as blockhash_not_found_exception:
+                self._logger.debug(
+                    f"Trying next provider after intercepting blockhash exception on provider {provider}: {blockhash_not_found_exception}"
+                )
+                last_exception = blockhash_not_found_exception
+                transaction.recent_blockhash = None
+                recent_blockhash = None
+                self.rpc_caller.shift_to_next_provider()
+
+        raise last_exception
+
+    def __resolve_defaults(
+        self,
+        commitment: typing.Optional[Commitment],
+        encoding: typing.Optional[str] = None,
+    ) -> typing.Tuple[Commitment, str]:
+        if commitment is None or commitment == UnspecifiedCommitment:
+            commitment = self.commitment
+
+        if encoding is None or encoding == UnspecifiedEncoding:
+            encoding = self.encoding
+
+        return commitment, encoding
+
+    def __str__(self) -> str:
+        return f"« AsyncBetterClient [{self.client.cluster_name}]: {self.client.cluster_rpc_urls} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
@@ -14,9 +14,14 @@
 #   [Email](mailto:hello@blockworks.foundation)
 
 import abc
+import collections
+import concurrent.futures
 import json
 import logging
+import math
 import requests
+import requests.adapters
+import threading
 import time
 import typing
 
@@ -42,15 +47,55 @@ from solana.rpc.types import (
 )
 from solana.transaction import Transaction
 
+from .accountcache import AccountCache, NullAccountCache
 from .constants import SOL_DECIMAL_DIVISOR
 from .datetimes import local_now
 from .instructionreporter import InstructionReporter
 from .logmessages import expand_log_messages
+from .streamingjson import StreamingJsonArrayDecoder
 from .text import indent_collection_as_str
 
 
 _STUB_TRANSACTION_SIGNATURE: str = "stub-for-already-submitted-transaction-signature"
 
+# These are the only RPC methods that may be hedged - sent to more than one provider at once. They
+# don't change any state, so it's safe to send them twice and throw away the slower response.
+# Anything that writes (sendTransaction, requestAirdrop) must never appear here.
+_HEDGEABLE_RPC_METHODS: typing.FrozenSet[str] = frozenset(
+    {
+        "getAccountInfo",
+        "getBalance",
+        "getBlockHeight",
+        "getConfirmedSignaturesForAddress2",
+        "getConfirmedTransaction",
+        "getEpochInfo",
+        "getFeeCalculatorForBlockhash",
+        "getFees",
+        "getMinimumBalanceForRentExemption",
+        "getMultipleAccounts",
+        "getProgramAccounts",
+        "getRecentBlockhash",
+        "getSignatureStatuses",
+        "getSignaturesForAddress",
+        "getSlot",
+        "getTokenAccountBalance",
+        "getTokenAccountsByDelegate",
+        "getTokenAccountsByOwner",
+        "getTokenLargestAccounts",
+        "getTokenSupply",
+        "getTransaction",
+    }
+)
+
+# Provider scores are in (notional) seconds - the median latency, plus a penalty for each error (since
+# an error usually costs a timeout and a retry elsewhere), plus the time it would take to catch up on
+# each slot the provider is lagging by. The head provider is only replaced if another one scores at
+# least 20% better, so two similar providers don't keep swapping places (and throwing away the
+# blockhash cache each time).
+_RANKING_ERROR_PENALTY_SECONDS: float = 1.0
+_RANKING_SECONDS_PER_SLOT_LAG: float = 0.4
+_RANKING_SWITCH_THRESHOLD: float = 0.8
+
 
 # # 🥭 CompoundException class
 #
@@ -432,11 +477,149 @@ class NullTransactionMonitor(TransactionMonitor):
         pass
 
 
+# # 🥭 ConnectionStatistics class
+#
+# A `ConnectionStatistics` object counts how many HTTP connections an `RPCCaller` had to open, and
+# how many requests were sent over an already-open, kept-alive connection.
+#
+@dataclass
+class ConnectionStatistics:
+    opened: int = 0
+    reused: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.opened + self.reused
+
+    def __str__(self) -> str:
+        return f"« ConnectionStatistics opened: {self.opened}, reused: {self.reused} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 ProviderStatistics class
+#
+# A `ProviderStatistics` object keeps a rolling window of how an `RPCCaller` has been performing: how
+# long its recent requests took, how many of them failed, and the most recent slot it reported. The
+# `CompoundRPCCaller` uses these to rank its providers.
+#
+# Only failures that say something about the RPC node itself (HTTP and connection errors, rate limits,
+# stale or lagging data) count as errors. A transaction that fails because of what it does isn't the
+# node's fault.
+#
+# The latencies of the `CompoundRPCCaller`'s probes are kept in a separate window. Every provider
+# is probed with the same cheap request, so those latencies compare like with like. The latencies
+# of all requests don't, because the provider in use handles the heavy requests.
+#
+class ProviderStatistics:
+    def __init__(self, window_size: int = 100) -> None:
+        self.__lock: threading.Lock = threading.Lock()
+        self.__latencies: typing.Deque[float] = collections.deque(maxlen=window_size)
+        self.__outcomes: typing.Deque[bool] = collections.deque(maxlen=window_size)
+        self.__probe_latencies: typing.Deque[float] = collections.deque(
+            maxlen=window_size
+        )
+        self.latest_slot: int = 0
+        self.last_sampled_at: float = 0
+
+    @property
+    def samples(self) -> int:
+        return len(self.__outcomes)
+
+    @property
+    def probe_samples(self) -> int:
+        return len(self.__probe_latencies)
+
+    @property
+    def median_probe_latency(self) -> float:
+        with self.__lock:
+            latencies = sorted(self.__probe_latencies)
+        if len(latencies) == 0:
+            return 0
+        return latencies[max(math.ceil(len(latencies) / 2) - 1, 0)]
+
+    @property
+    def error_rate(self) -> float:
+        with self.__lock:
+            if len(self.__outcomes) == 0:
+                return 0
+            return self.__outcomes.count(False) / len(self.__outcomes)
+
+    @property
+    def median_latency(self) -> float:
+        return self.latency_percentile(50)
+
+    def latency_percentile(self, percentile: float) -> float:
+        with self.__lock:
+            latencies = sorted(self.__latencies)
+        if len(latencies) == 0:
+            return 0
+        index: int = max(math.ceil(len(latencies) * percentile / 100) - 1, 0)
+        return latencies[index]
+
+    def record_success(self, seconds: float, slot: typing.Optional[int]) -> None:
+        with self.__lock:
+            self.__latencies.append(seconds)
+            self.__outcomes.append(True)
+            if slot is not None and slot > self.latest_slot:
+                self.latest_slot = slot
+            self.last_sampled_at = time.monotonic()
+
+    def record_error(self) -> None:
+        with self.__lock:
+            self.__outcomes.append(False)
+            self.last_sampled_at = time.monotonic()
+
+    def record_probe(self, seconds: float) -> None:
+        with self.__lock:
+            self.__probe_latencies.append(seconds)
+
+    def __str__(self) -> str:
+        return f"« ProviderStatistics samples: {self.samples}, error rate: {self.error_rate:.2%}, median latency: {self.median_latency:.3f}s, median probe latency: {self.median_probe_latency:.3f}s, latest slot: {self.latest_slot} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 ProviderRanking class
+#
+# A `ProviderRanking` is a point-in-time snapshot of where a `CompoundRPCCaller` has placed one of its
+# providers, and why. Rank 0 is the provider that will be tried first.
+#
+@dataclass
+class ProviderRanking:
+    rank: int
+    cluster_rpc_url: str
+    samples: int
+    error_rate: float
+    median_latency: float
+    p95_latency: float
+    probe_latency: float
+    slot_lag: int
+    score: float
+
+    def __str__(self) -> str:
+        return f"« ProviderRanking #{self.rank} [{self.cluster_rpc_url}] samples: {self.samples}, error rate: {self.error_rate:.2%}, latency p50: {self.median_latency:.3f}s, p95: {self.p95_latency:.3f}s, probe: {self.probe_latency:.3f}s, slot lag: {self.slot_lag}, score: {self.score:.3f} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
 # # 🥭 RPCCaller class
 #
 # A `RPCCaller` extends the HTTPProvider with better error handling.
 #
+# Each `RPCCaller` holds its own pooled `requests.Session` so that successive calls to the same RPC
+# node can reuse a kept-alive connection instead of paying for a fresh TCP and TLS handshake every
+# time. Pooled connections that have been idle for longer than `http_idle_timeout` seconds are
+# dropped before the next request (many RPC hosts silently close idle connections, and sending on
+# one of those would just fail). An `http_idle_timeout` of -1 means never drop idle connections.
+#
 class RPCCaller(HTTPProvider):
+    # How many bytes of a streamed response are read from the connection at a time.
+    STREAMING_CHUNK_SIZE: int = 64 * 1024
+
     def __init__(
         self,
         name: str,
@@ -446,6 +629,8 @@ class RPCCaller(HTTPProvider):
         stale_data_pauses_before_retry: typing.Sequence[float],
         slot_holder: AbstractSlotHolder,
         instruction_reporter: InstructionReporter,
+        http_pool_size: int = 10,
+        http_idle_timeout: float = 60,
     ):
         super().__init__(cluster_rpc_url)
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
@@ -458,12 +643,38 @@ class RPCCaller(HTTPProvider):
         ] = stale_data_pauses_before_retry
         self.slot_holder: AbstractSlotHolder = slot_holder
         self.instruction_reporter: InstructionReporter = instruction_reporter
+        self.http_pool_size: int = http_pool_size
+        self.http_idle_timeout: float = http_idle_timeout
+        self.connection_statistics: ConnectionStatistics = ConnectionStatistics()
+        self.provider_statistics: ProviderStatistics = ProviderStatistics()
+
+        self.__session: requests.Session = requests.Session()
+        self.__adapter: requests.adapters.HTTPAdapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=http_pool_size
+        )
+        self.__session.mount("http://", self.__adapter)
+        self.__session.mount("https://", self.__adapter)
+        self.__session_lock: threading.Lock = threading.Lock()
+        self.__last_used: float = time.monotonic()
 
     def require_data_from_fresh_slot(
         self, latest_slot: typing.Optional[int] = None
     ) -> None:
         self.slot_holder.require_data_from_fresh_slot(latest_slot)
 
+    def is_connected(self) -> bool:
+        try:
+            response = self.__session.get(self.health_uri)
+            response.raise_for_status()
+        except (IOError, requests.HTTPError) as err:
+            self._logger.error(f"Health check failed with error: {err}")
+            return False
+
+        return bool(response.ok)
+
+    def close(self) -> None:
+        self.__session.close()
+
     def make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
         # No pauses specified means this funcitonality is turned off.
         if len(self.stale_data_pauses_before_retry) == 0:
@@ -500,6 +711,64 @@ class RPCCaller(HTTPProvider):
         # They've all failed.
         raise last_stale_slot_exception
 
+    # Sends the request but, instead of waiting for and parsing the whole response, returns an
+    # iterator over the items of its `result` array as they arrive. Only suitable for methods like
+    # `getProgramAccounts` whose `result` is an array.
+    #
+    # Rate limits and HTTP errors are raised here, before anything is returned, so callers can still
+    # move on to another provider. Problems found after the items start flowing are raised from the
+    # iterator.
+    def make_streaming_request(
+        self, method: RPCMethod, *params: typing.Any
+    ) -> typing.Iterator[typing.Any]:
+        request_kwargs = self._before_request(
+            method=method, params=params, is_async=False
+        )
+        http_post_timeout: typing.Union[float, None] = (
+            self.http_request_timeout if self.http_request_timeout >= 0 else None
+        )
+        started_at: float = time.monotonic()
+        try:
+            raw_response = self.__post(
+                {**request_kwargs, "stream": True}, http_post_timeout
+            )
+            self._raise_if_rate_limited(method, raw_response.status_code)
+            raw_response.raise_for_status()
+        except (requests.exceptions.RequestException, RateLimitException):
+            self.provider_statistics.record_error()
+            raise
+
+        return self.__stream_result_items(method, params, raw_response, started_at)
+
+    def __stream_result_items(
+        self,
+        method: RPCMethod,
+        params: typing.Any,
+        raw_response: requests.Response,
+        started_at: float,
+    ) -> typing.Iterator[typing.Any]:
+        decoder: StreamingJsonArrayDecoder = StreamingJsonArrayDecoder("result")
+        try:
+            with raw_response:
+                for chunk in raw_response.iter_content(
+                    chunk_size=RPCCaller.STREAMING_CHUNK_SIZE
+                ):
+                    yield from decoder.feed(chunk)
+                if not decoder.finish():
+                    # No `result` array, so this is most likely an error response - process it as
+                    # one to raise the appropriate exception.
+                    self._process_response_text(method, params, decoder.preamble)
+                    raise ClientException(
+                        f"No 'result' array in response to '{method}'",
+                        self.name,
+                        self.cluster_rpc_url,
+                    )
+        except Exception:
+            self.provider_statistics.record_error()
+            raise
+
+        self.provider_statistics.record_success(time.monotonic() - started_at, None)
+
     def __make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
         # This is the entire method in HTTPProvider that we're overriding here:
         #
@@ -514,31 +783,76 @@ class RPCCaller(HTTPProvider):
         http_post_timeout: typing.Union[float, None] = (
             self.http_request_timeout if self.http_request_timeout >= 0 else None
         )
-        raw_response = requests.post(**request_kwargs, timeout=http_post_timeout)
+        started_at: float = time.monotonic()
+        try:
+            raw_response = self.__post(request_kwargs, http_post_timeout)
 
-        # Some custom exceptions specifically for rate-limiting. This allows calling code to handle this
-        # specific case if they so choose.
-        #
-        # "You will see HTTP respose codes 429 for too many requests or 413 for too much bandwidth."
-        if raw_response.status_code == 413:
+            self._raise_if_rate_limited(method, raw_response.status_code)
+
+            # Not a rate-limit problem, but maybe there was some other error?
+            raw_response.raise_for_status()
+
+            response = self._process_response_text(method, params, raw_response.text)
+        except (
+            requests.exceptions.RequestException,
+            RateLimitException,
+            NodeIsBehindException,
+            StaleSlotException,
+        ):
+            self.provider_statistics.record_error()
+            raise
+
+        self.provider_statistics.record_success(
+            time.monotonic() - started_at, self._slot_from_response(method, response)
+        )
+        return response
+
+    # Pull the slot a response came from out of that response, if it has one. This is shared with
+    # the `AsyncRPCCaller` so both track slots the same way.
+    #
+    def _slot_from_response(
+        self, method: RPCMethod, response: RPCResponse
+    ) -> typing.Optional[int]:
+        result = response.get("result")
+        if method == "getSlot" and isinstance(result, int):
+            return result
+        if (
+            isinstance(result, Mapping)
+            and isinstance(result.get("context"), Mapping)
+            and "slot" in result["context"]
+        ):
+            return int(result["context"]["slot"])
+        return None
+
+    # Some custom exceptions specifically for rate-limiting. This allows calling code to handle this
+    # specific case if they so choose.
+    #
+    # "You will see HTTP respose codes 429 for too many requests or 413 for too much bandwidth."
+    #
+    # This is shared with the `AsyncRPCCaller` so both raise the same exceptions for the same responses.
+    #
+    def _raise_if_rate_limited(self, method: RPCMethod, status_code: int) -> None:
+        if status_code == 413:
             raise TooMuchBandwidthRateLimitException(
                 f"Rate limited (too much bandwidth) calling method '{method}' on {self.cluster_rpc_url}",
                 self.name,
                 self.cluster_rpc_url,
             )
-        elif raw_response.status_code == 429:
+        elif status_code == 429:
             raise TooManyRequestsRateLimitException(
                 f"Rate limited (too many requests) calling method '{method}' on {self.cluster_rpc_url}",
                 self.name,
                 self.cluster_rpc_url,
             )
 
-        # Not a rate-limit problem, but maybe there was some other error?
-        raw_response.raise_for_status()
-
-        # All seems OK, but maybe the server returned an error? If so, try to pass on as much
-        # information as we can.
-        response_text: str = raw_response.text
+    # All seems OK at the HTTP level, but maybe the server returned an error? If so, try to pass on as
+    # much information as we can.
+    #
+    # This is shared with the `AsyncRPCCaller` so both raise the same exceptions for the same responses.
+    #
+    def _process_response_text(
+        self, method: RPCMethod, params: typing.Any, response_text: str
+    ) -> RPCResponse:
         response: typing.Dict[str, typing.Any] = json.loads(response_text)
 
         # Did we get sufficiently up-to-date information? It must be from the last slot we saw or a
@@ -659,6 +973,44 @@ class RPCCaller(HTTPProvider):
         # The call succeeded.
         return typing.cast(RPCResponse, response)
 
+    def __post(
+        self,
+        request_kwargs: typing.Dict[str, typing.Any],
+        timeout: typing.Optional[float],
+    ) -> requests.Response:
+        with self.__session_lock:
+            now: float = time.monotonic()
+            if (
+                self.http_idle_timeout >= 0
+                and (now - self.__last_used) > self.http_idle_timeout
+            ):
+                self._logger.debug(
+                    f"Dropping pooled connections to {self.cluster_rpc_url} after {now - self.__last_used:.1f} idle seconds."
+                )
+                self.__adapter.close()
+            self.__last_used = now
+
+        opened_before: int = self.__connections_opened_by_pools()
+        try:
+            return self.__session.post(**request_kwargs, timeout=timeout)
+        finally:
+            with self.__session_lock:
+                opened: int = self.__connections_opened_by_pools() - opened_before
+                self.__last_used = time.monotonic()
+                if opened > 0:
+                    self.connection_statistics.opened += opened
+                else:
+                    self.connection_statistics.reused += 1
+
+    def __connections_opened_by_pools(self) -> int:
+        pools = self.__adapter.poolmanager.pools
+        opened: int = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+        return opened
+
     def __str__(self) -> str:
         return f"« RPCCaller [{self.cluster_rpc_url}] »"
 
@@ -671,12 +1023,41 @@ class RPCCaller(HTTPProvider):
 # A `CompoundRPCCaller` will try multiple providers until it succeeds (or the all fail). Should only trap
 # and switch provider on exceptions that show that provider is no longer at the tip of the chain.
 #
+# Ranking is off by default too. If `ranking_interval` is set, every `ranking_interval` seconds the
+# providers are re-ordered by how well they've been doing recently - latency, error rate and how far
+# behind the highest known slot they are - so the fastest healthy node is tried first. Every provider
+# (not just the current head) is also sent a cheap `getSlot` probe at the same time, so a demoted node
+# that has recovered is noticed and can be promoted again. Latency is compared using only those
+# probes, since the head also handles heavy requests that the other providers rarely see.
+#
+# Hedged reads are off by default. If `hedged_reads_percentile` is set (to, say, 95) then read-only
+# requests that haven't been answered by the head provider within that percentile of recent read
+# latencies are also sent to the next provider, and so on down the list. The first valid response
+# (one that passes the provider's slot checks) wins, and the slower ones are ignored. Transactions are
+# never hedged - they always go to one provider at a time.
+#
 class CompoundRPCCaller(HTTPProvider):
-    def __init__(self, name: str, providers: typing.Sequence[RPCCaller]):
+    def __init__(
+        self,
+        name: str,
+        providers: typing.Sequence[RPCCaller],
+        hedged_reads_percentile: float = 0,
+        hedged_reads_minimum_delay: float = 0.05,
+        ranking_interval: float = 0,
+    ):
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.__providers: typing.Sequence[RPCCaller] = providers
         self.name: str = name
         self.on_provider_change: typing.Callable[[], None] = lambda: None
+        self.hedged_reads_percentile: float = hedged_reads_percentile
+        self.hedged_reads_minimum_delay: float = hedged_reads_minimum_delay
+        self.hedged_requests: int = 0
+        self.__read_latencies: typing.Deque[float] = collections.deque(maxlen=200)
+        self.__latencies_lock: threading.Lock = threading.Lock()
+        self.ranking_interval: float = ranking_interval
+        self.__last_ranked_at: float = time.monotonic()
+        self.__ranking_lock: threading.Lock = threading.Lock()
+        self.__executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
 
         # Some libraries (like the SPL Token Library) depend on `endpoint_uri` existing on
         # a `Provider`, and static typing complains if we use a property instead of a
@@ -706,23 +1087,162 @@ class CompoundRPCCaller(HTTPProvider):
             self.on_provider_change()
         self._logger.debug(f"Told to shift provider - now using: {self.__providers[0]}")
 
+    def rebase_on_provider(self, provider: RPCCaller) -> None:
+        successful_index: int = self.__providers.index(provider)
+        if successful_index != 0:
+            # Rebase the providers' list so we continue to use this successful one (until it fails)
+            self.__providers = [
+                *self.__providers[successful_index:],
+                *self.__providers[:successful_index],
+            ]
+            self.endpoint_uri = self.__providers[0].endpoint_uri
+            self.on_provider_change()
+            self._logger.debug(f"Shifted provider - now using: {self.__providers[0]}")
+
+    @property
+    def rankings(self) -> typing.Sequence[ProviderRanking]:
+        providers: typing.Sequence[RPCCaller] = self.__providers
+        highest_slot: int = self.__highest_slot(providers)
+        rankings: typing.List[ProviderRanking] = []
+        for rank, provider in enumerate(providers):
+            statistics: ProviderStatistics = provider.provider_statistics
+            rankings += [
+                ProviderRanking(
+                    rank,
+                    provider.cluster_rpc_url,
+                    statistics.samples,
+                    statistics.error_rate,
+                    statistics.median_latency,
+                    statistics.latency_percentile(95),
+                    statistics.median_probe_latency,
+                    self.__slot_lag(provider, highest_slot),
+                    self.__score(provider, highest_slot),
+                )
+            ]
+        return rankings
+
+    def rank_if_due(self) -> None:
+        if self.ranking_interval <= 0 or len(self.__providers) < 2:
+            return
+
+        if time.monotonic() - self.__last_ranked_at < self.ranking_interval:
+            return
+
+        # Only one thread needs to do this - any others can carry on with their requests.
+        if not self.__ranking_lock.acquire(blocking=False):
+            return
+
+        try:
+            self.__last_ranked_at = time.monotonic()
+            self.rank_providers()
+            self.__probe_providers()
+        finally:
+            self.__ranking_lock.release()
+
+    def rank_providers(self) -> None:
+        providers: typing.Sequence[RPCCaller] = self.__providers
+        head: RPCCaller = providers[0]
+        highest_slot: int = self.__highest_slot(providers)
+        scores: typing.Dict[int, float] = {
+            id(provider): self.__score(provider, highest_slot) for provider in providers
+        }
+        ranked: typing.List[RPCCaller] = sorted(
+            providers, key=lambda provider: scores[id(provider)]
+        )
+        best: RPCCaller = ranked[0]
+        if best is not head and not (
+            scores[id(best)] < scores[id(head)] * _RANKING_SWITCH_THRESHOLD
+        ):
+            ranked.remove(head)
+            ranked.insert(0, head)
+
+        self.__providers = ranked
+        if ranked[0] is not head:
+            self.endpoint_uri = ranked[0].endpoint_uri
+            self.on_provider_change()
+            self._logger.info(
+                f"Ranking promoted provider - now using: {ranked[0]}, scored {scores[id(ranked[0])]:.3f} against {scores[id(head)]:.3f}"
+            )
+
+    def __probe_providers(self) -> None:
+        # Providers that aren't at the head of the list only see traffic when the head fails, so
+        # without these probes their statistics would never change and they'd never be promoted.
+        executor: concurrent.futures.ThreadPoolExecutor = self.__background_executor()
+        for provider in self.__providers:
+            executor.submit(self.__probe, provider)
+
+    def __probe(self, provider: RPCCaller) -> None:
+        try:
+            started_at: float = time.monotonic()
+            provider.make_request(RPCMethod("getSlot"), {"commitment": Processed})
+            provider.provider_statistics.record_probe(time.monotonic() - started_at)
+        except Exception as exception:
+            self._logger.debug(f"Probe of {provider} failed: {exception}")
+
+    def __highest_slot(self, providers: typing.Sequence[RPCCaller]) -> int:
+        return max(provider.provider_statistics.latest_slot for provider in providers)
+
+    def __slot_lag(self, provider: RPCCaller, highest_slot: int) -> int:
+        latest_slot: int = provider.provider_statistics.latest_slot
+        if latest_slot == 0:
+            return 0
+        return max(highest_slot - latest_slot, 0)
+
+    def __score(self, provider: RPCCaller, highest_slot: int) -> float:
+        statistics: ProviderStatistics = provider.provider_statistics
+        if statistics.probe_samples == 0:
+            # Nothing known yet, so don't move it ahead of anything that is known.
+            return math.inf
+        return (
+            statistics.median_probe_latency
+            + statistics.error_rate * _RANKING_ERROR_PENALTY_SECONDS
+            + self.__slot_lag(provider, highest_slot) * _RANKING_SECONDS_PER_SLOT_LAG
+        )
+
+    def __background_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self.__executor is None:
+            self.__executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix=f"{self.name}-rpc"
+            )
+        return self.__executor
+
+    def should_hedge(self, method: RPCMethod) -> bool:
+        return (
+            self.hedged_reads_percentile > 0
+            and len(self.__providers) > 1
+            and method in _HEDGEABLE_RPC_METHODS
+        )
+
+    @property
+    def hedge_delay(self) -> float:
+        # How long to wait for one provider before also asking the next one. Until there are enough
+        # samples to make a percentile meaningful, this is just the configured minimum.
+        with self.__latencies_lock:
+            latencies = sorted(self.__read_latencies)
+        if len(latencies) < 10:
+            return self.hedged_reads_minimum_delay
+        index: int = max(
+            math.ceil(len(latencies) * self.hedged_reads_percentile / 100) - 1, 0
+        )
+        return max(latencies[index], self.hedged_reads_minimum_delay)
+
+    def record_read_latency(self, method: RPCMethod, seconds: float) -> None:
+        if method in _HEDGEABLE_RPC_METHODS:
+            with self.__latencies_lock:
+                self.__read_latencies.append(seconds)
+
     def make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
+        self.rank_if_due()
+        if self.should_hedge(method):
+            return self.__make_hedged_request(method, *params)
+
         all_exceptions: typing.List[Exception] = []
         for provider in self.__providers:
             try:
+                started_at: float = time.monotonic()
                 result = provider.make_request(method, *params)
-                successful_index: int = self.__providers.index(provider)
-                if successful_index != 0:
-                    # Rebase the providers' list so we continue to use this successful one (until it fails)
-                    self.__providers = [
-                        *self.__providers[successful_index:],
-                        *self.__providers[:successful_index],
-                    ]
-                    self.endpoint_uri = self.__providers[0].endpoint_uri
-                    self.on_provider_change()
-                    self._logger.debug(
-                        f"Shifted provider - now using: {self.__providers[0]}"
-                    )
+                self.record_read_latency(method, time.monotonic() - started_at)
+                self.rebase_on_provider(provider)
                 return result
             except (
                 requests.exceptions.HTTPError,
@@ -743,6 +1263,112 @@ class CompoundRPCCaller(HTTPProvider):
 
         raise CompoundException(self.name, all_exceptions)
 
+    # Streamed requests move on to the next provider if one fails before any items are returned,
+    # but are never hedged - a streamed response is too big to want two copies of.
+    def make_streaming_request(
+        self, method: RPCMethod, *params: typing.Any
+    ) -> typing.Iterator[typing.Any]:
+        self.rank_if_due()
+        all_exceptions: typing.List[Exception] = []
+        for provider in self.__providers:
+            try:
+                items = provider.make_streaming_request(method, *params)
+                self.rebase_on_provider(provider)
+                return items
+            except (
+                requests.exceptions.HTTPError,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                RateLimitException,
+            ) as exception:
+                all_exceptions += [exception]
+                self._logger.info(
+                    f"Moving to next provider - {provider} gave {exception}"
+                )
+
+        if len(all_exceptions) == 1:
+            raise all_exceptions[0]
+
+        raise CompoundException(self.name, all_exceptions)
+
+    def __make_hedged_request(
+        self, method: RPCMethod, *params: typing.Any
+    ) -> RPCResponse:
+        executor: concurrent.futures.ThreadPoolExecutor = self.__background_executor()
+
+        providers: typing.Sequence[RPCCaller] = list(self.__providers)
+        started_at: float = time.monotonic()
+        in_flight: typing.Dict[concurrent.futures.Future[RPCResponse], RPCCaller] = {}
+        all_exceptions: typing.List[Exception] = []
+        next_provider_index: int = 0
+
+        def __send_to_next_provider() -> None:
+            nonlocal next_provider_index
+            provider: RPCCaller = providers[next_provider_index]
+            next_provider_index += 1
+            future = executor.submit(provider.make_request, method, *params)
+            in_flight[future] = provider
+
+        __send_to_next_provider()
+        while len(in_flight) > 0:
+            can_hedge: bool = next_provider_index < len(providers)
+            completed, _ = concurrent.futures.wait(
+                in_flight,
+                timeout=self.hedge_delay if can_hedge else None,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            if len(completed) == 0:
+                self.hedged_requests += 1
+                self._logger.debug(
+                    f"Hedging {method} - sending to {providers[next_provider_index]} as well"
+                )
+                __send_to_next_provider()
+                continue
+
+            for future in completed:
+                provider = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except (
+                    requests.exceptions.HTTPError,
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                    RateLimitException,
+                    NodeIsBehindException,
+                    StaleSlotException,
+                    FailedToFetchBlockhashException,
+                ) as exception:
+                    all_exceptions += [exception]
+                    self._logger.info(
+                        f"Moving to next provider - {provider} gave {exception}"
+                    )
+                    if next_provider_index < len(providers):
+                        __send_to_next_provider()
+                    continue
+
+                self.record_read_latency(method, time.monotonic() - started_at)
+                self.rebase_on_provider(provider)
+                return result
+
+        if len(all_exceptions) == 1:
+            raise all_exceptions[0]
+
+        raise CompoundException(self.name, all_exceptions)
+
+    @property
+    def connection_statistics(self) -> typing.Mapping[str, ConnectionStatistics]:
+        return {
+            provider.cluster_rpc_url: provider.connection_statistics
+            for provider in self.__providers
+        }
+
+    def close(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+        for provider in self.__providers:
+            provider.close()
+
     def is_connected(self) -> bool:
         # All we need for this to be true is for one of our providers to be connected.
         for provider in self.__providers:
@@ -789,6 +1415,7 @@ class BetterClient:
         blockhash_cache_duration: int,
         rpc_caller: CompoundRPCCaller,
         transaction_monitor: TransactionMonitor = NullTransactionMonitor(),
+        account_cache: typing.Optional[AccountCache] = None,
     ) -> None:
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.compatible_client: Client = client
@@ -801,6 +1428,7 @@ class BetterClient:
         self.blockhash_cache_duration: int = blockhash_cache_duration
         self.rpc_caller: CompoundRPCCaller = rpc_caller
         self.transaction_monitor: TransactionMonitor = transaction_monitor
+        self.account_cache: AccountCache = account_cache or NullAccountCache()
 
     @staticmethod
     def from_configuration(
@@ -816,6 +1444,13 @@ class BetterClient:
         stale_data_pauses_before_retry: typing.Sequence[float],
         instruction_reporter: InstructionReporter,
         transaction_monitor: TransactionMonitor = NullTransactionMonitor(),
+        http_pool_size: int = 10,
+        http_idle_timeout: float = 60,
+        account_cache_ttl: float = 0,
+        account_cache_size: int = 1000,
+        hedged_reads_percentile: float = 0,
+        hedged_reads_minimum_delay: float = 0.05,
+        rpc_ranking_interval: float = 0,
     ) -> "BetterClient":
         rpc_callers: typing.List[RPCCaller] = []
         for cluster_url in cluster_urls:
@@ -827,10 +1462,18 @@ class BetterClient:
                 stale_data_pauses_before_retry,
                 transaction_monitor.slot_holder,
                 instruction_reporter,
+                http_pool_size,
+                http_idle_timeout,
             )
             rpc_callers += [rpc_caller]
 
-        provider: CompoundRPCCaller = CompoundRPCCaller(name, rpc_callers)
+        provider: CompoundRPCCaller = CompoundRPCCaller(
+            name,
+            rpc_callers,
+            hedged_reads_percentile,
+            hedged_reads_minimum_delay,
+            rpc_ranking_interval,
+        )
         blockhash_cache: typing.Union[BlockhashCache, bool] = False
         if blockhash_cache_duration > 0:
             blockhash_cache = BlockhashCache(blockhash_cache_duration)
@@ -851,6 +1494,13 @@ class BetterClient:
 
         provider.on_provider_change = __on_provider_change
 
+        account_cache: AccountCache = NullAccountCache()
+        if account_cache_ttl > 0:
+            slot_holder: AbstractSlotHolder = transaction_monitor.slot_holder
+            account_cache = AccountCache(
+                account_cache_ttl, account_cache_size, lambda: slot_holder.latest_slot
+            )
+
         return BetterClient(
             client,
             name,
@@ -862,6 +1512,7 @@ class BetterClient:
             blockhash_cache_duration,
             provider,
             transaction_monitor,
+            account_cache,
         )
 
     @property
@@ -899,8 +1550,37 @@ class BetterClient:
     def stale_data_pauses_before_retry(self) -> typing.Sequence[float]:
         return self.rpc_caller.current.stale_data_pauses_before_retry
 
+    @property
+    def http_pool_size(self) -> int:
+        return self.rpc_caller.current.http_pool_size
+
+    @property
+    def http_idle_timeout(self) -> float:
+        return self.rpc_caller.current.http_idle_timeout
+
+    @property
+    def hedged_reads_percentile(self) -> float:
+        return self.rpc_caller.hedged_reads_percentile
+
+    @property
+    def hedged_reads_minimum_delay(self) -> float:
+        return self.rpc_caller.hedged_reads_minimum_delay
+
+    @property
+    def rpc_ranking_interval(self) -> float:
+        return self.rpc_caller.ranking_interval
+
+    @property
+    def connection_statistics(self) -> typing.Mapping[str, ConnectionStatistics]:
+        return self.rpc_caller.connection_statistics
+
+    @property
+    def provider_rankings(self) -> typing.Sequence[ProviderRanking]:
+        return self.rpc_caller.rankings
+
     def dispose(self) -> None:
         self.transaction_monitor.dispose()
+        self.rpc_caller.close()
 
     def require_data_from_fresh_slot(self) -> None:
         self.rpc_caller.current.require_data_from_fresh_slot()
@@ -925,10 +1605,21 @@ class BetterClient:
         resolved_commitment, resolved_encoding = self.__resolve_defaults(
             commitment, encoding
         )
-        response = self.compatible_client.get_account_info(
-            pubkey, resolved_commitment, resolved_encoding, data_slice
+
+        def __fetch(
+            addresses: typing.Sequence[str],
+        ) -> typing.Tuple[int, typing.Sequence[typing.Any]]:
+            response = self.compatible_client.get_account_info(
+                addresses[0], resolved_commitment, resolved_encoding, data_slice
+            )
+            return self.__slot_of(response), [response["result"]["value"]]
+
+        slot, values = self.account_cache.load(
+            f"{resolved_commitment}:{resolved_encoding}:{data_slice}",
+            [str(pubkey)],
+            __fetch,
         )
-        return response["result"]
+        return {"context": {"slot": slot}, "value": values[0]}
 
     def get_confirmed_signatures_for_address2(
         self,
@@ -983,6 +1674,30 @@ class BetterClient:
 
         return response["result"]
 
+    # The same as `get_program_accounts()`, but the accounts are returned one at a time as they are
+    # read from the response rather than all together at the end.
+    def get_program_accounts_streaming(
+        self,
+        pubkey: typing.Union[str, PublicKey],
+        commitment: Commitment = UnspecifiedCommitment,
+        encoding: typing.Optional[str] = UnspecifiedEncoding,
+        data_slice: typing.Optional[DataSliceOpts] = None,
+        data_size: typing.Optional[int] = None,
+        memcmp_opts: typing.Optional[typing.List[MemcmpOpts]] = None,
+    ) -> typing.Iterator[typing.Any]:
+        resolved_commitment, resolved_encoding = self.__resolve_defaults(
+            commitment, encoding
+        )
+        method, address, opts = self.compatible_client._get_program_accounts_args(
+            pubkey,
+            resolved_commitment,
+            resolved_encoding,
+            data_slice,
+            data_size,
+            memcmp_opts,
+        )
+        return self.rpc_caller.make_streaming_request(method, address, opts)
+
     def get_recent_blockhash(
         self, commitment: Commitment = UnspecifiedCommitment
     ) -> Blockhash:
@@ -1026,10 +1741,21 @@ class BetterClient:
         resolved_commitment, resolved_encoding = self.__resolve_defaults(
             commitment, encoding
         )
-        response = self.compatible_client.get_multiple_accounts(
-            pubkeys, resolved_commitment, resolved_encoding, data_slice
+
+        def __fetch(
+            addresses: typing.Sequence[str],
+        ) -> typing.Tuple[int, typing.Sequence[typing.Any]]:
+            response = self.compatible_client.get_multiple_accounts(
+                [*addresses], resolved_commitment, resolved_encoding, data_slice
+            )
+            return self.__slot_of(response), response["result"]["value"]
+
+        _, values = self.account_cache.load(
+            f"{resolved_commitment}:{resolved_encoding}:{data_slice}",
+            [str(pubkey) for pubkey in pubkeys],
+            __fetch,
         )
-        return response["result"]["value"]
+        return values
 
     def send_transaction(
         self,
@@ -1050,25 +1776,7 @@ class BetterClient:
         last_exception: BlockhashNotFoundException
         for provider in self.rpc_caller.all_providers:
             try:
-                proper_commitment: Commitment = opts.preflight_commitment
-                proper_skip_preflight = opts.skip_preflight
-                proper_tpu_retransmissions = opts.max_retries
-                if proper_commitment == UnspecifiedCommitment:
-                    proper_commitment = self.commitment
-                    proper_skip_preflight = self.skip_preflight
-                    proper_tpu_retransmissions = (
-                        self.tpu_retransmissions
-                        if self.tpu_retransmissions >= 0
-                        else None
-                    )
-
-                proper_opts = TxOpts(
-                    preflight_commitment=proper_commitment,
-                    skip_confirmation=opts.skip_confirmation,
-                    skip_preflight=proper_skip_preflight,
-                    max_retries=proper_tpu_retransmissions,
-                )
-
+                proper_opts = self._resolve_transaction_options(opts)
                 response = self.compatible_client.send_transaction(
                     transaction,
                     *signers,
@@ -1094,6 +1802,24 @@ class BetterClient:
 
         raise last_exception
 
+    def _resolve_transaction_options(self, opts: TxOpts) -> TxOpts:
+        proper_commitment: Commitment = opts.preflight_commitment
+        proper_skip_preflight = opts.skip_preflight
+        proper_tpu_retransmissions = opts.max_retries
+        if proper_commitment == UnspecifiedCommitment:
+            proper_commitment = self.commitment
+            proper_skip_preflight = self.skip_preflight
+            proper_tpu_retransmissions = (
+                self.tpu_retransmissions if self.tpu_retransmissions >= 0 else None
+            )
+
+        return TxOpts(
+            preflight_commitment=proper_commitment,
+            skip_confirmation=opts.skip_confirmation,
+            skip_preflight=proper_skip_preflight,
+            max_retries=proper_tpu_retransmissions,
+        )
+
     def wait_for_confirmation(
         self, transaction_ids: typing.Sequence[str], max_wait_in_seconds: int = 60
     ) -> typing.Sequence[str]:
@@ -1133,6 +1859,12 @@ class BetterClient:
 
         return commitment, encoding
 
+    def __slot_of(self, response: RPCResponse) -> int:
+        result = response["result"]
+        if isinstance(result, Mapping) and isinstance(result.get("context"), Mapping):
+            return int(result["context"].get("slot", 0))
+        return 0
+
     def __str__(self) -> str:
         return f"« BetterClient [{self.cluster_name}]: {self.cluster_rpc_urls}, {self.cluster_ws_urls} »"
 
@@ -282,13 +282,25 @@ class CombinableInstructions:
     def is_empty(self) -> bool:
         return len(self.signers) == 0 and len(self.instructions) == 0
 
+    # Splits the instructions into chunks that each fit in a single transaction, in the order they'll
+    # be sent by `execute()`.
+    def chunks(
+        self, context: Context
+    ) -> typing.Sequence[typing.Sequence[TransactionInstruction]]:
+        return _split_instructions_into_chunks(context, self.signers, self.instructions)
+
     def execute(
         self, context: Context, on_exception_continue: bool = False
     ) -> typing.Sequence[str]:
-        chunks: typing.Sequence[
-            typing.Sequence[TransactionInstruction]
-        ] = _split_instructions_into_chunks(context, self.signers, self.instructions)
+        return self.execute_chunks(context, self.chunks(context), on_exception_continue)
 
+    # Sends chunks previously returned by `chunks()`, one transaction per chunk.
+    def execute_chunks(
+        self,
+        context: Context,
+        chunks: typing.Sequence[typing.Sequence[TransactionInstruction]],
+        on_exception_continue: bool = False,
+    ) -> typing.Sequence[str]:
         if len(chunks) == 1 and len(chunks[0]) == 0:
             self._logger.info("No instructions to run.")
             return []
@@ -380,12 +392,12 @@ class CombinableInstructions:
             transaction = Transaction()
             transaction.instructions.extend(instructions)
             try:
-                return context.client.send_transaction(
+                return await context.async_client.send_transaction(
                     transaction, *self.signers, recent_blockhash=blockhash
                 )
             except Exception as exception:
                 self._logger.error(
-                    f"""[{context.name}] Error executing chunk {chunk_index} (instructions {offset_start} to {offset_start + len(chunk)}) of CombinableInstruction.
+                    f"""[{context.name}] Error executing chunk {chunk_index} (instructions {offset_start} to {offset_start + len(instructions)}) of CombinableInstruction.
 {traceback.format_exc()}"""
                 )
                 raise exception
@@ -401,7 +413,10 @@ class CombinableInstructions:
         if len(chunks) > 1:
             self._logger.info(f"Running instructions in {len(chunks)} transactions.")
 
-        blockhash = context.client.get_recent_blockhash(commitment=Finalized)
+        # All chunks are sent concurrently, so they all share the one recent blockhash.
+        blockhash = await context.async_client.get_recent_blockhash(
+            commitment=Finalized
+        )
         coroutines: typing.List[typing.Coroutine[None, None, str]] = []
         for index, chunk in enumerate(chunks):
             starts_at = sum(len(ch) for ch in chunks[0:index])
@@ -24,9 +24,11 @@ from rx.scheduler.threadpoolscheduler import ThreadPoolScheduler
 from solana.publickey import PublicKey
 from solana.rpc.commitment import Commitment
 
+from .asyncclient import AsyncBetterClient
 from .client import (
     BetterClient,
     ClusterUrlData,
+    ProviderRanking,
     TransactionMonitor,
     NullTransactionMonitor,
 )
@@ -35,6 +37,7 @@ from .idgenerator import IdGenerator, MonotonicIdGenerator
 from .instructionreporter import InstructionReporter, CompoundInstructionReporter
 from .instrumentlookup import InstrumentLookup
 from .marketlookup import MarketLookup
+from .ratelimiter import TokenBucketRateLimiter
 from .text import indent_collection_as_str, indent_item_by
 from .tokens import Instrument, Token
 
@@ -66,6 +69,15 @@ class Context:
         instrument_lookup: InstrumentLookup,
         market_lookup: MarketLookup,
         transaction_monitor: TransactionMonitor = NullTransactionMonitor(),
+        http_pool_size: int = 10,
+        http_idle_timeout: float = 60,
+        gma_concurrency: int = 1,
+        gma_rate_limit: Decimal = Decimal(0),
+        account_cache_ttl: float = 0,
+        account_cache_size: int = 1000,
+        hedged_reads_percentile: float = 0,
+        hedged_reads_minimum_delay: float = 0.05,
+        rpc_ranking_interval: float = 0,
     ) -> None:
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.name: str = name
@@ -87,13 +99,32 @@ class Context:
             stale_data_pauses_before_retry,
             instruction_reporter,
             transaction_monitor,
+            http_pool_size,
+            http_idle_timeout,
+            account_cache_ttl,
+            account_cache_size,
+            hedged_reads_percentile,
+            hedged_reads_minimum_delay,
+            rpc_ranking_interval,
         )
+        self.async_client: AsyncBetterClient = AsyncBetterClient(self.client)
         self.entropy_program_address: PublicKey = entropy_program_address
         self.serum_program_address: PublicKey = serum_program_address
         self.group_name: str = group_name
         self.group_address: PublicKey = group_address
         self.gma_chunk_size: Decimal = gma_chunk_size
         self.gma_chunk_pause: Decimal = gma_chunk_pause
+        self.gma_concurrency: int = gma_concurrency
+        self.gma_rate_limit: Decimal = gma_rate_limit
+
+        # The rate limiter is shared by all `getMultipleAccounts()` calls made through this `Context`.
+        # If no explicit rate is given, the older `gma_chunk_pause` is turned into the equivalent rate.
+        gma_calls_per_second: float = float(gma_rate_limit)
+        if gma_calls_per_second <= 0 and gma_chunk_pause > 0:
+            gma_calls_per_second = 1 / float(gma_chunk_pause)
+        self.gma_rate_limiter: TokenBucketRateLimiter = TokenBucketRateLimiter(
+            gma_calls_per_second, gma_concurrency
+        )
         self.reflink: typing.Optional[PublicKey] = reflink
         self.instrument_lookup: InstrumentLookup = instrument_lookup
         self.market_lookup: MarketLookup = market_lookup
@@ -123,7 +154,16 @@ class Context:
     ) -> None:
         self.dispose()
 
+    @property
+    def provider_rankings(self) -> typing.Sequence[ProviderRanking]:
+        return self.client.provider_rankings
+
     def dispose(self) -> None:
+        if self.client.rpc_ranking_interval > 0:
+            self._logger.debug(
+                f"RPC provider rankings:\n    {indent_collection_as_str(self.provider_rankings)}"
+            )
+        self.async_client.dispose()
         self.client.dispose()
 
     def create_thread_pool_scheduler(self) -> ThreadPoolScheduler:
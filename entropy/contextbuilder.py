@@ -180,6 +180,18 @@ class ContextBuilder:
             default=20,
             help="What is the timeout for HTTP requests to when calling to RPC nodes (in seconds), -1 means no timeout",
         )
+        parser.add_argument(
+            "--http-pool-size",
+            type=int,
+            default=10,
+            help="Maximum number of kept-alive HTTP connections to pool for each RPC node",
+        )
+        parser.add_argument(
+            "--http-idle-timeout",
+            type=float,
+            default=60,
+            help="How long (in seconds) a pooled HTTP connection to an RPC node can be idle before it is dropped, -1 means never drop idle connections",
+        )
         parser.add_argument(
             "--stale-data-pause-before-retry",
             type=Decimal,
@@ -221,6 +233,48 @@ class ContextBuilder:
             default=None,
             help="Number of seconds to pause between successive getMultipleAccounts() calls to avoid rate limiting",
         )
+        parser.add_argument(
+            "--gma-concurrency",
+            type=int,
+            default=None,
+            help="Maximum number of getMultipleAccounts() calls to have in flight at once when fetching many accounts",
+        )
+        parser.add_argument(
+            "--gma-rate-limit",
+            type=Decimal,
+            default=None,
+            help="Maximum average number of getMultipleAccounts() calls per second (overrides --gma-chunk-pause)",
+        )
+        parser.add_argument(
+            "--account-cache-ttl",
+            type=float,
+            default=None,
+            help="How long (in seconds) to cache fetched account data, 0 means don't cache",
+        )
+        parser.add_argument(
+            "--account-cache-size",
+            type=int,
+            default=None,
+            help="Maximum number of accounts to cache when --account-cache-ttl is set",
+        )
+        parser.add_argument(
+            "--hedged-reads-percentile",
+            type=float,
+            default=None,
+            help="Send slow read-only requests to the next RPC node too, after this percentile of recent latencies (e.g. 95), 0 means never",
+        )
+        parser.add_argument(
+            "--hedged-reads-minimum-delay",
+            type=float,
+            default=None,
+            help="Minimum time (in seconds) to wait before hedging a read-only request",
+        )
+        parser.add_argument(
+            "--rpc-ranking-interval",
+            type=float,
+            default=None,
+            help="How often (in seconds) to re-rank RPC nodes by latency, error rate and slot lag, 0 means never",
+        )
         parser.add_argument(
             "--reflink", type=PublicKey, default=None, help="Referral public key"
         )
@@ -250,6 +304,8 @@ class ContextBuilder:
         encoding: typing.Optional[str] = args.encoding
         blockhash_cache_duration: typing.Optional[int] = args.blockhash_cache_duration
         http_request_timeout: typing.Optional[float] = args.http_request_timeout
+        http_pool_size: typing.Optional[int] = args.http_pool_size
+        http_idle_timeout: typing.Optional[float] = args.http_idle_timeout
         stale_data_pause_before_retry: typing.Optional[
             Decimal
         ] = args.stale_data_pause_before_retry
@@ -258,6 +314,15 @@ class ContextBuilder:
         ] = args.stale_data_maximum_retries
         gma_chunk_size: typing.Optional[Decimal] = args.gma_chunk_size
         gma_chunk_pause: typing.Optional[Decimal] = args.gma_chunk_pause
+        gma_concurrency: typing.Optional[int] = args.gma_concurrency
+        gma_rate_limit: typing.Optional[Decimal] = args.gma_rate_limit
+        account_cache_ttl: typing.Optional[float] = args.account_cache_ttl
+        account_cache_size: typing.Optional[int] = args.account_cache_size
+        hedged_reads_percentile: typing.Optional[float] = args.hedged_reads_percentile
+        hedged_reads_minimum_delay: typing.Optional[
+            float
+        ] = args.hedged_reads_minimum_delay
+        rpc_ranking_interval: typing.Optional[float] = args.rpc_ranking_interval
         reflink: typing.Optional[PublicKey] = args.reflink
         monitor_transactions: bool = bool(args.monitor_transactions)
         monitor_transactions_commitment: typing.Optional[
@@ -303,6 +368,15 @@ class ContextBuilder:
             monitor_transactions_commitment,
             monitor_transactions_timeout,
             actual_slot_holder,
+            http_pool_size,
+            http_idle_timeout,
+            gma_concurrency,
+            gma_rate_limit,
+            account_cache_ttl,
+            account_cache_size,
+            hedged_reads_percentile,
+            hedged_reads_minimum_delay,
+            rpc_ranking_interval,
         )
 
         logging.debug(f"{context}")
@@ -337,6 +411,15 @@ class ContextBuilder:
             context.client.transaction_monitor.commitment,
             context.client.transaction_monitor.transaction_timeout,
             context.client.transaction_monitor.slot_holder,
+            context.client.http_pool_size,
+            context.client.http_idle_timeout,
+            context.gma_concurrency,
+            context.gma_rate_limit,
+            context.client.account_cache.ttl,
+            context.client.account_cache.maximum_size,
+            context.client.hedged_reads_percentile,
+            context.client.hedged_reads_minimum_delay,
+            context.client.rpc_ranking_interval,
         )
 
     @staticmethod
@@ -363,6 +446,15 @@ class ContextBuilder:
             None,
             None,
             NullSlotHolder(),
+            context.client.http_pool_size,
+            context.client.http_idle_timeout,
+            context.gma_concurrency,
+            context.gma_rate_limit,
+            context.client.account_cache.ttl,
+            context.client.account_cache.maximum_size,
+            context.client.hedged_reads_percentile,
+            context.client.hedged_reads_minimum_delay,
+            context.client.rpc_ranking_interval,
         )
 
     @staticmethod
@@ -388,6 +480,15 @@ class ContextBuilder:
         monitor_transactions_commitment: typing.Optional[Commitment] = None,
         monitor_transactions_timeout: typing.Optional[float] = None,
         slot_holder: typing.Optional[AbstractSlotHolder] = None,
+        http_pool_size: typing.Optional[int] = None,
+        http_idle_timeout: typing.Optional[float] = None,
+        gma_concurrency: typing.Optional[int] = None,
+        gma_rate_limit: typing.Optional[Decimal] = None,
+        account_cache_ttl: typing.Optional[float] = None,
+        account_cache_size: typing.Optional[int] = None,
+        hedged_reads_percentile: typing.Optional[float] = None,
+        hedged_reads_minimum_delay: typing.Optional[float] = None,
+        rpc_ranking_interval: typing.Optional[float] = None,
     ) -> "Context":
         def __public_key_or_none(
             address: typing.Optional[str],
@@ -420,6 +521,10 @@ class ContextBuilder:
         )
         actual_http_request_timeout: float = http_request_timeout or -1
         actual_tpu_retransmissions: int = int(tpu_retransmissions)
+        actual_http_pool_size: int = http_pool_size or 10
+        actual_http_idle_timeout: float = (
+            http_idle_timeout if http_idle_timeout is not None else 60
+        )
 
         actual_cluster_urls: typing.Optional[
             typing.Sequence[ClusterUrlData]
@@ -474,6 +579,17 @@ class ContextBuilder:
 
         actual_gma_chunk_size: Decimal = gma_chunk_size or Decimal(100)
         actual_gma_chunk_pause: Decimal = gma_chunk_pause or Decimal(0)
+        actual_gma_concurrency: int = gma_concurrency or 1
+        actual_gma_rate_limit: Decimal = gma_rate_limit or Decimal(0)
+        actual_account_cache_ttl: float = account_cache_ttl or 0
+        actual_account_cache_size: int = account_cache_size or 1000
+        actual_hedged_reads_percentile: float = hedged_reads_percentile or 0
+        actual_hedged_reads_minimum_delay: float = (
+            hedged_reads_minimum_delay
+            if hedged_reads_minimum_delay is not None
+            else 0.05
+        )
+        actual_rpc_ranking_interval: float = rpc_ranking_interval or 0
 
         actual_reflink: typing.Optional[PublicKey] = reflink or __public_key_or_none(
             os.environ.get("MANGO_REFLINK_ADDRESS")
@@ -617,6 +733,15 @@ class ContextBuilder:
             instrument_lookup,
             market_lookup,
             actual_transaction_monitor,
+            actual_http_pool_size,
+            actual_http_idle_timeout,
+            actual_gma_concurrency,
+            actual_gma_rate_limit,
+            actual_account_cache_ttl,
+            actual_account_cache_size,
+            actual_hedged_reads_percentile,
+            actual_hedged_reads_minimum_delay,
+            actual_rpc_ranking_interval,
         )
 
         return context
@@ -0,0 +1,218 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+import logging
+import rx.core.typing
+import threading
+import traceback
+import typing
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from solana.publickey import PublicKey
+
+from .accountinfo import AccountInfo
+from .combinableinstructions import CombinableInstructions
+from .context import Context
+from .datetimes import datetime_from_timestamp, local_now, utc_now
+from .loadedmarket import CrankableEventQueue, LoadedMarket
+from .marketoperations import MarketInstructionBuilder
+from .observables import Disposable, EventSource
+from .wallet import Wallet
+from .websocketsubscription import (
+    WebSocketAccountSubscription,
+    WebSocketSubscriptionManager,
+)
+
+
+# # 🥭 CrankedMarket class
+#
+# The state `CrankService` keeps for each market it cranks.
+#
+# `covered_to` is the event queue position (the number of events consumed) the last crank sent will
+# have reached once it lands, and `cranked_at` is when that crank was sent.
+#
+class CrankedMarket:
+    def __init__(
+        self, market: LoadedMarket, instruction_builder: MarketInstructionBuilder
+    ) -> None:
+        self.market: LoadedMarket = market
+        self.instruction_builder: MarketInstructionBuilder = instruction_builder
+        self.pending: typing.Optional[CrankableEventQueue] = None
+        self.cranking: bool = False
+        self.crank_count: int = 0
+        self.covered_to: typing.Optional[Decimal] = None
+        self.cranked_at: datetime = datetime_from_timestamp(0)
+
+    def __str__(self) -> str:
+        return f"« CrankedMarket {self.market.fully_qualified_symbol}, {self.crank_count} cranks »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 CrankService class
+#
+# A `CrankService` keeps running and cranks one or more markets whenever their event queues have
+# events waiting to be processed.
+#
+# Everything it needs - the `Context`, `Group`, `Account`, markets and instruction builders - is
+# loaded once, up front. After that it watches each market's event queue through a websocket
+# subscription and sends a consume-events transaction as soon as at least `threshold` accounts are
+# waiting to be cranked. `poll()` fetches all the event queues at once and handles them the same
+# way, so it can be called on a timer to catch anything the websocket missed.
+#
+# Only one crank transaction is sent at a time for each market. Event queue updates that arrive while
+# a crank is being sent replace each other, and only the latest is handled once the crank is done.
+#
+# Crank transactions are sent without waiting for them to be confirmed, so the event queue can still
+# show the same events after a crank has been sent. Each crank records how far through the queue it
+# will have consumed, and no more cranks are sent for that market until the queue has moved past
+# that position or `resend_after` has passed (in case the crank transaction was dropped).
+#
+# `pulse_complete` is published after each event queue update is handled without an error, whether
+# or not it needed cranking, so it can be used as a health check.
+#
+class CrankService(rx.core.typing.Disposable):
+    def __init__(
+        self,
+        context: Context,
+        wallet: Wallet,
+        limit: Decimal = Decimal(32),
+        threshold: int = 1,
+        resend_after: timedelta = timedelta(seconds=30),
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        self.context: Context = context
+        self.wallet: Wallet = wallet
+        self.limit: Decimal = limit
+        self.threshold: int = max(threshold, 1)
+        self.resend_after: timedelta = resend_after
+        self.markets: typing.List[CrankedMarket] = []
+        self.pulse_complete: EventSource[datetime] = EventSource[datetime]()
+        self.__lock: threading.Lock = threading.Lock()
+        self.__disposer: Disposable = Disposable()
+
+    def add(
+        self,
+        market: LoadedMarket,
+        instruction_builder: MarketInstructionBuilder,
+        manager: typing.Optional[WebSocketSubscriptionManager] = None,
+    ) -> CrankedMarket:
+        cranked_market = CrankedMarket(market, instruction_builder)
+        self.markets += [cranked_market]
+        if manager is not None:
+            subscription = WebSocketAccountSubscription(
+                self.context,
+                market.event_queue_address,
+                market.parse_account_info_to_event_queue,
+            )
+            manager.add(subscription)
+            self.__disposer.add_disposable(subscription)
+            self.__disposer.add_disposable(
+                subscription.publisher.subscribe(
+                    on_next=lambda event_queue: self.handle(cranked_market, event_queue)
+                )  # type: ignore[call-arg]
+            )
+
+        return cranked_market
+
+    def poll(self, _: typing.Any = None) -> None:
+        account_infos = AccountInfo.load_multiple(
+            self.context,
+            [cranked.market.event_queue_address for cranked in self.markets],
+        )
+        for cranked_market, account_info in zip(self.markets, account_infos):
+            event_queue = cranked_market.market.parse_account_info_to_event_queue(
+                account_info
+            )
+            self.handle(cranked_market, event_queue)
+
+    def handle(
+        self, cranked_market: CrankedMarket, event_queue: CrankableEventQueue
+    ) -> None:
+        with self.__lock:
+            cranked_market.pending = event_queue
+            if cranked_market.cranking:
+                return
+            cranked_market.cranking = True
+
+        while True:
+            with self.__lock:
+                pending = cranked_market.pending
+                cranked_market.pending = None
+                if pending is None:
+                    cranked_market.cranking = False
+                    return
+
+            try:
+                self.__crank(cranked_market, pending)
+                self.pulse_complete.on_next(local_now())
+            except Exception:
+                self._logger.error(
+                    f"Cranking {cranked_market.market.fully_qualified_symbol} failed: {traceback.format_exc()}"
+                )
+
+    def __crank(
+        self, cranked_market: CrankedMarket, event_queue: CrankableEventQueue
+    ) -> None:
+        consumed = event_queue.sequence_number - event_queue.count
+        if cranked_market.covered_to is not None:
+            if consumed < cranked_market.covered_to:
+                waited = utc_now() - cranked_market.cranked_at
+                if waited < self.resend_after:
+                    return
+                self._logger.warning(
+                    f"Event queue for {cranked_market.market.fully_qualified_symbol} has not reached {cranked_market.covered_to} after {waited} - cranking again."
+                )
+            cranked_market.covered_to = None
+
+        accounts_to_crank: typing.List[PublicKey] = []
+        for event in event_queue.unprocessed_events:
+            accounts_to_crank += event.accounts_to_crank
+
+        distinct_count = len({str(account) for account in accounts_to_crank})
+        if distinct_count < self.threshold:
+            return
+
+        crank = cranked_market.instruction_builder.build_crank_instructions(
+            accounts_to_crank, self.limit
+        )
+        if len(crank.instructions) == 0:
+            return
+
+        signers: CombinableInstructions = CombinableInstructions.from_wallet(
+            self.wallet
+        )
+        signatures = (signers + crank).execute(self.context)
+        cranked_market.covered_to = consumed + min(event_queue.count, self.limit)
+        cranked_market.cranked_at = utc_now()
+        cranked_market.crank_count += 1
+        self._logger.info(
+            f"Cranked {distinct_count} accounts in {cranked_market.market.fully_qualified_symbol}: {signatures}"
+        )
+
+    def dispose(self) -> None:
+        self.__disposer.dispose()
+        self.pulse_complete.dispose()
+
+    def __str__(self) -> str:
+        markets = ", ".join(
+            cranked.market.fully_qualified_symbol for cranked in self.markets
+        )
+        return f"« CrankService [{markets}] limit: {self.limit}, threshold: {self.threshold}, resend after: {self.resend_after} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
@@ -0,0 +1,363 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+import numpy
+import typing
+
+from decimal import Decimal
+
+from .account import Account
+from .cache import Cache
+from .group import Group
+from .instrumentvalue import InstrumentValue
+from .openorders import OpenOrders
+
+
+# # 🥭 AccountHealths class
+#
+# The health of a batch of `Account`s, as NumPy arrays with one entry per account in the same order as
+# `accounts`. Values are `float64`s in the group's shared quote token.
+#
+class AccountHealths:
+    def __init__(
+        self,
+        group: Group,
+        accounts: typing.Sequence[Account],
+        init_assets: numpy.ndarray,
+        init_liabilities: numpy.ndarray,
+        maint_assets: numpy.ndarray,
+        maint_liabilities: numpy.ndarray,
+        being_liquidated: numpy.ndarray,
+    ) -> None:
+        self.group: Group = group
+        self.accounts: typing.Sequence[Account] = accounts
+        self.init_assets: numpy.ndarray = init_assets
+        self.init_liabilities: numpy.ndarray = init_liabilities
+        self.maint_assets: numpy.ndarray = maint_assets
+        self.maint_liabilities: numpy.ndarray = maint_liabilities
+        self.being_liquidated: numpy.ndarray = being_liquidated
+
+    @property
+    def init_health(self) -> numpy.ndarray:
+        return self.init_assets + self.init_liabilities
+
+    @property
+    def maint_health(self) -> numpy.ndarray:
+        return self.maint_assets + self.maint_liabilities
+
+    @property
+    def init_health_ratio(self) -> numpy.ndarray:
+        return AccountHealths.__health_ratio(self.init_assets, self.init_liabilities)
+
+    @property
+    def maint_health_ratio(self) -> numpy.ndarray:
+        return AccountHealths.__health_ratio(self.maint_assets, self.maint_liabilities)
+
+    @property
+    def is_liquidatable(self) -> numpy.ndarray:
+        return (self.being_liquidated & (self.init_health < 0)) | (
+            self.maint_health < 0
+        )
+
+    @property
+    def liquidatable_accounts(self) -> typing.Sequence[Account]:
+        return [
+            self.accounts[index] for index in numpy.flatnonzero(self.is_liquidatable)
+        ]
+
+    def init_health_of(self, index: int) -> InstrumentValue:
+        return InstrumentValue(
+            self.group.shared_quote_token, Decimal(float(self.init_health[index]))
+        )
+
+    def maint_health_of(self, index: int) -> InstrumentValue:
+        return InstrumentValue(
+            self.group.shared_quote_token, Decimal(float(self.maint_health[index]))
+        )
+
+    @staticmethod
+    def __health_ratio(
+        assets: numpy.ndarray, liabilities: numpy.ndarray
+    ) -> numpy.ndarray:
+        ratio = numpy.full(len(assets), 100.0)
+        has_liabilities = liabilities != 0
+        ratio[has_liabilities] = (
+            (assets[has_liabilities] / -liabilities[has_liabilities]) - 1
+        ) * 100
+        return ratio
+
+    def __str__(self) -> str:
+        return f"« AccountHealths [{len(self.accounts)} accounts, {int(numpy.count_nonzero(self.is_liquidatable))} liquidatable] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 HealthEngine class
+#
+# Calculates the init and maint health of many `Account`s at once, with the same rules as
+# `Account.to_dataframe()` and `Account.weighted_assets()` but on NumPy `float64` arrays instead of a
+# `DataFrame` of `Decimal`s per account.
+#
+# Everything that depends only on the `Group` and `Cache` (prices, weights, lot sizes, funding) is
+# gathered once per engine, indexed by token index. Each account's slots then only contribute their
+# raw values to an accounts-by-tokens array, and the health is worked out for all accounts together.
+#
+# Because it uses floating point the results can differ from the `Decimal` ones in the last few
+# significant digits - fine for scanning for liquidatable accounts, but use `Account.init_health()`
+# and friends where exact values matter.
+#
+class HealthEngine:
+    __WEIGHT_NAMES: typing.Sequence[str] = [
+        "InitAsset",
+        "MaintAsset",
+        "InitLiability",
+        "MaintLiability",
+    ]
+
+    def __init__(self, group: Group, cache: Cache) -> None:
+        self.group: Group = group
+        self.cache: Cache = cache
+
+        group_slots = group.slots_by_index
+        token_count = len(group_slots) + 1
+        self.quote_index: int = token_count - 1
+        self.prices: numpy.ndarray = numpy.zeros(token_count)
+        self.prices[self.quote_index] = 1
+        self.spot_weights: typing.Dict[str, numpy.ndarray] = {
+            name: numpy.zeros(token_count) for name in HealthEngine.__WEIGHT_NAMES
+        }
+        self.perp_weights: typing.Dict[str, numpy.ndarray] = {
+            name: numpy.zeros(token_count) for name in HealthEngine.__WEIGHT_NAMES
+        }
+        self.has_perp_market: numpy.ndarray = numpy.zeros(token_count, dtype=bool)
+        self.perp_base_lot_values: numpy.ndarray = numpy.zeros(token_count)
+        self.perp_quote_lot_values: numpy.ndarray = numpy.zeros(token_count)
+        self.long_funding: numpy.ndarray = numpy.zeros(token_count)
+        self.short_funding: numpy.ndarray = numpy.zeros(token_count)
+
+        quote_token = group.shared_quote_token
+        self.quote_factor: float = float(Decimal(10) ** quote_token.decimals)
+        for index, group_slot in enumerate(group_slots):
+            if group_slot is None:
+                continue
+
+            self.prices[index] = float(
+                group.token_price_from_cache(cache, group_slot.base_instrument).value
+            )
+            HealthEngine.__set_weights(self.spot_weights, index, group_slot.spot_market)
+            HealthEngine.__set_weights(self.perp_weights, index, group_slot.perp_market)
+
+            perp_market_cache = cache.market_cache_for_index(index).perp_market
+            if group_slot.perp_market is not None and perp_market_cache is not None:
+                self.has_perp_market[index] = True
+                lot_size_converter = group_slot.perp_lot_size_converter
+                self.perp_base_lot_values[index] = float(
+                    lot_size_converter.base_lot_size
+                    / (Decimal(10) ** lot_size_converter.base.decimals)
+                )
+                self.perp_quote_lot_values[index] = float(
+                    lot_size_converter.quote_lot_size
+                    / (Decimal(10) ** lot_size_converter.quote.decimals)
+                )
+                self.long_funding[index] = float(perp_market_cache.long_funding)
+                self.short_funding[index] = float(perp_market_cache.short_funding)
+
+        # The shared quote token always has weights of 1 - 1 USDC is always worth 1 USDC.
+        for weights in [*self.spot_weights.values(), *self.perp_weights.values()]:
+            weights[self.quote_index] = 1
+
+    @staticmethod
+    def __set_weights(
+        weights: typing.Dict[str, numpy.ndarray], index: int, market: typing.Any
+    ) -> None:
+        if market is not None:
+            weights["InitAsset"][index] = float(market.init_asset_weight)
+            weights["MaintAsset"][index] = float(market.maint_asset_weight)
+            weights["InitLiability"][index] = float(market.init_liab_weight)
+            weights["MaintLiability"][index] = float(market.maint_liab_weight)
+
+    def evaluate(
+        self,
+        accounts: typing.Sequence[Account],
+        all_spot_open_orders: typing.Dict[str, OpenOrders],
+    ) -> AccountHealths:
+        shape = (len(accounts), len(self.prices))
+        net = numpy.zeros(shape)
+        in_margin_basket = numpy.zeros(shape, dtype=bool)
+        has_open_orders = numpy.zeros(shape, dtype=bool)
+        base_free = numpy.zeros(shape)
+        base_total = numpy.zeros(shape)
+        quote_free = numpy.zeros(shape)
+        quote_total = numpy.zeros(shape)
+        referrer_rebate = numpy.zeros(shape)
+        perp_active = numpy.zeros(shape, dtype=bool)
+        base_position = numpy.zeros(shape)
+        quote_position = numpy.zeros(shape)
+        long_settled_funding = numpy.zeros(shape)
+        short_settled_funding = numpy.zeros(shape)
+        bids_quantity = numpy.zeros(shape)
+        asks_quantity = numpy.zeros(shape)
+        taker_quote = numpy.zeros(shape)
+        being_liquidated = numpy.zeros(len(accounts), dtype=bool)
+
+        for row, account in enumerate(accounts):
+            being_liquidated[row] = account.being_liquidated
+            basket = account.in_margin_basket
+            for slot in account.slots:
+                index = slot.index
+                net[row, index] = float(slot.net_value.value)
+                in_margin_basket[row, index] = index < len(basket) and basket[index]
+
+                if slot.spot_open_orders is not None:
+                    open_orders = all_spot_open_orders.get(str(slot.spot_open_orders))
+                    if open_orders is None:
+                        raise Exception(
+                            f"OpenOrders address {slot.spot_open_orders} at index {slot.index} not loaded."
+                        )
+                    has_open_orders[row, index] = True
+                    base_free[row, index] = float(open_orders.base_token_free)
+                    base_total[row, index] = float(open_orders.base_token_total)
+                    quote_free[row, index] = float(open_orders.quote_token_free)
+                    quote_total[row, index] = float(open_orders.quote_token_total)
+                    referrer_rebate[row, index] = float(
+                        open_orders.referrer_rebate_accrued
+                    )
+
+                perp_account = slot.perp_account
+                if perp_account is not None and not perp_account.empty:
+                    if not self.has_perp_market[index]:
+                        raise Exception(
+                            f"Could not find perp market in Group or Cache at index {index}."
+                        )
+                    perp_active[row, index] = True
+                    base_position[row, index] = round(perp_account.base_position)
+                    quote_position[row, index] = float(perp_account.quote_position)
+                    long_settled_funding[row, index] = float(
+                        perp_account.long_settled_funding
+                    )
+                    short_settled_funding[row, index] = float(
+                        perp_account.short_settled_funding
+                    )
+                    bids_quantity[row, index] = round(perp_account.bids_quantity)
+                    asks_quantity[row, index] = round(perp_account.asks_quantity)
+                    taker_quote[row, index] = round(perp_account.taker_quote)
+
+        prices = self.prices
+
+        # Spot: report whichever of 'all bids execute' and 'all asks execute' is worse for health.
+        # See `Account.to_dataframe()` for the reasoning.
+        quote_locked = quote_total - quote_free
+        quote_locked_as_base = numpy.divide(
+            quote_locked, prices, out=numpy.zeros(shape), where=prices != 0
+        )
+        spot_bids_base_net = net + quote_locked_as_base + base_total
+        spot_asks_base_net = net + base_free
+        bids_worse = numpy.abs(spot_bids_base_net) > numpy.abs(spot_asks_base_net)
+        spot_health_base = numpy.where(
+            has_open_orders,
+            numpy.where(bids_worse, spot_bids_base_net, spot_asks_base_net),
+            net,
+        )
+        quote_unsettled = numpy.where(has_open_orders, quote_free + referrer_rebate, 0)
+
+        # Perp: the same worst case, over open bids and asks.
+        perp_position = base_position * self.perp_base_lot_values
+        perp_bids = bids_quantity * self.perp_base_lot_values
+        perp_asks = asks_quantity * self.perp_base_lot_values
+        funding = numpy.where(
+            base_position < 0,
+            self.short_funding - short_settled_funding,
+            self.long_funding - long_settled_funding,
+        )
+        unsettled_funding = -(base_position * funding) / self.quote_factor
+        perp_quote = (
+            (quote_position / self.quote_factor)
+            + unsettled_funding
+            + (taker_quote * self.perp_quote_lot_values)
+        )
+        perp_bids_base_net = perp_position + perp_bids
+        perp_asks_base_net = perp_position - perp_asks
+        perp_bids_worse = numpy.abs(perp_bids_base_net) > numpy.abs(perp_asks_base_net)
+        perp_health_base = numpy.where(
+            perp_active,
+            numpy.where(perp_bids_worse, perp_bids_base_net, perp_asks_base_net),
+            0,
+        )
+        perp_health_quote = numpy.where(
+            perp_active,
+            numpy.where(
+                perp_bids_worse,
+                perp_quote - (perp_bids * prices),
+                perp_quote + (perp_asks * prices),
+            ),
+            0,
+        )
+
+        # Everything in the shared quote token is counted together, then split into an asset or a
+        # liability depending on its sign.
+        quote = (
+            net[:, self.quote_index]
+            + perp_health_quote.sum(axis=1)
+            + numpy.where(in_margin_basket, quote_unsettled, 0).sum(axis=1)
+        )
+        quote_assets = numpy.maximum(quote, 0)
+        quote_liabilities = numpy.minimum(quote, 0)
+
+        non_quote = numpy.ones(len(prices), dtype=bool)
+        non_quote[self.quote_index] = False
+        spot_values = (spot_health_base * prices)[:, non_quote]
+        perp_values = (perp_health_base * prices)[:, non_quote]
+
+        def _weighted(
+            weighting_name: str,
+        ) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+            spot_asset_weights = self.spot_weights[f"{weighting_name}Asset"][non_quote]
+            spot_liability_weights = self.spot_weights[f"{weighting_name}Liability"][
+                non_quote
+            ]
+            perp_asset_weights = self.perp_weights[f"{weighting_name}Asset"][non_quote]
+            perp_liability_weights = self.perp_weights[f"{weighting_name}Liability"][
+                non_quote
+            ]
+            assets = (
+                quote_assets
+                + (numpy.maximum(spot_values, 0) * spot_asset_weights).sum(axis=1)
+                + (numpy.maximum(perp_values, 0) * perp_asset_weights).sum(axis=1)
+            )
+            liabilities = (
+                quote_liabilities
+                + (numpy.minimum(spot_values, 0) * spot_liability_weights).sum(axis=1)
+                + (numpy.minimum(perp_values, 0) * perp_liability_weights).sum(axis=1)
+            )
+            return assets, liabilities
+
+        init_assets, init_liabilities = _weighted("Init")
+        maint_assets, maint_liabilities = _weighted("Maint")
+        return AccountHealths(
+            self.group,
+            accounts,
+            init_assets,
+            init_liabilities,
+            maint_assets,
+            maint_liabilities,
+            being_liquidated,
+        )
+
+    def __str__(self) -> str:
+        return f"« HealthEngine for group {self.group.address} [{len(self.prices)} tokens] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
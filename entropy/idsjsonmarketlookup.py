@@ -38,10 +38,21 @@ class IdsJsonMarketType(enum.Enum):
         return f"{self}"
 
 
+# Everything needed to build a `Market` stub for one market in ids.json: the market type, the Entropy
+# program address, the group address, the market's own data and the group's quote symbol.
+_IdsJsonMarketEntry = typing.Tuple[
+    IdsJsonMarketType, PublicKey, PublicKey, typing.Dict[str, typing.Any], str
+]
+
+
 # # 🥭 IdsJsonMarketLookup class
 #
 # This class allows us to look up market data from our ids.json configuration file.
 #
+# The cluster's markets are indexed when the lookup is created - by upper-cased name, by name for
+# just perps or just spots (for `PERP:` and `SPOT:` symbols) and by address. Each `Market` stub is
+# built the first time it's found and the same one is returned from then on.
+#
 
 
 class IdsJsonMarketLookup(MarketLookup):
@@ -49,6 +60,33 @@ class IdsJsonMarketLookup(MarketLookup):
         super().__init__()
         self.cluster_name: str = cluster_name
         self.instrument_lookup: InstrumentLookup = instrument_lookup
+        self.__by_symbol: typing.Dict[str, _IdsJsonMarketEntry] = {}
+        self.__perps_by_symbol: typing.Dict[str, _IdsJsonMarketEntry] = {}
+        self.__spots_by_symbol: typing.Dict[str, _IdsJsonMarketEntry] = {}
+        self.__by_address: typing.Dict[str, _IdsJsonMarketEntry] = {}
+        self.__markets: typing.Dict[str, Market] = {}
+        for group in EntropyConstants["groups"]:
+            if group["cluster"] == cluster_name:
+                group_address: PublicKey = PublicKey(group["publicKey"])
+                entropy_program_address: PublicKey = PublicKey(
+                    group["entropyProgramId"]
+                )
+                for market_type, markets_key, by_symbol in [
+                    (IdsJsonMarketType.PERP, "perpMarkets", self.__perps_by_symbol),
+                    (IdsJsonMarketType.SPOT, "spotMarkets", self.__spots_by_symbol),
+                ]:
+                    for market_data in group[markets_key]:
+                        entry: _IdsJsonMarketEntry = (
+                            market_type,
+                            entropy_program_address,
+                            group_address,
+                            market_data,
+                            group["quoteSymbol"],
+                        )
+                        symbol: str = market_data["name"].upper()
+                        self.__by_symbol.setdefault(symbol, entry)
+                        by_symbol.setdefault(symbol, entry)
+                        self.__by_address.setdefault(market_data["publicKey"], entry)
 
     @staticmethod
     def _from_dict(
@@ -86,78 +124,40 @@ class IdsJsonMarketLookup(MarketLookup):
             )
 
     def find_by_symbol(self, symbol: str) -> typing.Optional[Market]:
-        check_spots = True
-        check_perps = True
         symbol = symbol.upper()
+        by_symbol: typing.Dict[str, _IdsJsonMarketEntry] = self.__by_symbol
         if symbol.startswith("SPOT:"):
             symbol = symbol.split(":", 1)[1]
-            check_perps = (
-                False  # Skip perp markets because we're explicitly told it's a spot
-            )
+            by_symbol = self.__spots_by_symbol
         elif symbol.startswith("PERP:"):
             symbol = symbol.split(":", 1)[1]
-            check_spots = (
-                False  # Skip spot markets because we're explicitly told it's a perp
-            )
+            by_symbol = self.__perps_by_symbol
 
-        for group in EntropyConstants["groups"]:
-            if group["cluster"] == self.cluster_name:
-                group_address: PublicKey = PublicKey(group["publicKey"])
-                entropy_program_address: PublicKey = PublicKey(
-                    group["entropyProgramId"]
-                )
-                if check_perps:
-                    for market_data in group["perpMarkets"]:
-                        if Market.symbols_match(market_data["name"], symbol):
-                            return IdsJsonMarketLookup._from_dict(
-                                IdsJsonMarketType.PERP,
-                                entropy_program_address,
-                                group_address,
-                                market_data,
-                                self.instrument_lookup,
-                                group["quoteSymbol"],
-                            )
-                if check_spots:
-                    for market_data in group["spotMarkets"]:
-                        if Market.symbols_match(market_data["name"], symbol):
-                            return IdsJsonMarketLookup._from_dict(
-                                IdsJsonMarketType.SPOT,
-                                entropy_program_address,
-                                group_address,
-                                market_data,
-                                self.instrument_lookup,
-                                group["quoteSymbol"],
-                            )
-        return None
+        return self.__market(by_symbol.get(symbol))
 
     def find_by_address(self, address: PublicKey) -> typing.Optional[Market]:
-        for group in EntropyConstants["groups"]:
-            if group["cluster"] == self.cluster_name:
-                group_address: PublicKey = PublicKey(group["publicKey"])
-                entropy_program_address: PublicKey = PublicKey(
-                    group["entropyProgramId"]
-                )
-                for market_data in group["perpMarkets"]:
-                    if market_data["publicKey"] == str(address):
-                        return IdsJsonMarketLookup._from_dict(
-                            IdsJsonMarketType.PERP,
-                            entropy_program_address,
-                            group_address,
-                            market_data,
-                            self.instrument_lookup,
-                            group["quoteSymbol"],
-                        )
-                for market_data in group["spotMarkets"]:
-                    if market_data["publicKey"] == str(address):
-                        return IdsJsonMarketLookup._from_dict(
-                            IdsJsonMarketType.SPOT,
-                            entropy_program_address,
-                            group_address,
-                            market_data,
-                            self.instrument_lookup,
-                            group["quoteSymbol"],
-                        )
-        return None
+        return self.__market(self.__by_address.get(str(address)))
+
+    def __market(
+        self, entry: typing.Optional[_IdsJsonMarketEntry]
+    ) -> typing.Optional[Market]:
+        if entry is None:
+            return None
+
+        market_type, entropy_program_address, group_address, market_data, quote = entry
+        key: str = f"{group_address}:{market_data['publicKey']}"
+        market = self.__markets.get(key)
+        if market is None:
+            market = IdsJsonMarketLookup._from_dict(
+                market_type,
+                entropy_program_address,
+                group_address,
+                market_data,
+                self.instrument_lookup,
+                quote,
+            )
+            self.__markets[key] = market
+        return market
 
     def all_markets(self) -> typing.Sequence[Market]:
         markets = []
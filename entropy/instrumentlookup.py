@@ -18,11 +18,13 @@ import json
 import logging
 import os.path
 import typing
+import zlib
 
 from decimal import Decimal
 from solana.publickey import PublicKey
 
 from .constants import DATA_PATH, EntropyConstants
+from .tokenlistindex import TokenListIndex
 from .tokens import Instrument, Token
 
 
@@ -175,45 +177,33 @@ class NonSPLInstrumentLookup(InstrumentLookup):
 #
 # This class allows us to look up token data from our ids.json configuration file.
 #
+# The tokens for the cluster and group are indexed by upper-cased symbol and by mint when the lookup
+# is created, so each lookup is a dictionary access that returns the same `Token` every time.
+#
 class IdsJsonTokenLookup(InstrumentLookup):
     def __init__(self, cluster_name: str, group_name: str) -> None:
         super().__init__()
         self.cluster_name: str = cluster_name
         self.group_name: str = group_name
+        self.__by_symbol: typing.Dict[str, Token] = {}
+        self.__by_mint: typing.Dict[str, Token] = {}
+        for group in EntropyConstants["groups"]:
+            if group["cluster"] == cluster_name and group["name"] == group_name:
+                for token_data in group["tokens"]:
+                    token = Token(
+                        token_data["symbol"],
+                        token_data["symbol"],
+                        Decimal(token_data["decimals"]),
+                        PublicKey(token_data["mintKey"]),
+                    )
+                    self.__by_symbol.setdefault(token_data["symbol"].upper(), token)
+                    self.__by_mint.setdefault(token_data["mintKey"], token)
 
     def find_by_symbol(self, symbol: str) -> typing.Optional[Token]:
-        for group in EntropyConstants["groups"]:
-            if (
-                group["cluster"] == self.cluster_name
-                and group["name"] == self.group_name
-            ):
-                for token in group["tokens"]:
-                    if Instrument.symbols_match(token["symbol"], symbol):
-                        return Token(
-                            token["symbol"],
-                            token["symbol"],
-                            Decimal(token["decimals"]),
-                            PublicKey(token["mintKey"]),
-                        )
-        # print("IdsJsonTokenLookup find_by_symbol found nothing")
-        return None
+        return self.__by_symbol.get(symbol.upper())
 
     def find_by_mint(self, mint: PublicKey) -> typing.Optional[Token]:
-        mint_str = str(mint)
-        for group in EntropyConstants["groups"]:
-            if (
-                group["cluster"] == self.cluster_name
-                and group["name"] == self.group_name
-            ):
-                for token in group["tokens"]:
-                    if token["mintKey"] == mint_str:
-                        return Token(
-                            token["symbol"],
-                            token["symbol"],
-                            Decimal(token["decimals"]),
-                            PublicKey(token["mintKey"]),
-                        )
-        return None
+        return self.__by_mint.get(str(mint))
 
     def __str__(self) -> str:
         return f"« IdsJsonTokenLookup [{self.cluster_name}, {self.group_name}] »"
@@ -232,6 +222,13 @@ class IdsJsonTokenLookup(InstrumentLookup):
 #     token_lookup = SPLTokenLookup(token_data)
 # ```
 #
+# `load()` doesn't parse the JSON file at all. Instead it uses a `TokenListIndex` of the file, kept in
+# `index_directory` and rebuilt whenever the file changes, so lookups only decode the tokens they
+# find. The full `token_data` is still available, but is only loaded if something asks for it.
+#
+# The default `index_directory` is the current user's cache directory (`~/.cache/entropy`, or
+# `$XDG_CACHE_HOME/entropy`) rather than a shared directory, so other users can't plant an index.
+#
 class SPLTokenLookup(InstrumentLookup):
     DefaultDataFilepath = os.path.join(DATA_PATH, "solana.tokenlist.json")
     DevnetDataFilepath = os.path.join(DATA_PATH, "solana.tokenlist.devnet.json")
@@ -239,42 +236,73 @@ class SPLTokenLookup(InstrumentLookup):
     DevnetOverridesDataFilepath = os.path.join(
         DATA_PATH, "overrides.tokenlist.devnet.json"
     )
+    DefaultIndexDirectory = os.path.join(
+        os.environ.get("XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache"),
+        "entropy",
+    )
 
-    def __init__(self, filename: str, token_data: typing.Dict[str, typing.Any]) -> None:
+    def __init__(
+        self,
+        filename: str,
+        token_data: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        index: typing.Optional[TokenListIndex] = None,
+    ) -> None:
         super().__init__()
         self.filename: str = filename
-        self.token_data: typing.Dict[str, typing.Any] = token_data
+        self.__token_data: typing.Optional[typing.Dict[str, typing.Any]] = token_data
+        if index is None:
+            index = TokenListIndex(TokenListIndex.build(self.token_data))
+        self.index: TokenListIndex = index
+        self.__tokens: typing.Dict[int, Token] = {}
+
+    @property
+    def token_data(self) -> typing.Dict[str, typing.Any]:
+        if self.__token_data is None:
+            with open(self.filename, encoding="utf-8") as json_file:
+                self.__token_data = json.load(json_file)
+        return self.__token_data
 
     def find_by_symbol(self, symbol: str) -> typing.Optional[Token]:
-        for token in self.token_data["tokens"]:
-            if Instrument.symbols_match(token["symbol"], symbol):
-                return Token(
-                    token["symbol"],
-                    token["name"],
-                    Decimal(token["decimals"]),
-                    PublicKey(token["address"]),
-                )
-        # print("SPLTokenLookup found nothing")
-        return None
+        return self.__token_from_record(self.index.find_by_symbol(symbol))
 
     def find_by_mint(self, mint: PublicKey) -> typing.Optional[Token]:
-        mint_string: str = str(mint)
-        for token in self.token_data["tokens"]:
-            if token["address"] == mint_string:
-                return Token(
-                    token["symbol"],
-                    token["name"],
-                    Decimal(token["decimals"]),
-                    PublicKey(token["address"]),
-                )
+        return self.__token_from_record(self.index.find_by_mint(str(mint)))
 
-        return None
+    def __token_from_record(
+        self, record: typing.Optional[typing.Dict[str, typing.Any]]
+    ) -> typing.Optional[Token]:
+        if record is None:
+            return None
+
+        token = self.__tokens.get(id(record))
+        if token is None:
+            token = Token(
+                record["symbol"],
+                record["name"],
+                Decimal(record["decimals"]),
+                PublicKey(record["address"]),
+            )
+            self.__tokens[id(record)] = token
+        return token
 
     @staticmethod
-    def load(filename: str) -> "SPLTokenLookup":
-        with open(filename, encoding="utf-8") as json_file:
-            token_data = json.load(json_file)
-            return SPLTokenLookup(filename, token_data)
+    def index_filename(filename: str, index_directory: str) -> str:
+        # Different token lists can share a base name, so the full path is hashed into the name too.
+        path_hash: int = zlib.crc32(os.path.abspath(filename).encode("utf-8"))
+        return os.path.join(
+            index_directory,
+            f"entropy_{os.path.basename(filename)}.{path_hash:08x}.index",
+        )
+
+    @staticmethod
+    def load(
+        filename: str, index_directory: str = DefaultIndexDirectory
+    ) -> "SPLTokenLookup":
+        index = TokenListIndex.open(
+            filename, SPLTokenLookup.index_filename(filename, index_directory)
+        )
+        return SPLTokenLookup(filename, index=index)
 
     def __str__(self) -> str:
         return f"« SPLTokenLookup [{self.filename}] »"
@@ -0,0 +1,341 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+import logging
+import rx.core.typing
+import typing
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from solana.publickey import PublicKey
+
+from .accountinfo import AccountInfo
+from .cache import Cache
+from .combinableinstructions import CombinableInstructions
+from .context import Context
+from .datetimes import local_now, utc_now
+from .group import Group
+from .instructions import (
+    build_entropy_cache_perp_markets_instructions,
+    build_entropy_cache_prices_instructions,
+    build_entropy_cache_root_banks_instructions,
+    build_entropy_update_funding_instructions,
+    build_entropy_update_root_bank_instructions,
+    build_perp_consume_events_instructions,
+)
+from .layouts import layouts
+from .observables import Disposable, EventSource
+from .perpeventqueue import PerpEventQueue
+from .perpmarketdetails import PerpMarketDetails
+from .websocketsubscription import (
+    WebSocketAccountSubscription,
+    WebSocketSubscriptionManager,
+)
+
+
+# # 🥭 Keeper class
+#
+# A `Keeper` holds the accounts the keeper instructions depend on - the group's `Cache`, and the
+# `PerpMarketDetails` and `PerpEventQueue` of each perp market - and builds only the keeper
+# instructions those accounts show are needed:
+# * caching prices for oracles whose cached price is older than `stale_after`,
+# * updating (and caching) root banks whose cached indexes are older than `stale_after`,
+# * caching perp markets whose cached funding is older than `stale_after`,
+# * updating funding for perp markets that were last updated longer ago than `stale_after`, and
+# * consuming events for perp markets whose event queues have events waiting.
+#
+# `subscribe()` keeps those accounts current through websocket subscriptions, so working out what
+# needs doing doesn't need any RPC calls. `updated` is published whenever one of them changes.
+#
+# Instructions returned by `build_instructions()` are assumed to have been sent. What they update
+# isn't included again until `stale_after` has passed, even if the account updates showing they
+# worked haven't arrived yet. An event queue isn't cranked again until it has moved past the events
+# the last crank consumes, or `stale_after` has passed.
+#
+class Keeper(rx.core.typing.Disposable):
+    def __init__(
+        self,
+        context: Context,
+        group: Group,
+        node_bank_addresses: typing.Dict[str, typing.Sequence[PublicKey]],
+        cache: Cache,
+        perp_markets: typing.Sequence[PerpMarketDetails],
+        event_queues: typing.Sequence[PerpEventQueue],
+        stale_after: timedelta,
+        consume_events_limit: Decimal = Decimal(32),
+    ) -> None:
+        self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        self.context: Context = context
+        self.group: Group = group
+        self.node_bank_addresses: typing.Dict[
+            str, typing.Sequence[PublicKey]
+        ] = node_bank_addresses
+        self.cache: Cache = cache
+        self.perp_markets: typing.List[PerpMarketDetails] = list(perp_markets)
+        self.event_queues: typing.List[PerpEventQueue] = list(event_queues)
+        self.stale_after: timedelta = stale_after
+        self.consume_events_limit: Decimal = consume_events_limit
+        self.updated: EventSource[datetime] = EventSource[datetime]()
+        self.__sent_at: typing.Dict[str, datetime] = {}
+        # For each event queue cranked, the queue position (number of events consumed) the crank
+        # will reach once it lands, and when it was sent.
+        self.__cranked: typing.Dict[str, typing.Tuple[Decimal, datetime]] = {}
+        self.__disposer: Disposable = Disposable()
+
+    @staticmethod
+    def load(context: Context, group: Group, stale_after: timedelta) -> "Keeper":
+        node_bank_addresses: typing.Dict[str, typing.Sequence[PublicKey]] = {}
+        for token_bank in [
+            group.shared_quote,
+            *[
+                slot.base_token_bank
+                for slot in group.slots
+                if slot.base_token_bank is not None
+            ],
+        ]:
+            root_bank = token_bank.ensure_root_bank(context)
+            node_bank_addresses[str(root_bank.address)] = root_bank.node_banks
+
+        perp_market_addresses: typing.List[PublicKey] = [
+            slot.perp_market.address
+            for slot in group.slots
+            if slot.perp_market is not None
+        ]
+        [cache_account_info, *perp_market_account_infos] = AccountInfo.load_multiple(
+            context, [group.cache, *perp_market_addresses]
+        )
+        cache = Cache.parse(cache_account_info)
+        perp_markets = [
+            PerpMarketDetails.parse(account_info, group)
+            for account_info in perp_market_account_infos
+        ]
+
+        event_queue_account_infos = AccountInfo.load_multiple(
+            context, [perp_market.event_queue for perp_market in perp_markets]
+        )
+        event_queues = [
+            PerpEventQueue.parse(
+                account_info,
+                group.slot_by_perp_market_address(
+                    perp_market.address
+                ).perp_lot_size_converter,
+            )
+            for perp_market, account_info in zip(
+                perp_markets, event_queue_account_infos
+            )
+        ]
+
+        return Keeper(
+            context,
+            group,
+            node_bank_addresses,
+            cache,
+            perp_markets,
+            event_queues,
+            stale_after,
+        )
+
+    def subscribe(self, manager: WebSocketSubscriptionManager) -> None:
+        cache_subscription = WebSocketAccountSubscription(
+            self.context, self.group.cache, Cache.parse
+        )
+        self.__add_subscription(manager, cache_subscription, self.__update_cache)
+
+        for index, perp_market in enumerate(self.perp_markets):
+            perp_market_subscription = WebSocketAccountSubscription(
+                self.context,
+                perp_market.address,
+                lambda account_info: PerpMarketDetails.parse(account_info, self.group),
+            )
+            self.__add_subscription(
+                manager,
+                perp_market_subscription,
+                lambda details, index=index: self.__update_perp_market(index, details),
+            )
+
+            lot_size_converter = self.group.slot_by_perp_market_address(
+                perp_market.address
+            ).perp_lot_size_converter
+            event_queue_subscription = WebSocketAccountSubscription(
+                self.context,
+                perp_market.event_queue,
+                lambda account_info, converter=lot_size_converter: PerpEventQueue.parse(
+                    account_info, converter
+                ),
+            )
+            self.__add_subscription(
+                manager,
+                event_queue_subscription,
+                lambda queue, index=index: self.__update_event_queue(index, queue),
+            )
+
+    def __add_subscription(
+        self,
+        manager: WebSocketSubscriptionManager,
+        subscription: WebSocketAccountSubscription[typing.Any],
+        on_next: typing.Callable[[typing.Any], None],
+    ) -> None:
+        manager.add(subscription)
+        self.__disposer.add_disposable(subscription)
+        self.__disposer.add_disposable(
+            subscription.publisher.subscribe(on_next=on_next)  # type: ignore[call-arg]
+        )
+
+    def __update_cache(self, cache: Cache) -> None:
+        self.cache = cache
+        self.updated.on_next(local_now())
+
+    def __update_perp_market(self, index: int, perp_market: PerpMarketDetails) -> None:
+        self.perp_markets[index] = perp_market
+        self.updated.on_next(local_now())
+
+    def __update_event_queue(self, index: int, event_queue: PerpEventQueue) -> None:
+        self.event_queues[index] = event_queue
+        self.updated.on_next(local_now())
+
+    def __is_stale(
+        self, key: str, last_update: typing.Optional[datetime], now: datetime
+    ) -> bool:
+        threshold = now - self.stale_after
+        if last_update is not None and last_update >= threshold:
+            return False
+        sent_at = self.__sent_at.get(key)
+        if sent_at is not None and sent_at >= threshold:
+            return False
+        self.__sent_at[key] = now
+        return True
+
+    def build_instructions(
+        self, now: typing.Optional[datetime] = None
+    ) -> CombinableInstructions:
+        now = now or utc_now()
+        cache = self.cache
+
+        token_banks = [
+            (layouts.QUOTE_INDEX, self.group.shared_quote),
+            *[
+                (slot.index, slot.base_token_bank)
+                for slot in self.group.slots
+                if slot.base_token_bank is not None
+            ],
+        ]
+        stale_root_banks: typing.List[PublicKey] = []
+        for index, token_bank in token_banks:
+            root_bank_cache = cache.root_bank_cache[index]
+            if self.__is_stale(
+                f"root bank {token_bank.root_bank_address}",
+                root_bank_cache.last_update if root_bank_cache is not None else None,
+                now,
+            ):
+                stale_root_banks += [token_bank.root_bank_address]
+
+        stale_oracles: typing.List[PublicKey] = []
+        for slot in self.group.slots:
+            price_cache = cache.price_cache[slot.index]
+            if slot.oracle is not None and self.__is_stale(
+                f"price {slot.oracle}",
+                price_cache.last_update if price_cache is not None else None,
+                now,
+            ):
+                stale_oracles += [slot.oracle]
+
+        stale_perp_market_caches: typing.List[PublicKey] = []
+        stale_fundings: typing.List[PerpMarketDetails] = []
+        for perp_market in self.perp_markets:
+            perp_market_cache = cache.perp_market_cache[perp_market.market_index]
+            if self.__is_stale(
+                f"perp market cache {perp_market.address}",
+                perp_market_cache.last_update
+                if perp_market_cache is not None
+                else None,
+                now,
+            ):
+                stale_perp_market_caches += [perp_market.address]
+            if self.__is_stale(
+                f"funding {perp_market.address}", perp_market.last_updated, now
+            ):
+                stale_fundings += [perp_market]
+
+        instructions = CombinableInstructions.empty()
+        if len(stale_root_banks) > 0:
+            instructions += build_entropy_cache_root_banks_instructions(
+                self.context, self.group, stale_root_banks
+            )
+        if len(stale_oracles) > 0:
+            instructions += build_entropy_cache_prices_instructions(
+                self.context, self.group, stale_oracles
+            )
+        if len(stale_perp_market_caches) > 0:
+            instructions += build_entropy_cache_perp_markets_instructions(
+                self.context, self.group, stale_perp_market_caches
+            )
+        for root_bank_address in stale_root_banks:
+            instructions += build_entropy_update_root_bank_instructions(
+                self.context,
+                self.group,
+                root_bank_address,
+                self.node_bank_addresses[str(root_bank_address)],
+            )
+        for perp_market in stale_fundings:
+            instructions += build_entropy_update_funding_instructions(
+                self.context, self.group, perp_market
+            )
+
+        cranked_count = 0
+        for perp_market, event_queue in zip(self.perp_markets, self.event_queues):
+            accounts_to_crank = event_queue.accounts_to_crank
+            if len(accounts_to_crank) == 0:
+                continue
+
+            # An event queue that hasn't moved past the position the last crank will reach is still
+            # waiting for that crank to land, unless it's been so long that the crank probably failed.
+            # Each websocket update is a new `PerpEventQueue`, so positions are compared rather than
+            # the objects.
+            consumed = event_queue.sequence_number - event_queue.count
+            cranked = self.__cranked.get(str(event_queue.address))
+            if (
+                cranked is not None
+                and consumed < cranked[0]
+                and cranked[1] >= now - self.stale_after
+            ):
+                continue
+
+            self.__cranked[str(event_queue.address)] = (
+                consumed + min(event_queue.count, self.consume_events_limit),
+                now,
+            )
+            instructions += build_perp_consume_events_instructions(
+                self.context,
+                self.group,
+                perp_market,
+                accounts_to_crank,
+                self.consume_events_limit,
+            )
+            cranked_count += 1
+
+        self._logger.debug(
+            f"Stale: {len(stale_root_banks)} root banks, {len(stale_oracles)} prices, {len(stale_perp_market_caches)} perp market caches, {len(stale_fundings)} fundings. Event queues to crank: {cranked_count}."
+        )
+        return instructions
+
+    def dispose(self) -> None:
+        self.__disposer.dispose()
+        self.updated.dispose()
+
+    def __str__(self) -> str:
+        return f"« Keeper [{self.group.name}] {len(self.perp_markets)} perp markets, stale after {self.stale_after} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
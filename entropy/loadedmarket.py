@@ -17,14 +17,23 @@ import abc
 import rx.operators
 import typing
 
+from decimal import Decimal
 from solana.publickey import PublicKey
 
 from .accountinfo import AccountInfo
 from .context import Context
+from .datetimes import utc_now
 from .lotsizeconverter import LotSizeConverter
 from .markets import InventorySource, MarketType, Market
 from .observables import Disposable
-from .orders import Order, OrderBook
+from .orders import (
+    BookOrder,
+    Order,
+    OrderBook,
+    OrderBookChange,
+    OrderBookSideColumns,
+    OrderBookSnapshot,
+)
 from .tokens import Instrument, Token
 from .websocketsubscription import (
     SharedWebSocketSubscriptionManager,
@@ -44,6 +53,32 @@ class FillEvent(Event, typing.Protocol):
     pass
 
 
+# # 🥭 CrankableEventQueue protocol
+#
+# The parts of an event queue needed to crank it. `sequence_number` counts every event ever added to
+# the queue and `count` is how many of those are still waiting, so `sequence_number - count` is how
+# many events have been consumed.
+#
+class CrankableEventQueue(typing.Protocol):
+    @property
+    def sequence_number(self) -> Decimal:
+        raise NotImplementedError(
+            "CrankableEventQueue.sequence_number is not implemented on the Protocol."
+        )
+
+    @property
+    def count(self) -> Decimal:
+        raise NotImplementedError(
+            "CrankableEventQueue.count is not implemented on the Protocol."
+        )
+
+    @property
+    def unprocessed_events(self) -> typing.Sequence[Event]:
+        raise NotImplementedError(
+            "CrankableEventQueue.unprocessed_events is not implemented on the Protocol."
+        )
+
+
 # # 🥭 LoadedMarket class
 #
 # This class describes a crypto market. It *must* have an address, a base token and a quote token.
@@ -115,20 +150,21 @@ class LoadedMarket(Market):
             context, [self.bids_address, self.asks_address]
         )
 
-        stored: OrderBook = self.parse_account_infos_to_orderbook(bids_info, asks_info)
+        stored_bids = self.parse_account_info_to_book_orders(bids_info)
+        stored_asks = self.parse_account_info_to_book_orders(asks_info)
 
         def _update_bids(account_info: AccountInfo) -> OrderBook:
-            new_bids = self.parse_account_info_to_orders(account_info)
-            stored.bids = new_bids
+            nonlocal stored_bids
+            stored_bids = self.parse_account_info_to_book_orders(account_info)
             return OrderBook(
-                self.symbol, self.lot_size_converter, new_bids, stored.asks
+                self.symbol, self.lot_size_converter, stored_bids, stored_asks
             )
 
         def _update_asks(account_info: AccountInfo) -> OrderBook:
-            new_asks = self.parse_account_info_to_orders(account_info)
-            stored.asks = new_asks
+            nonlocal stored_asks
+            stored_asks = self.parse_account_info_to_book_orders(account_info)
             return OrderBook(
-                self.symbol, self.lot_size_converter, stored.bids, new_asks
+                self.symbol, self.lot_size_converter, stored_bids, stored_asks
             )
 
         websocket = SharedWebSocketSubscriptionManager(context)
@@ -163,11 +199,36 @@ class LoadedMarket(Market):
             "LoadedMarket.parse_account_info_to_orders() is not implemented on the base type."
         )
 
+    # Returns the orders in one side of the book for storing in an `OrderBook`. Markets can override
+    # this to return something lighter than `Order`s, like `CompactOrder`s.
+    def parse_account_info_to_book_orders(
+        self, account_info: AccountInfo
+    ) -> typing.Sequence[BookOrder]:
+        return self.parse_account_info_to_orders(account_info)
+
+    # Returns the market's event queue parsed from its event queue account.
+    def parse_account_info_to_event_queue(
+        self, account_info: AccountInfo
+    ) -> CrankableEventQueue:
+        raise NotImplementedError(
+            "LoadedMarket.parse_account_info_to_event_queue() is not implemented on the base type."
+        )
+
+    # Returns the changes from `previous` (the orders last parsed from this side of the book) to the
+    # orders in `account_info`. Markets can override this if they can find the changes without parsing
+    # every order.
+    def parse_account_info_to_order_changes(
+        self, account_info: AccountInfo, previous: typing.Sequence[Order]
+    ) -> typing.Sequence[OrderBookChange]:
+        return OrderBookChange.between(
+            previous, self.parse_account_info_to_orders(account_info)
+        )
+
     def parse_account_infos_to_orderbook(
         self, bids_account_info: AccountInfo, asks_account_info: AccountInfo
     ) -> OrderBook:
-        bids_orderbook = self.parse_account_info_to_orders(bids_account_info)
-        asks_orderbook = self.parse_account_info_to_orders(asks_account_info)
+        bids_orderbook = self.parse_account_info_to_book_orders(bids_account_info)
+        asks_orderbook = self.parse_account_info_to_book_orders(asks_account_info)
         return OrderBook(
             self.symbol, self.lot_size_converter, bids_orderbook, asks_orderbook
         )
@@ -177,3 +238,29 @@ class LoadedMarket(Market):
             context, [self.bids_address, self.asks_address]
         )
         return self.parse_account_infos_to_orderbook(bids_info, asks_info)
+
+    # Returns the orders in one side of the book as columns, best price first. Markets can override
+    # this to decode the columns straight from the account data.
+    def parse_account_info_to_columns(
+        self, account_info: AccountInfo
+    ) -> OrderBookSideColumns:
+        return OrderBookSideColumns.from_orders(
+            self.parse_account_info_to_orders(account_info), self.lot_size_converter
+        )
+
+    def parse_account_infos_to_snapshot(
+        self, bids_account_info: AccountInfo, asks_account_info: AccountInfo
+    ) -> OrderBookSnapshot:
+        return OrderBookSnapshot.from_sides(
+            self.symbol,
+            self.lot_size_converter,
+            self.parse_account_info_to_columns(bids_account_info),
+            self.parse_account_info_to_columns(asks_account_info),
+        )
+
+    def fetch_orderbook_snapshot(self, context: Context) -> OrderBookSnapshot:
+        [bids_info, asks_info] = AccountInfo.load_multiple(
+            context, [self.bids_address, self.asks_address]
+        )
+        snapshot = self.parse_account_infos_to_snapshot(bids_info, asks_info)
+        return snapshot.unexpired_at(utc_now())
@@ -29,6 +29,8 @@ from .orderreconciler import (
 )
 from .orderreconciler import NullOrderReconciler as NullOrderReconciler
 from .orderreconciler import OrderReconciler as OrderReconciler
+from .pulsetimings import PulseTimingHistograms as PulseTimingHistograms
+from .pulsetimings import PulseTimings as PulseTimings
 from .reconciledorders import ReconciledOrders as ReconciledOrders
 from .toleranceorderreconciler import (
     ToleranceOrderReconciler as ToleranceOrderReconciler,
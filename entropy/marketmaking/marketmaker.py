@@ -16,6 +16,7 @@
 
 import logging
 import entropy
+import time
 import traceback
 import typing
 
@@ -25,12 +26,16 @@ from decimal import Decimal
 from ..observables import EventSource
 from .orderreconciler import OrderReconciler
 from .orderchain.chain import Chain
+from .pulsetimings import PulseTimings
 
 
 # # 🥭 MarketMaker class
 #
 # An event-driven market-maker.
 #
+# Every pulse publishes a `PulseTimings` through `pulse_timings`, whether the pulse completed, wasn't
+# quoting or failed, so a live market-maker can be profiled without attaching a profiler.
+#
 class MarketMaker:
     def __init__(
         self,
@@ -66,11 +71,13 @@ class MarketMaker:
 
         self.pulse_complete: EventSource[datetime] = EventSource[datetime]()
         self.pulse_error: EventSource[Exception] = EventSource[Exception]()
+        self.pulse_timings: EventSource[PulseTimings] = EventSource[PulseTimings]()
 
         self.buy_client_ids: typing.List[int] = []
         self.sell_client_ids: typing.List[int] = []
 
     def pulse(self, context: entropy.Context, model_state: entropy.ModelState) -> None:
+        timings = PulseTimings(self.market.fully_qualified_symbol, entropy.local_now())
         try:
             self._logger.debug(
                 f"[{context.name}] Pulse started with oracle price:\n    {model_state.price}"
@@ -78,7 +85,9 @@ class MarketMaker:
 
             payer = entropy.CombinableInstructions.from_wallet(self.wallet)
 
-            desired_orders = self.desired_orders_chain.process(context, model_state)
+            desired_orders = self.desired_orders_chain.process(
+                context, model_state, timings
+            )
 
             # This is here to give the orderchain the chance to look at state and set `not_quoting`. Any
             # element in the orderchain can set this, rather than just return an empty list of desired
@@ -90,6 +99,7 @@ class MarketMaker:
                 self._logger.info(
                     f"[{context.name}] Market-maker not quoting - model_state.not_quoting is set."
                 )
+                timings.outcome = "not quoting"
                 return
 
             existing_orders = model_state.current_orders()
@@ -97,9 +107,10 @@ class MarketMaker:
                 f"""Before reconciliation: all owned orders on current orderbook [{model_state.market.fully_qualified_symbol}]:
     {entropy.indent_collection_as_str(existing_orders)}"""
             )
-            reconciled = self.order_reconciler.reconcile(
-                model_state, existing_orders, desired_orders
-            )
+            with timings.time("reconcile"):
+                reconciled = self.order_reconciler.reconcile(
+                    model_state, existing_orders, desired_orders
+                )
             self._logger.debug(
                 f"""After reconciliation
 Keep:
@@ -112,6 +123,7 @@ Ignore:
     {entropy.indent_collection_as_str(reconciled.to_ignore)}"""
             )
 
+            build_started_at = time.perf_counter()
             cancellations = entropy.CombinableInstructions.empty()
             # Perp markets have a CANCEL_ALL instruction that Spot and Serum markets don't. Use it if we can.
             if reconciled.cancelling_all and isinstance(
@@ -176,7 +188,7 @@ Ignore:
             if len(cancellations.instructions) + len(place_orders.instructions) > 0:
                 prologue = self.prologue(context, model_state)
                 epilogue = self.prologue(context, model_state)
-                (
+                all_instructions = (
                     payer
                     + prologue
                     + cancellations
@@ -185,8 +197,32 @@ Ignore:
                     + settle
                     + redeem
                     + epilogue
-                ).execute(context)
+                )
+                timings.record("build", time.perf_counter() - build_started_at)
+
+                with timings.time("chunk"):
+                    chunks = all_instructions.chunks(context)
+                timings.instruction_count = len(all_instructions.instructions)
+                timings.transaction_sizes = [
+                    entropy.CombinableInstructions.transaction_size(
+                        all_instructions.signers, chunk
+                    )
+                    for chunk in chunks
+                    if len(chunk) > 0
+                ]
+
+                with timings.time("send"):
+                    all_instructions.execute_chunks(context, chunks)
+            else:
+                timings.record("build", time.perf_counter() - build_started_at)
+
+            if context.client.rpc_ranking_interval > 0:
+                self._logger.debug(
+                    f"""[{context.name}] RPC provider rankings:
+    {entropy.indent_collection_as_str(context.provider_rankings)}"""
+                )
 
+            timings.outcome = "complete"
             self.pulse_complete.on_next(entropy.local_now())
         except (
             entropy.RateLimitException,
@@ -198,12 +234,17 @@ Ignore:
             self._logger.error(
                 f"[{context.name}] Market-maker problem on pulse: {common_exception}"
             )
+            timings.outcome = "error"
             self.pulse_error.on_next(common_exception)
         except Exception as exception:
             self._logger.error(
                 f"[{context.name}] Market-maker error on pulse:\n{traceback.format_exc()}"
             )
+            timings.outcome = "error"
             self.pulse_error.on_next(exception)
+        finally:
+            self._logger.debug(f"[{context.name}] Pulse timings: {timings}")
+            self.pulse_timings.publish(timings)
 
     def __str__(self) -> str:
         return f"""« MarketMaker for market '{self.market.fully_qualified_symbol}' »"""
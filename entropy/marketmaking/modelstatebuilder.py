@@ -14,6 +14,7 @@
 #   [Email](mailto:hello@blockworks.foundation)
 
 import abc
+import asyncio
 import logging
 import entropy
 import time
@@ -87,6 +88,28 @@ class PollingModelStateBuilder(ModelStateBuilder):
             "PollingModelStateBuilder.poll() is not implemented on the base type."
         )
 
+    # Fetching the accounts and fetching the price don't depend on each other, so this runs both at
+    # the same time. The oracle's `fetch_price()` is synchronous so it runs on the default executor
+    # while the accounts are loaded on the event loop. The `Context`'s long-lived event loop is used
+    # so each poll reuses the same HTTP connections.
+    def load_account_infos_and_price(
+        self,
+        context: entropy.Context,
+        addresses: typing.Sequence[PublicKey],
+        oracle: entropy.Oracle,
+    ) -> typing.Tuple[typing.Sequence[entropy.AccountInfo], entropy.Price]:
+        async def __load() -> typing.Tuple[
+            typing.Sequence[entropy.AccountInfo], entropy.Price
+        ]:
+            loop = asyncio.get_running_loop()
+            account_infos, price = await asyncio.gather(
+                entropy.AccountInfo.load_multiple_async(context, addresses),
+                loop.run_in_executor(None, oracle.fetch_price, context),
+            )
+            return account_infos, price
+
+        return context.async_client.run(__load())
+
     def from_values(
         self,
         order_owner: PublicKey,
@@ -190,9 +213,9 @@ class SerumPollingModelStateBuilder(PollingModelStateBuilder):
             self.market.asks_address,
             self.market.event_queue_address,
         ]
-        account_infos: typing.Sequence[
-            entropy.AccountInfo
-        ] = entropy.AccountInfo.load_multiple(context, addresses)
+        account_infos, price = self.load_account_infos_and_price(
+            context, addresses, self.oracle
+        )
         group: entropy.Group = entropy.Group.parse_with_context(
             context, account_infos[0]
         )
@@ -224,8 +247,6 @@ class SerumPollingModelStateBuilder(PollingModelStateBuilder):
             account_infos[8], self.base_token, self.quote_token
         )
 
-        price: entropy.Price = self.oracle.fetch_price(context)
-
         available: Decimal = (
             base_inventory_token_account.value.value * price.mid_price
         ) + quote_inventory_token_account.value.value
@@ -295,9 +316,9 @@ class SpotPollingModelStateBuilder(PollingModelStateBuilder):
             self.market.event_queue_address,
             *self.all_open_orders_addresses,
         ]
-        account_infos: typing.Sequence[
-            entropy.AccountInfo
-        ] = entropy.AccountInfo.load_multiple(context, addresses)
+        account_infos, price = self.load_account_infos_and_price(
+            context, addresses, self.oracle
+        )
         group: entropy.Group = entropy.Group.parse_with_context(
             context, account_infos[0]
         )
@@ -365,8 +386,6 @@ class SpotPollingModelStateBuilder(PollingModelStateBuilder):
             account_infos[5], self.market.base, self.market.quote
         )
 
-        price: entropy.Price = self.oracle.fetch_price(context)
-
         return self.from_values(
             self.order_owner,
             self.market,
@@ -419,9 +438,9 @@ class PerpPollingModelStateBuilder(PollingModelStateBuilder):
             self.market.event_queue_address,
             *self.all_open_orders_addresses,
         ]
-        account_infos: typing.Sequence[
-            entropy.AccountInfo
-        ] = entropy.AccountInfo.load_multiple(context, addresses)
+        account_infos, price = self.load_account_infos_and_price(
+            context, addresses, self.oracle
+        )
         group: entropy.Group = entropy.Group.parse_with_context(
             context, account_infos[0]
         )
@@ -487,8 +506,6 @@ class PerpPollingModelStateBuilder(PollingModelStateBuilder):
             account_infos[5], self.market.lot_size_converter
         )
 
-        price: entropy.Price = self.oracle.fetch_price(context)
-
         return self.from_values(
             self.order_owner,
             self.market,
@@ -57,6 +57,7 @@ def model_state_builder_factory(
     account: entropy.Account,
     market: entropy.LoadedMarket,
     oracle: entropy.Oracle,
+    incremental_orderbook: bool = False,
 ) -> ModelStateBuilder:
     if mode == ModelUpdateMode.WEBSOCKET:
         return _websocket_model_state_builder_factory(
@@ -69,6 +70,7 @@ def model_state_builder_factory(
             account,
             market,
             oracle,
+            incremental_orderbook,
         )
     else:
         return _polling_model_state_builder_factory(
@@ -232,6 +234,7 @@ def _websocket_model_state_builder_factory(
     account: entropy.Account,
     market: entropy.LoadedMarket,
     oracle: entropy.Oracle,
+    incremental_orderbook: bool,
 ) -> ModelStateBuilder:
     group_watcher = entropy.build_group_watcher(
         context, websocket_manager, health_check, group
@@ -279,7 +282,11 @@ def _websocket_model_state_builder_factory(
         latest_orderbook_watcher: entropy.Watcher[
             entropy.OrderBook
         ] = entropy.build_orderbook_watcher(
-            context, websocket_manager, health_check, serum_market
+            context,
+            websocket_manager,
+            health_check,
+            serum_market,
+            incremental=incremental_orderbook,
         )
         latest_event_queue_watcher: entropy.Watcher[
             entropy.EventQueue
@@ -315,7 +322,11 @@ def _websocket_model_state_builder_factory(
             cache_watcher,
         )
         latest_orderbook_watcher = entropy.build_orderbook_watcher(
-            context, websocket_manager, health_check, spot_market
+            context,
+            websocket_manager,
+            health_check,
+            spot_market,
+            incremental=incremental_orderbook,
         )
         latest_event_queue_watcher = entropy.build_spot_event_queue_watcher(
             context, websocket_manager, health_check, spot_market
@@ -346,7 +357,11 @@ def _websocket_model_state_builder_factory(
             account_subscription,
         )
         latest_orderbook_watcher = entropy.build_orderbook_watcher(
-            context, websocket_manager, health_check, perp_market
+            context,
+            websocket_manager,
+            health_check,
+            perp_market,
+            incremental=incremental_orderbook,
         )
         latest_event_queue_watcher = entropy.build_perp_event_queue_watcher(
             context, websocket_manager, health_check, perp_market
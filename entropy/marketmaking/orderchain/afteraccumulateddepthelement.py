@@ -18,7 +18,6 @@ import entropy
 import typing
 
 from decimal import Decimal
-from solana.publickey import PublicKey
 
 from .element import Element
 from ...modelstate import ModelState
@@ -65,21 +64,6 @@ class AfterAccumulatedDepthElement(Element):
             args.afteraccumulateddepth_adjustment_ticks,
         )
 
-    def _accumulated_quantity_exceeds_order(
-        self,
-        orders: typing.Sequence[entropy.Order],
-        owner: PublicKey,
-        quantity: Decimal,
-    ) -> typing.Optional[entropy.Order]:
-        accumulated_quantity: Decimal = Decimal(0)
-        for order in orders:
-            if order.owner != owner:
-                accumulated_quantity += order.quantity
-            if accumulated_quantity >= quantity:
-                # Success!
-                return order
-        return None
-
     def process(
         self,
         context: entropy.Context,
@@ -90,25 +74,21 @@ class AfterAccumulatedDepthElement(Element):
         adjustment: Decimal = (
             self.adjustment_ticks * model_state.market.lot_size_converter.tick_size
         )
+        # Use the same cutoff for every order so they all see the same book.
+        cutoff = entropy.utc_now()
         for order in orders:
             new_price: typing.Optional[Decimal] = None
             depth: Decimal = self.depth or order.quantity
-            if order.side == entropy.Side.BUY:
-                place_below: typing.Optional[
-                    entropy.Order
-                ] = self._accumulated_quantity_exceeds_order(
-                    model_state.bids, model_state.order_owner, depth
-                )
-                if place_below is not None:
-                    new_price = place_below.price - adjustment
-            else:
-                place_above: typing.Optional[
-                    entropy.Order
-                ] = self._accumulated_quantity_exceeds_order(
-                    model_state.asks, model_state.order_owner, depth
-                )
-                if place_above is not None:
-                    new_price = place_above.price + adjustment
+            depth_price: typing.Optional[
+                Decimal
+            ] = model_state.orderbook.price_at_depth(
+                order.side, depth, exclude_owner=model_state.order_owner, cutoff=cutoff
+            )
+            if depth_price is not None:
+                if order.side == entropy.Side.BUY:
+                    new_price = depth_price - adjustment
+                else:
+                    new_price = depth_price + adjustment
 
             if new_price is None:
                 self._logger.debug(
@@ -19,6 +19,7 @@ import entropy
 import typing
 
 from .element import Element
+from ..pulsetimings import PulseTimings
 from ...modelstate import ModelState
 
 
@@ -35,12 +36,20 @@ class Chain:
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.elements: typing.Sequence[Element] = elements
 
+    # If `timings` is passed, the time taken by each element's `process()` is recorded in it.
     def process(
-        self, context: entropy.Context, model_state: ModelState
+        self,
+        context: entropy.Context,
+        model_state: ModelState,
+        timings: typing.Optional[PulseTimings] = None,
     ) -> typing.Sequence[entropy.Order]:
         orders: typing.Sequence[entropy.Order] = []
-        for element in self.elements:
-            orders = element.process(context, model_state, orders)
+        for index, element in enumerate(self.elements):
+            if timings is None:
+                orders = element.process(context, model_state, orders)
+            else:
+                with timings.time(f"chain[{index}] {element.__class__.__name__}"):
+                    orders = element.process(context, model_state, orders)
         return orders
 
     def __repr__(self) -> str:
@@ -49,18 +49,15 @@ class PreventPostOnlyCrossingBookElement(Element):
         orders: typing.Sequence[entropy.Order],
     ) -> typing.Sequence[entropy.Order]:
         new_orders: typing.List[entropy.Order] = []
+        cutoff = entropy.utc_now()
+        top_bid: typing.Optional[Decimal] = model_state.orderbook.top_price(
+            entropy.Side.BUY, cutoff=cutoff
+        )
+        top_ask: typing.Optional[Decimal] = model_state.orderbook.top_price(
+            entropy.Side.SELL, cutoff=cutoff
+        )
         for order in orders:
             if order.order_type == entropy.OrderType.POST_ONLY:
-                top_bid: typing.Optional[Decimal] = (
-                    model_state.top_bid.price
-                    if model_state.top_bid is not None
-                    else None
-                )
-                top_ask: typing.Optional[Decimal] = (
-                    model_state.top_ask.price
-                    if model_state.top_ask is not None
-                    else None
-                )
                 if (
                     order.side == entropy.Side.BUY
                     and top_ask is not None
@@ -18,7 +18,6 @@ import entropy
 import typing
 
 from decimal import Decimal
-from solana.publickey import PublicKey
 
 from .element import Element
 from ...modelstate import ModelState
@@ -52,15 +51,6 @@ class TopOfBookElement(Element):
     def from_command_line_parameters(args: argparse.Namespace) -> "TopOfBookElement":
         return TopOfBookElement(args.topofbook_adjustment_ticks)
 
-    def _best_order_from_someone_else(
-        self, orders: typing.Sequence[entropy.Order], owner: PublicKey
-    ) -> typing.Optional[entropy.Order]:
-        for order in orders:
-            if order.owner != owner:
-                # Success!
-                return order
-        return None
-
     def process(
         self,
         context: entropy.Context,
@@ -71,24 +61,17 @@ class TopOfBookElement(Element):
         adjustment: Decimal = (
             self.adjustment_ticks * model_state.market.lot_size_converter.tick_size
         )
+        cutoff = entropy.utc_now()
         for order in orders:
             new_price: typing.Optional[Decimal] = None
-            if order.side == entropy.Side.BUY:
-                place_above: typing.Optional[
-                    entropy.Order
-                ] = self._best_order_from_someone_else(
-                    model_state.bids, model_state.order_owner
-                )
-                if place_above is not None:
-                    new_price = place_above.price + adjustment
-            else:
-                place_below: typing.Optional[
-                    entropy.Order
-                ] = self._best_order_from_someone_else(
-                    model_state.asks, model_state.order_owner
-                )
-                if place_below is not None:
-                    new_price = place_below.price - adjustment
+            top_price: typing.Optional[Decimal] = model_state.orderbook.top_price(
+                order.side, exclude_owner=model_state.order_owner, cutoff=cutoff
+            )
+            if top_price is not None:
+                if order.side == entropy.Side.BUY:
+                    new_price = top_price + adjustment
+                else:
+                    new_price = top_price - adjustment
 
             if new_price is None:
                 self._logger.debug(
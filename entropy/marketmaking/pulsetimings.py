@@ -0,0 +1,183 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+
+import bisect
+import json
+import os
+import time
+import typing
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+# # 🥭 PulseTimings class
+#
+# How long each stage of a single `MarketMaker` pulse took, in seconds, in the order the stages ran.
+# Stages that didn't run (for instance because the pulse wasn't quoting, or failed) aren't included.
+#
+# The stages are:
+# * `chain[n] ElementName` - the `process()` call of each element in the desired orders chain
+# * `reconcile` - reconciling existing and desired orders
+# * `build` - building the cancel, place, crank, settle and redeem instructions
+# * `chunk` - splitting the instructions into transactions
+# * `send` - sending the transactions
+#
+# `transaction_sizes` are the sizes in bytes of the transactions sent, one per chunk.
+#
+@dataclass
+class PulseTimings:
+    market: str
+    started_at: datetime
+    stages: typing.List[typing.Tuple[str, float]] = field(default_factory=list)
+    transaction_sizes: typing.List[int] = field(default_factory=list)
+    instruction_count: int = 0
+    outcome: str = "incomplete"
+
+    @property
+    def total(self) -> float:
+        return sum(seconds for _, seconds in self.stages)
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.stages += [(stage, seconds)]
+
+    @contextmanager
+    def time(self, stage: str) -> typing.Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started_at)
+
+    def __str__(self) -> str:
+        stages = "\n    ".join(
+            f"{stage}: {seconds * 1000:,.3f}ms" for stage, seconds in self.stages
+        )
+        return f"""« PulseTimings [{self.market}] {self.outcome} at {self.started_at} in {self.total * 1000:,.3f}ms
+    {stages}
+    Transaction sizes: {self.transaction_sizes}
+»"""
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 PulseTimingHistograms class
+#
+# Accumulates `PulseTimings` into histograms: one of durations per stage, one of transaction sizes and
+# one of the number of transactions per pulse. Durations are bucketed in milliseconds, and each bucket
+# counts values up to and including its upper bound. The last bucket has no upper bound.
+#
+# `write()` saves the histograms as JSON, replacing the file in one step so anything reading it never
+# sees a partial write.
+#
+class PulseTimingHistograms:
+    DURATION_BOUNDS_MS: typing.Sequence[float] = [
+        0.1,
+        0.25,
+        0.5,
+        1,
+        2.5,
+        5,
+        10,
+        25,
+        50,
+        100,
+        250,
+        500,
+        1000,
+        2500,
+        5000,
+        10000,
+    ]
+    TRANSACTION_SIZE_BOUNDS: typing.Sequence[float] = [256, 512, 768, 1024, 1232]
+
+    def __init__(self) -> None:
+        self.pulse_count: int = 0
+        self.outcomes: typing.Dict[str, int] = {}
+        self.durations: typing.Dict[str, typing.List[int]] = {}
+        self.transaction_sizes: typing.List[int] = PulseTimingHistograms.__empty(
+            PulseTimingHistograms.TRANSACTION_SIZE_BOUNDS
+        )
+        self.transaction_counts: typing.Dict[int, int] = {}
+
+    def add(self, timings: PulseTimings) -> None:
+        self.pulse_count += 1
+        self.outcomes[timings.outcome] = self.outcomes.get(timings.outcome, 0) + 1
+        for stage, seconds in [*timings.stages, ("total", timings.total)]:
+            if stage not in self.durations:
+                self.durations[stage] = PulseTimingHistograms.__empty(
+                    PulseTimingHistograms.DURATION_BOUNDS_MS
+                )
+            PulseTimingHistograms.__count(
+                self.durations[stage],
+                PulseTimingHistograms.DURATION_BOUNDS_MS,
+                seconds * 1000,
+            )
+
+        for size in timings.transaction_sizes:
+            PulseTimingHistograms.__count(
+                self.transaction_sizes,
+                PulseTimingHistograms.TRANSACTION_SIZE_BOUNDS,
+                size,
+            )
+        transaction_count = len(timings.transaction_sizes)
+        self.transaction_counts[transaction_count] = (
+            self.transaction_counts.get(transaction_count, 0) + 1
+        )
+
+    def to_json(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "pulses": self.pulse_count,
+            "outcomes": dict(self.outcomes),
+            "durations_ms": {
+                "bounds": list(PulseTimingHistograms.DURATION_BOUNDS_MS),
+                "stages": {
+                    stage: list(counts) for stage, counts in self.durations.items()
+                },
+            },
+            "transaction_sizes": {
+                "bounds": list(PulseTimingHistograms.TRANSACTION_SIZE_BOUNDS),
+                "counts": list(self.transaction_sizes),
+            },
+            "transactions_per_pulse": {
+                str(count): pulses
+                for count, pulses in sorted(self.transaction_counts.items())
+            },
+        }
+
+    def write(self, filename: str) -> None:
+        temporary_filename = f"{filename}.tmp"
+        with open(temporary_filename, "w") as json_file:
+            json.dump(self.to_json(), json_file, indent=4)
+        os.replace(temporary_filename, filename)
+
+    @staticmethod
+    def __empty(bounds: typing.Sequence[float]) -> typing.List[int]:
+        return [0] * (len(bounds) + 1)
+
+    @staticmethod
+    def __count(
+        counts: typing.List[int], bounds: typing.Sequence[float], value: float
+    ) -> None:
+        counts[bisect.bisect_left(bounds, value)] += 1
+
+    def __str__(self) -> str:
+        return f"« PulseTimingHistograms [{self.pulse_count} pulses, stages: {list(self.durations.keys())}] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
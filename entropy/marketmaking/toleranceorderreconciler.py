@@ -41,17 +41,24 @@ from .reconciledorders import ReconciledOrders
 # * ID and Client ID are ignored when matching.
 # * ModelState is ignored when matching.
 #
+# With `indexed` matching (the default) existing orders are bucketed by side and sorted by price, so
+# each desired order only checks the existing orders inside its price-tolerance window, found by
+# binary search. It picks exactly the order the linear `find_acceptable_order()` scan would - the
+# earliest remaining acceptable existing order - so the results are the same either way.
+#
 class ToleranceOrderReconciler(OrderReconciler):
     def __init__(
         self,
         price_tolerance: Decimal,
         quantity_tolerance: Decimal,
         time_in_force_tolerance: timedelta,
+        indexed: bool = True,
     ) -> None:
         super().__init__()
         self.price_tolerance: Decimal = price_tolerance
         self.quantity_tolerance: Decimal = quantity_tolerance
         self.time_in_force_tolerance: timedelta = time_in_force_tolerance
+        self.indexed: bool = indexed
 
     @staticmethod
     def zero_tolerance_order_reconciler() -> "ToleranceOrderReconciler":
@@ -62,6 +69,30 @@ class ToleranceOrderReconciler(OrderReconciler):
         _: ModelState,
         existing_orders: typing.Sequence[entropy.Order],
         desired_orders: typing.Sequence[entropy.Order],
+    ) -> ReconciledOrders:
+        if self.indexed and self.__can_index(existing_orders, desired_orders):
+            outcomes = self.__reconcile_indexed(existing_orders, desired_orders)
+        else:
+            outcomes = self.__reconcile_linear(existing_orders, desired_orders)
+
+        in_count = len(existing_orders) + len(desired_orders)
+        out_count = (
+            len(outcomes.to_place)
+            + len(outcomes.to_cancel)
+            + len(outcomes.to_keep)
+            + len(outcomes.to_ignore)
+        )
+        if in_count != out_count:
+            raise Exception(
+                f"Failure processing all desired orders. Count of orders in: {in_count}. Count of orders out: {out_count}."
+            )
+
+        return outcomes
+
+    def __reconcile_linear(
+        self,
+        existing_orders: typing.Sequence[entropy.Order],
+        desired_orders: typing.Sequence[entropy.Order],
     ) -> ReconciledOrders:
         remaining_existing_orders: typing.List[entropy.Order] = list(existing_orders)
         outcomes: ReconciledOrders = ReconciledOrders()
@@ -77,21 +108,96 @@ class ToleranceOrderReconciler(OrderReconciler):
         # By this point we have removed all acceptable existing orders, so those that remain
         # should be cancelled.
         outcomes.to_cancel = remaining_existing_orders
+        return outcomes
 
-        in_count = len(existing_orders) + len(desired_orders)
-        out_count = (
-            len(outcomes.to_place)
-            + len(outcomes.to_cancel)
-            + len(outcomes.to_keep)
-            + len(outcomes.to_ignore)
+    # The price checks in `is_within_tolderance()` only pick out a contiguous run of existing orders
+    # sorted by price when no price is negative and the tolerance isn't negative. Anything else uses
+    # the linear scan.
+    def __can_index(
+        self,
+        existing_orders: typing.Sequence[entropy.Order],
+        desired_orders: typing.Sequence[entropy.Order],
+    ) -> bool:
+        if self.price_tolerance < 0:
+            return False
+        return all(order.price >= 0 for order in existing_orders) and all(
+            order.price >= 0 for order in desired_orders
         )
-        if in_count != out_count:
-            raise Exception(
-                f"Failure processing all desired orders. Count of orders in: {in_count}. Count of orders out: {out_count}."
+
+    def __reconcile_indexed(
+        self,
+        existing_orders: typing.Sequence[entropy.Order],
+        desired_orders: typing.Sequence[entropy.Order],
+    ) -> ReconciledOrders:
+        # Each side's remaining existing orders, as parallel lists sorted by (price, position in
+        # `existing_orders`).
+        prices: typing.Dict[entropy.Side, typing.List[Decimal]] = {}
+        positions: typing.Dict[entropy.Side, typing.List[int]] = {}
+        for position in sorted(
+            range(len(existing_orders)), key=lambda p: existing_orders[p].price
+        ):
+            side = existing_orders[position].side
+            prices.setdefault(side, []).append(existing_orders[position].price)
+            positions.setdefault(side, []).append(position)
+
+        kept: typing.Set[int] = set()
+        outcomes: ReconciledOrders = ReconciledOrders()
+        for desired in desired_orders:
+            side_prices = prices.get(desired.side, [])
+            side_positions = positions.get(desired.side, [])
+            tolerance = self.price_tolerance
+
+            # Existing prices too low for `desired` come first, then those in the window, then those
+            # too high - these are the same comparisons `is_within_tolderance()` makes.
+            start = ToleranceOrderReconciler.__first_index(
+                side_prices, lambda price: desired.price <= price + price * tolerance
+            )
+            end = ToleranceOrderReconciler.__first_index(
+                side_prices, lambda price: desired.price < price - price * tolerance
             )
 
+            # The linear scan takes the earliest acceptable order in `existing_orders`, so do the same.
+            acceptable_index: typing.Optional[int] = None
+            for index in range(start, end):
+                position = side_positions[index]
+                if (
+                    acceptable_index is None
+                    or position < side_positions[acceptable_index]
+                ) and self.is_within_tolderance(existing_orders[position], desired):
+                    acceptable_index = index
+
+            if acceptable_index is None:
+                outcomes.to_place += [desired]
+            else:
+                position = side_positions[acceptable_index]
+                outcomes.to_keep += [existing_orders[position]]
+                outcomes.to_ignore += [desired]
+                kept.add(position)
+                del side_prices[acceptable_index]
+                del side_positions[acceptable_index]
+
+        outcomes.to_cancel = [
+            order
+            for position, order in enumerate(existing_orders)
+            if position not in kept
+        ]
         return outcomes
 
+    # The first index in `prices` (sorted ascending) for which `predicate` is true, where `predicate`
+    # is false for all lower prices and true for all higher ones.
+    @staticmethod
+    def __first_index(
+        prices: typing.Sequence[Decimal], predicate: typing.Callable[[Decimal], bool]
+    ) -> int:
+        low, high = 0, len(prices)
+        while low < high:
+            middle = (low + high) // 2
+            if predicate(prices[middle]):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
     def find_acceptable_order(
         self, desired: entropy.Order, existing_orders: typing.Sequence[entropy.Order]
     ) -> typing.Optional[entropy.Order]:
@@ -14,7 +14,9 @@
 #   [Email](mailto:hello@blockworks.foundation)
 
 
+import bisect
 import enum
+import numpy
 import pandas
 import pyserum.enums
 import typing
@@ -26,7 +28,7 @@ from pyserum.market.types import Order as PySerumOrder
 from solana.publickey import PublicKey
 
 from .constants import SYSTEM_PROGRAM_ADDRESS
-from .datetimes import utc_now, datetime_from_timestamp
+from .datetimes import datetime_from_chain, datetime_from_timestamp, utc_now
 from .lotsizeconverter import LotSizeConverter
 
 
@@ -186,6 +188,13 @@ class Order:
             return False
         return True
 
+    def is_owned_by(self, owner: PublicKey) -> bool:
+        return self.owner == owner
+
+    # An `Order` is already the public view of itself - see `BookOrder`.
+    def to_order(self) -> "Order":
+        return self
+
     # Returns an identical order with the provided values changed.
     def with_update(
         self,
@@ -305,20 +314,472 @@ class Order:
         return f"{self}"
 
 
+# # 🥭 OrderLotConverter protocol
+#
+# Converts the raw on-chain price and quantity lots of a `CompactOrder` to the `Decimal`s used by
+# `Order`.
+#
+class OrderLotConverter(typing.Protocol):
+    def price_from_lots(self, price_lots: int) -> Decimal:
+        raise NotImplementedError(
+            "OrderLotConverter.price_from_lots() is not implemented on the Protocol."
+        )
+
+    def quantity_from_lots(self, quantity_lots: int) -> Decimal:
+        raise NotImplementedError(
+            "OrderLotConverter.quantity_from_lots() is not implemented on the Protocol."
+        )
+
+
+# # 🥭 CompactOrder class
+#
+# A small, slotted representation of an order on the book, holding the raw values as they are
+# on-chain: integer price and quantity lots, the owner's 32 bytes and the on-chain timestamp.
+#
+# Nothing is converted until it's asked for - `price`, `quantity`, `owner`, `timestamp` and
+# `expiration` are all decoded on access - so building thousands of these per book refresh is cheap.
+# `to_order()` gives the public `Order` view (built once, then reused).
+#
+# Perp markets hand these to `OrderBook`, which stores them as they are and only calls `to_order()`
+# for the orders read through its public API.
+#
+class CompactOrder:
+    __slots__ = (
+        "id",
+        "client_id",
+        "side",
+        "quantity_lots",
+        "time_in_force",
+        "__owner",
+        "__timestamp",
+        "__converter",
+        "__order",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        client_id: int,
+        side: Side,
+        quantity_lots: int,
+        owner: bytes,
+        timestamp: int,
+        time_in_force: int,
+        converter: OrderLotConverter,
+    ) -> None:
+        self.id: int = id
+        self.client_id: int = client_id
+        self.side: Side = side
+        self.quantity_lots: int = quantity_lots
+        self.time_in_force: int = time_in_force
+        self.__owner: bytes = owner
+        self.__timestamp: int = timestamp
+        self.__converter: OrderLotConverter = converter
+        self.__order: typing.Optional[Order] = None
+
+    # The high 64 bits of the order ID are the price in lots.
+    @property
+    def price_lots(self) -> int:
+        return self.id >> 64
+
+    @property
+    def price(self) -> Decimal:
+        return self.__converter.price_from_lots(self.price_lots)
+
+    @property
+    def quantity(self) -> Decimal:
+        return self.__converter.quantity_from_lots(self.quantity_lots)
+
+    @property
+    def owner(self) -> PublicKey:
+        return PublicKey(self.__owner)
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime_from_chain(self.__timestamp)
+
+    @property
+    def expiration(self) -> datetime:
+        if self.time_in_force == 0:
+            return Order.NoExpiration
+        return self.timestamp + timedelta(seconds=float(self.time_in_force))
+
+    def is_expired_at(self, cutoff: typing.Optional[datetime]) -> bool:
+        if cutoff is None or self.time_in_force == 0:
+            return False
+        return self.expiration <= cutoff
+
+    def is_owned_by(self, owner: PublicKey) -> bool:
+        return self.__owner == bytes(owner)
+
+    # Returns an identical order with a different quantity - used when an order is partially filled.
+    def with_quantity_lots(self, quantity_lots: int) -> "CompactOrder":
+        return CompactOrder(
+            self.id,
+            self.client_id,
+            self.side,
+            quantity_lots,
+            self.__owner,
+            self.__timestamp,
+            self.time_in_force,
+            self.__converter,
+        )
+
+    def to_order(self) -> Order:
+        if self.__order is None:
+            timestamp = self.timestamp
+            expiration = Order.NoExpiration
+            if self.time_in_force != 0:
+                expiration = timestamp + timedelta(seconds=float(self.time_in_force))
+            self.__order = Order(
+                self.id,
+                self.client_id,
+                self.owner,
+                self.side,
+                self.price,
+                self.quantity,
+                OrderType.UNKNOWN,
+                timestamp=timestamp,
+                expiration=expiration,
+            )
+        return self.__order
+
+    def __str__(self) -> str:
+        return f"« CompactOrder {self.side} {self.quantity_lots} lots at {self.price_lots} lots [ID: {self.id} / {self.client_id}] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 BookOrder protocol
+#
+# What `OrderBook` needs from the orders it stores. Both `Order` and `CompactOrder` are `BookOrder`s,
+# so markets can give the book whichever they decode, and `to_order()` gives the `Order` the book's
+# public API returns.
+#
+class BookOrder(typing.Protocol):
+    @property
+    def id(self) -> int:
+        raise NotImplementedError("BookOrder.id is not implemented on the Protocol.")
+
+    @property
+    def side(self) -> Side:
+        raise NotImplementedError("BookOrder.side is not implemented on the Protocol.")
+
+    @property
+    def price(self) -> Decimal:
+        raise NotImplementedError("BookOrder.price is not implemented on the Protocol.")
+
+    @property
+    def quantity(self) -> Decimal:
+        raise NotImplementedError(
+            "BookOrder.quantity is not implemented on the Protocol."
+        )
+
+    @property
+    def expiration(self) -> datetime:
+        raise NotImplementedError(
+            "BookOrder.expiration is not implemented on the Protocol."
+        )
+
+    def is_expired_at(self, cutoff: typing.Optional[datetime]) -> bool:
+        raise NotImplementedError(
+            "BookOrder.is_expired_at() is not implemented on the Protocol."
+        )
+
+    def is_owned_by(self, owner: PublicKey) -> bool:
+        raise NotImplementedError(
+            "BookOrder.is_owned_by() is not implemented on the Protocol."
+        )
+
+    def to_order(self) -> Order:
+        raise NotImplementedError(
+            "BookOrder.to_order() is not implemented on the Protocol."
+        )
+
+
+# # 🥭 PriceLevel class
+#
+# All the orders on one side of an `OrderBook` at a single price, along with the total quantity of
+# that level and all better-priced levels before it.
+#
+@dataclass(frozen=True)
+class PriceLevel:
+    price: Decimal
+    quantity: Decimal
+    cumulative_quantity: Decimal
+    order_count: int
+
+    def __str__(self) -> str:
+        return f"« PriceLevel {self.quantity:,.8f} at {self.price:.8f} [{self.order_count} orders, cumulative {self.cumulative_quantity:,.8f}] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 OrderBookChangeType enum
+#
+# How an order on one side of the book changed between two versions of that side:
+# * ADD - the order is new.
+# * REMOVE - the order is gone. The book alone can't tell if it was cancelled or completely filled -
+#   the event queue has that.
+# * FILL - the order's quantity went down, so it was partially filled.
+#
+# An order's quantity can't go up, but if it ever appears to, that's a REMOVE followed by an ADD.
+#
+class OrderBookChangeType(enum.Enum):
+    ADD = "ADD"
+    REMOVE = "REMOVE"
+    FILL = "FILL"
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 OrderBookChange class
+#
+# A single change to one order on one side of the book. `order` is the order as it is now (or as it
+# was, for a REMOVE) and `previous_quantity` is its quantity before the change (zero for an ADD).
+#
+@dataclass(frozen=True)
+class OrderBookChange:
+    change_type: OrderBookChangeType
+    order: Order
+    previous_quantity: Decimal
+
+    # All the changes needed to go from `previous` to `current`, matched by order ID. Removals come
+    # first, in `previous` order, followed by additions and fills in `current` order.
+    @staticmethod
+    def between(
+        previous: typing.Sequence[Order], current: typing.Sequence[Order]
+    ) -> typing.Sequence["OrderBookChange"]:
+        previous_by_id: typing.Dict[int, Order] = {
+            order.id: order for order in previous
+        }
+        current_by_id: typing.Dict[int, Order] = {order.id: order for order in current}
+        changes: typing.List[OrderBookChange] = []
+        for earlier in previous:
+            later = current_by_id.get(earlier.id)
+            if later is None or later.quantity > earlier.quantity:
+                changes += [OrderBookChange.remove(earlier)]
+
+        for order in current:
+            earlier_or_none = previous_by_id.get(order.id)
+            if earlier_or_none is None or order.quantity > earlier_or_none.quantity:
+                changes += [OrderBookChange.add(order)]
+            elif order.quantity < earlier_or_none.quantity:
+                changes += [OrderBookChange.fill(order, earlier_or_none.quantity)]
+
+        return changes
+
+    @staticmethod
+    def add(order: Order) -> "OrderBookChange":
+        return OrderBookChange(OrderBookChangeType.ADD, order, Decimal(0))
+
+    @staticmethod
+    def remove(order: Order) -> "OrderBookChange":
+        return OrderBookChange(OrderBookChangeType.REMOVE, order, order.quantity)
+
+    @staticmethod
+    def fill(order: Order, previous_quantity: Decimal) -> "OrderBookChange":
+        return OrderBookChange(OrderBookChangeType.FILL, order, previous_quantity)
+
+    def __str__(self) -> str:
+        return f"« OrderBookChange {self.change_type} {self.order.side} [ID: {self.order.id}] {self.previous_quantity:,.8f} -> {self.order.quantity if self.change_type != OrderBookChangeType.REMOVE else Decimal(0):,.8f} at {self.order.price:.8f} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 PriceLevelIndex class
+#
+# The `PriceLevel`s built from some orders on one side of the book, best price first, with the bisectable
+# keys and prefix sums needed to answer depth queries in O(log n).
+#
+class _PriceLevelIndex:
+    def __init__(self, side: Side, orders: typing.Sequence[BookOrder]) -> None:
+        self.side: Side = side
+        quantities: typing.Dict[Decimal, Decimal] = {}
+        counts: typing.Dict[Decimal, int] = {}
+        for order in orders:
+            price = order.price
+            quantities[price] = quantities.get(price, Decimal(0)) + order.quantity
+            counts[price] = counts.get(price, 0) + 1
+
+        levels: typing.List[PriceLevel] = []
+        cumulative_quantity = Decimal(0)
+        for price in sorted(quantities, reverse=side == Side.BUY):
+            cumulative_quantity += quantities[price]
+            levels += [
+                PriceLevel(price, quantities[price], cumulative_quantity, counts[price])
+            ]
+
+        self.levels: typing.Sequence[PriceLevel] = levels
+        self.__keys: typing.Sequence[Decimal] = [
+            self.__key(level.price) for level in levels
+        ]
+        self.__cumulative_quantities: typing.Sequence[Decimal] = [
+            level.cumulative_quantity for level in levels
+        ]
+
+    @property
+    def top_price(self) -> typing.Optional[Decimal]:
+        return self.levels[0].price if len(self.levels) > 0 else None
+
+    # Total quantity of all levels priced at `price` or better.
+    def depth_at(self, price: Decimal) -> Decimal:
+        index = bisect.bisect_right(self.__keys, self.__key(price))
+        if index == 0:
+            return Decimal(0)
+        return self.__cumulative_quantities[index - 1]
+
+    # Price of the first level where the accumulated quantity reaches `quantity`.
+    def price_at_depth(self, quantity: Decimal) -> typing.Optional[Decimal]:
+        index = bisect.bisect_left(self.__cumulative_quantities, quantity)
+        if index >= len(self.levels):
+            return None
+        return self.levels[index].price
+
+    # Bisect needs keys in ascending order, so bid prices are negated - the best bid is the highest.
+    def __key(self, price: Decimal) -> Decimal:
+        return -price if self.side == Side.BUY else price
+
+
+# # 🥭 OrderBookSideView class
+#
+# The unexpired orders on one side of an `OrderBook`, best first, as they were for every cutoff
+# from `valid_from` up to (but not including) `valid_until`. `None` means 'unbounded'.
+#
+# The `Order`s for `orders` and the price level indexes are only built the first time something asks
+# for them, and there's one index per excluded owner (usually just 'nobody' and the current account).
+#
+class _OrderBookSideView:
+    def __init__(
+        self,
+        side: Side,
+        entries: typing.Sequence[BookOrder],
+        valid_from: typing.Optional[datetime],
+        valid_until: typing.Optional[datetime],
+    ) -> None:
+        self.side: Side = side
+        self.entries: typing.Sequence[BookOrder] = entries
+        self.valid_from: typing.Optional[datetime] = valid_from
+        self.valid_until: typing.Optional[datetime] = valid_until
+        self.__orders: typing.Optional[typing.Sequence[Order]] = None
+        self.__indexes: typing.Dict[str, _PriceLevelIndex] = {}
+
+    @property
+    def orders(self) -> typing.Sequence[Order]:
+        orders = self.__orders
+        if orders is None:
+            orders = [entry.to_order() for entry in self.entries]
+            self.__orders = orders
+        return orders
+
+    @property
+    def top(self) -> typing.Optional[Order]:
+        # Top-of-book is always at index 0 for us.
+        return self.entries[0].to_order() if len(self.entries) > 0 else None
+
+    def covers(self, cutoff: datetime) -> bool:
+        if self.valid_from is not None and cutoff < self.valid_from:
+            return False
+        if self.valid_until is not None and cutoff >= self.valid_until:
+            return False
+        return True
+
+    def index(
+        self, exclude_owner: typing.Optional[PublicKey] = None
+    ) -> _PriceLevelIndex:
+        key = "" if exclude_owner is None else str(exclude_owner)
+        index = self.__indexes.get(key)
+        if index is None:
+            entries = self.entries
+            if exclude_owner is not None:
+                entries = [
+                    entry for entry in entries if not entry.is_owned_by(exclude_owner)
+                ]
+            index = _PriceLevelIndex(self.side, entries)
+            self.__indexes[key] = index
+        return index
+
+
+# # 🥭 OrderBookSide class
+#
+# Holds all the orders on one side of an `OrderBook`, as the `BookOrder`s the book was given, and
+# caches the view of the unexpired orders.
+#
+# The cached view stays valid until the cutoff passes the next expiration time (or moves back
+# before the previous one), so repeated `bids`/`top_bid`/`mid_price` calls don't rescan the orders.
+# The whole `OrderBookSide` is replaced when the book changes, so there's nothing to invalidate.
+#
+class _OrderBookSide:
+    def __init__(self, side: Side, entries: typing.Sequence[BookOrder]) -> None:
+        self.side: Side = side
+        self.entries: typing.Sequence[BookOrder] = entries
+        self.__expirations: typing.Sequence[datetime] = sorted(
+            entry.expiration
+            for entry in entries
+            if entry.expiration != Order.NoExpiration
+        )
+        self.__unfiltered: _OrderBookSideView = _OrderBookSideView(
+            side, entries, None, None
+        )
+        self.__cached: typing.Optional[_OrderBookSideView] = None
+
+    def view_at(self, cutoff: typing.Optional[datetime]) -> _OrderBookSideView:
+        if cutoff is None:
+            return self.__unfiltered
+
+        # Take a local reference - another thread may replace the cached view.
+        cached = self.__cached
+        if cached is not None and cached.covers(cutoff):
+            return cached
+
+        # `is_expired_at()` treats an expiration equal to the cutoff as expired.
+        expired_count = bisect.bisect_right(self.__expirations, cutoff)
+        valid_from = (
+            self.__expirations[expired_count - 1] if expired_count > 0 else None
+        )
+        valid_until = (
+            self.__expirations[expired_count]
+            if expired_count < len(self.__expirations)
+            else None
+        )
+        if expired_count == 0:
+            entries = self.entries
+        else:
+            entries = [
+                entry for entry in self.entries if not entry.is_expired_at(cutoff)
+            ]
+
+        view = _OrderBookSideView(self.side, entries, valid_from, valid_until)
+        self.__cached = view
+        return view
+
+
+# # 🥭 OrderBook class
+#
+# Both sides of a market's order book. The book can be built from any `BookOrder`s - perp markets
+# give it `CompactOrder`s - but everything it returns is an `Order`.
+#
 class OrderBook:
     def __init__(
         self,
         symbol: str,
         lot_size_converter: LotSizeConverter,
-        bids: typing.Sequence[Order],
-        asks: typing.Sequence[Order],
+        bids: typing.Sequence[BookOrder],
+        asks: typing.Sequence[BookOrder],
     ) -> None:
         self.symbol: str = symbol
         self.__lot_size_converter: LotSizeConverter = lot_size_converter
-        self.__bids: typing.Sequence[Order] = []
-        self.__asks: typing.Sequence[Order] = []
-        self.bids = bids
-        self.asks = asks
+        self.__bids: _OrderBookSide = _OrderBookSide(Side.BUY, [])
+        self.__asks: _OrderBookSide = _OrderBookSide(Side.SELL, [])
+        self.replace_orders(Side.BUY, bids)
+        self.replace_orders(Side.SELL, asks)
 
     @property
     def bids(self) -> typing.Sequence[Order]:
@@ -326,10 +787,7 @@ class OrderBook:
 
     @bids.setter
     def bids(self, bids: typing.Sequence[Order]) -> None:
-        """Sort bids high to low, so best bid is at index 0"""
-        bids_list: typing.List[Order] = list(bids)
-        bids_list.sort(key=lambda order: order.id, reverse=True)
-        self.__bids = bids_list
+        self.replace_orders(Side.BUY, bids)
 
     @property
     def asks(self) -> typing.Sequence[Order]:
@@ -337,10 +795,56 @@ class OrderBook:
 
     @asks.setter
     def asks(self, asks: typing.Sequence[Order]) -> None:
-        """Sets asks low to high, so best ask is at index 0"""
-        asks_list: typing.List[Order] = list(asks)
-        asks_list.sort(key=lambda order: order.id)
-        self.__asks = asks_list
+        self.replace_orders(Side.SELL, asks)
+
+    # Replaces all the orders on one side of the book. Bids are sorted high to low and asks low to high,
+    # so the best order is at index 0.
+    def replace_orders(self, side: Side, orders: typing.Sequence[BookOrder]) -> None:
+        entries: typing.List[BookOrder] = list(orders)
+        entries.sort(key=lambda entry: entry.id, reverse=side == Side.BUY)
+        if side == Side.BUY:
+            self.__bids = _OrderBookSide(Side.BUY, entries)
+        else:
+            self.__asks = _OrderBookSide(Side.SELL, entries)
+
+    # Updates one side of the book in place from a set of `OrderBookChange`s, keeping unchanged orders
+    # as they are and inserting new orders where they belong, so the side doesn't need re-sorting.
+    def apply_changes(
+        self, side: Side, changes: typing.Sequence[OrderBookChange]
+    ) -> None:
+        if len(changes) == 0:
+            return
+
+        book_side = self.__bids if side == Side.BUY else self.__asks
+        removed: typing.Set[int] = set()
+        filled: typing.Dict[int, BookOrder] = {}
+        added: typing.List[BookOrder] = []
+        for change in changes:
+            if change.change_type == OrderBookChangeType.REMOVE:
+                removed.add(change.order.id)
+            elif change.change_type == OrderBookChangeType.FILL:
+                filled[change.order.id] = change.order
+            else:
+                added += [change.order]
+
+        orders: typing.List[BookOrder] = [
+            filled.get(order.id, order)
+            for order in book_side.entries
+            if order.id not in removed
+        ]
+
+        # Bids are sorted by ID high to low, asks low to high - see `replace_orders()`.
+        direction = -1 if side == Side.BUY else 1
+        keys: typing.List[int] = [order.id * direction for order in orders]
+        for order in added:
+            position = bisect.bisect_right(keys, order.id * direction)
+            keys.insert(position, order.id * direction)
+            orders.insert(position, order)
+
+        if side == Side.BUY:
+            self.__bids = _OrderBookSide(Side.BUY, orders)
+        else:
+            self.__asks = _OrderBookSide(Side.SELL, orders)
 
     # The top bid is the highest price someone is willing to pay to BUY
     @property
@@ -361,40 +865,110 @@ class OrderBook:
     def spread(self) -> Decimal:
         return self.spread_at(cutoff=utc_now())
 
+    # Bid price levels, best (highest) price first.
+    @property
+    def bid_levels(self) -> typing.Sequence[PriceLevel]:
+        return self.bid_levels_at(cutoff=utc_now())
+
+    # Ask price levels, best (lowest) price first.
+    @property
+    def ask_levels(self) -> typing.Sequence[PriceLevel]:
+        return self.ask_levels_at(cutoff=utc_now())
+
     def bids_at(
         self, cutoff: typing.Optional[datetime] = None
     ) -> typing.Sequence[Order]:
-        return list([o for o in self.__bids if not o.is_expired_at(cutoff)])
+        return self.__bids.view_at(cutoff).orders
 
     def asks_at(
         self, cutoff: typing.Optional[datetime] = None
     ) -> typing.Sequence[Order]:
-        return list([o for o in self.__asks if not o.is_expired_at(cutoff)])
+        return self.__asks.view_at(cutoff).orders
 
     def orders_at(
         self, cutoff: typing.Optional[datetime] = None
     ) -> typing.Sequence[Order]:
         return [*self.bids_at(cutoff), *self.asks_at(cutoff)]
 
+    def bid_levels_at(
+        self, cutoff: typing.Optional[datetime] = None
+    ) -> typing.Sequence[PriceLevel]:
+        return self.__bids.view_at(cutoff).index().levels
+
+    def ask_levels_at(
+        self, cutoff: typing.Optional[datetime] = None
+    ) -> typing.Sequence[PriceLevel]:
+        return self.__asks.view_at(cutoff).index().levels
+
+    # Total quantity on the `side` of the book priced at `price` or better - for BUYs that's at
+    # `price` or higher, for SELLs it's at `price` or lower. Orders from `exclude_owner` aren't counted.
+    def depth_at(
+        self,
+        side: Side,
+        price: Decimal,
+        exclude_owner: typing.Optional[PublicKey] = None,
+        cutoff: typing.Optional[datetime] = None,
+    ) -> Decimal:
+        return self.__index(side, exclude_owner, cutoff).depth_at(price)
+
+    # Best price on the `side` of the book, ignoring orders from `exclude_owner`.
+    def top_price(
+        self,
+        side: Side,
+        exclude_owner: typing.Optional[PublicKey] = None,
+        cutoff: typing.Optional[datetime] = None,
+    ) -> typing.Optional[Decimal]:
+        return self.__index(side, exclude_owner, cutoff).top_price
+
+    # Price of the first level where the accumulated quantity on the `side` of the book, starting from
+    # the top and ignoring orders from `exclude_owner`, reaches `quantity`. Returns `None` if the
+    # whole side doesn't add up to `quantity`.
+    def price_at_depth(
+        self,
+        side: Side,
+        quantity: Decimal,
+        exclude_owner: typing.Optional[PublicKey] = None,
+        cutoff: typing.Optional[datetime] = None,
+    ) -> typing.Optional[Decimal]:
+        return self.__index(side, exclude_owner, cutoff).price_at_depth(quantity)
+
+    # Total quantity on the `side` of the book from the top price to `ticks` ticks away from it,
+    # ignoring orders from `exclude_owner`.
+    def depth_within_ticks(
+        self,
+        side: Side,
+        ticks: Decimal,
+        exclude_owner: typing.Optional[PublicKey] = None,
+        cutoff: typing.Optional[datetime] = None,
+    ) -> Decimal:
+        index = self.__index(side, exclude_owner, cutoff)
+        top_price = index.top_price
+        if top_price is None:
+            return Decimal(0)
+        distance = ticks * self.__lot_size_converter.tick_size
+        limit = top_price - distance if side == Side.BUY else top_price + distance
+        return index.depth_at(limit)
+
+    def __index(
+        self,
+        side: Side,
+        exclude_owner: typing.Optional[PublicKey],
+        cutoff: typing.Optional[datetime],
+    ) -> _PriceLevelIndex:
+        book_side = self.__bids if side == Side.BUY else self.__asks
+        return book_side.view_at(cutoff).index(exclude_owner)
+
     # The top bid is the highest price someone is willing to pay to BUY
     def top_bid_at(
         self, cutoff: typing.Optional[datetime] = None
     ) -> typing.Optional[Order]:
-        bids = self.bids_at(cutoff)
-        if bids and len(bids) > 0:
-            # Top-of-book is always at index 0 for us.
-            return bids[0]
-        return None
+        return self.__bids.view_at(cutoff).top
 
     # The top ask is the lowest price someone is willing to pay to SELL
     def top_ask_at(
         self, cutoff: typing.Optional[datetime] = None
     ) -> typing.Optional[Order]:
-        asks = self.asks_at(cutoff)
-        if asks and len(asks) > 0:
-            # Top-of-book is always at index 0 for us.
-            return asks[0]
-        return None
+        return self.__asks.view_at(cutoff).top
 
     # The mid price is halfway between the best bid and best ask.
     def mid_price_at(
@@ -423,52 +997,25 @@ class OrderBook:
     ) -> typing.Sequence[Order]:
         return list([o for o in self.orders_at(cutoff) if o.owner == owner_address])
 
-    def to_dataframe(self) -> pandas.DataFrame:
-        column_mapper = {
-            "id": "Id",
-            "client_id": "ClientId",
-            "owner": "Owner",
-            "side": "Side",
-            "price": "Price",
-            "quantity": "Quantity",
-            "timestamp": "Timestamp",
-            "expiration": "Expiration",
-        }
-
-        frame: pandas.DataFrame = pandas.DataFrame([*reversed(self.bids), *self.asks])
-        frame = frame.drop(["order_type"], axis=1)
-        frame = frame.rename(mapper=column_mapper, axis=1, copy=True)
-        frame["Price"] = pandas.to_numeric(frame["Price"])
-        frame["QuantityLots"] = frame["Quantity"].apply(
-            self.__lot_size_converter.base_size_number_to_lots
+    def snapshot(self) -> "OrderBookSnapshot":
+        return OrderBookSnapshot.from_sides(
+            self.symbol,
+            self.__lot_size_converter,
+            OrderBookSideColumns.from_orders(self.bids, self.__lot_size_converter),
+            OrderBookSideColumns.from_orders(self.asks, self.__lot_size_converter),
         )
-        frame["Quantity"] = pandas.to_numeric(frame["Quantity"])
-        frame["PriceLots"] = pandas.to_numeric(frame["Id"].apply(Order.read_price))
-        frame["SequenceNumber"] = frame["Id"].apply(Order.read_sequence_number)
 
-        return frame
+    def to_dataframe(self) -> pandas.DataFrame:
+        return self.snapshot().to_l3_dataframe()
 
     def to_l1_dataframe(self) -> pandas.DataFrame:
-        frame: pandas.DataFrame = self.to_l2_dataframe()
-        buys = frame[(frame["Side"] == Side.BUY)]
-        sells = frame[(frame["Side"] == Side.SELL)]
-        top = frame.loc[[buys["PriceLots"].idxmax(), sells["PriceLots"].idxmin()]]
-        return typing.cast(pandas.DataFrame, top)
+        return self.snapshot().to_l1_dataframe()
 
     def to_l2_dataframe(self) -> pandas.DataFrame:
-        frame: pandas.DataFrame = self.to_dataframe()
-
-        return frame.groupby("Price").agg(
-            {
-                "PriceLots": "first",
-                "Side": "first",
-                "Quantity": "sum",
-                "QuantityLots": "sum",
-            }
-        )
+        return self.snapshot().to_l2_dataframe()
 
     def to_l3_dataframe(self) -> pandas.DataFrame:
-        return self.to_dataframe()
+        return self.snapshot().to_l3_dataframe()
 
     def __str__(self) -> str:
         def _order_to_str(order: Order) -> str:
@@ -493,3 +1040,294 @@ class OrderBook:
 
     def __repr__(self) -> str:
         return f"{self}"
+
+
+# # 🥭 OrderBookDelta class
+#
+# The changes made to one side of an `OrderBook` by a single update, along with the `OrderBook` after
+# they were applied.
+#
+@dataclass(frozen=True)
+class OrderBookDelta:
+    side: Side
+    changes: typing.Sequence[OrderBookChange]
+    orderbook: OrderBook
+
+    def __str__(self) -> str:
+        changes = "\n    ".join([f"{change}" for change in self.changes]) or "None"
+        return f"""« OrderBookDelta {self.orderbook.symbol} {self.side}
+    {changes}
+»"""
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 OrderBookSideColumns class
+#
+# The orders on one side of an order book as NumPy columns, best price first. Prices and quantities
+# are in lots and `owners` holds each owner's 32 bytes. Timestamps and expirations are in seconds
+# since the epoch, with 0 meaning 'not known' or 'never expires'.
+#
+# Market decoders fill these straight from account data - `from_orders()` is the fallback for
+# markets that only have `Order`s.
+#
+@dataclass(frozen=True)
+class OrderBookSideColumns:
+    price_lots: numpy.ndarray
+    quantity_lots: numpy.ndarray
+    sequence_numbers: numpy.ndarray
+    client_ids: numpy.ndarray
+    owners: numpy.ndarray
+    timestamps: numpy.ndarray
+    expirations: numpy.ndarray
+
+    def __len__(self) -> int:
+        return len(self.price_lots)
+
+    @staticmethod
+    def from_orders(
+        orders: typing.Sequence[Order], lot_size_converter: LotSizeConverter
+    ) -> "OrderBookSideColumns":
+        def _seconds(value: typing.Optional[datetime]) -> int:
+            if value is None or value == Order.NoExpiration:
+                return 0
+            return int(value.timestamp())
+
+        return OrderBookSideColumns(
+            numpy.array(
+                [lot_size_converter.price_number_to_lots(o.price) for o in orders],
+                dtype=numpy.uint64,
+            ),
+            numpy.array(
+                [
+                    lot_size_converter.base_size_number_to_lots(o.quantity)
+                    for o in orders
+                ],
+                dtype=numpy.uint64,
+            ),
+            numpy.array(
+                [o.id & 0xFFFFFFFFFFFFFFFF for o in orders], dtype=numpy.uint64
+            ),
+            numpy.array([o.client_id for o in orders], dtype=numpy.uint64),
+            numpy.array([bytes(o.owner) for o in orders], dtype="V32"),
+            numpy.array([_seconds(o.timestamp) for o in orders], dtype=numpy.uint64),
+            numpy.array([_seconds(o.expiration) for o in orders], dtype=numpy.uint64),
+        )
+
+    def __str__(self) -> str:
+        return f"« OrderBookSideColumns [{len(self)} orders] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
+# # 🥭 OrderBookSnapshot class
+#
+# A columnar snapshot of a whole order book, lowest price first - the bids (in reverse, so the best
+# bid is last) followed by the asks. Each order is a row across the NumPy columns:
+# * `sides` - `OrderBookSnapshot.BUY` or `OrderBookSnapshot.SELL`
+# * `price_lots`, `quantity_lots`, `sequence_numbers`, `client_ids`
+# * `owner_indices` - index of the order's owner in `owners`
+# * `timestamps`, `expirations` - seconds since the epoch, 0 if not known or not expiring
+#
+# Lots are converted to prices and quantities all at once, using the market's tick and lot sizes, and
+# the L1/L2/L3 `DataFrame`s are built from the columns without going through `Order`s.
+#
+class OrderBookSnapshot:
+    BUY: typing.ClassVar[int] = 0
+    SELL: typing.ClassVar[int] = 1
+
+    def __init__(
+        self,
+        symbol: str,
+        lot_size_converter: LotSizeConverter,
+        sides: numpy.ndarray,
+        price_lots: numpy.ndarray,
+        quantity_lots: numpy.ndarray,
+        sequence_numbers: numpy.ndarray,
+        client_ids: numpy.ndarray,
+        owner_indices: numpy.ndarray,
+        owners: typing.Sequence[PublicKey],
+        timestamps: numpy.ndarray,
+        expirations: numpy.ndarray,
+    ) -> None:
+        self.symbol: str = symbol
+        self.lot_size_converter: LotSizeConverter = lot_size_converter
+        self.sides: numpy.ndarray = sides
+        self.price_lots: numpy.ndarray = price_lots
+        self.quantity_lots: numpy.ndarray = quantity_lots
+        self.sequence_numbers: numpy.ndarray = sequence_numbers
+        self.client_ids: numpy.ndarray = client_ids
+        self.owner_indices: numpy.ndarray = owner_indices
+        self.owners: typing.Sequence[PublicKey] = owners
+        self.timestamps: numpy.ndarray = timestamps
+        self.expirations: numpy.ndarray = expirations
+
+    @staticmethod
+    def from_sides(
+        symbol: str,
+        lot_size_converter: LotSizeConverter,
+        bids: OrderBookSideColumns,
+        asks: OrderBookSideColumns,
+    ) -> "OrderBookSnapshot":
+        def _join(column: str) -> numpy.ndarray:
+            return numpy.concatenate(
+                [getattr(bids, column)[::-1], getattr(asks, column)]
+            )
+
+        sides = numpy.concatenate(
+            [
+                numpy.full(len(bids), OrderBookSnapshot.BUY, dtype=numpy.int8),
+                numpy.full(len(asks), OrderBookSnapshot.SELL, dtype=numpy.int8),
+            ]
+        )
+        unique_owners, owner_indices = numpy.unique(
+            _join("owners"), return_inverse=True
+        )
+        return OrderBookSnapshot(
+            symbol,
+            lot_size_converter,
+            sides,
+            _join("price_lots"),
+            _join("quantity_lots"),
+            _join("sequence_numbers"),
+            _join("client_ids"),
+            owner_indices.reshape(-1),
+            [PublicKey(owner) for owner in unique_owners.tolist()],
+            _join("timestamps"),
+            _join("expirations"),
+        )
+
+    @property
+    def prices(self) -> numpy.ndarray:
+        return self.price_lots * float(self.lot_size_converter.tick_size)
+
+    @property
+    def quantities(self) -> numpy.ndarray:
+        return self.quantity_lots * float(self.lot_size_converter.lot_size)
+
+    # A new snapshot without any orders that have expired at `cutoff`.
+    def unexpired_at(self, cutoff: datetime) -> "OrderBookSnapshot":
+        seconds = int(cutoff.timestamp())
+        keep = (self.expirations == 0) | (self.expirations > seconds)
+        return OrderBookSnapshot(
+            self.symbol,
+            self.lot_size_converter,
+            self.sides[keep],
+            self.price_lots[keep],
+            self.quantity_lots[keep],
+            self.sequence_numbers[keep],
+            self.client_ids[keep],
+            self.owner_indices[keep],
+            self.owners,
+            self.timestamps[keep],
+            self.expirations[keep],
+        )
+
+    def to_l1_dataframe(self) -> pandas.DataFrame:
+        frame: pandas.DataFrame = self.to_l2_dataframe()
+        buys = frame[frame["Side"] == Side.BUY]
+        sells = frame[frame["Side"] == Side.SELL]
+        top = [
+            *([buys["PriceLots"].idxmax()] if len(buys) > 0 else []),
+            *([sells["PriceLots"].idxmin()] if len(sells) > 0 else []),
+        ]
+        return typing.cast(pandas.DataFrame, frame.loc[top])
+
+    def to_l2_dataframe(self) -> pandas.DataFrame:
+        # Aggregate on integer lots, not on prices derived from them.
+        levels = numpy.stack([self.sides.astype(numpy.uint64), self.price_lots], axis=1)
+        unique_levels, level_indices = numpy.unique(levels, axis=0, return_inverse=True)
+        level_indices = level_indices.reshape(-1)
+        quantity_lots = numpy.zeros(len(unique_levels), dtype=numpy.uint64)
+        numpy.add.at(quantity_lots, level_indices, self.quantity_lots)
+
+        sides = unique_levels[:, 0]
+        price_lots = unique_levels[:, 1]
+        frame = pandas.DataFrame(
+            {
+                "Price": price_lots * float(self.lot_size_converter.tick_size),
+                "PriceLots": price_lots,
+                "Side": self.__side_values(sides),
+                "Quantity": quantity_lots * float(self.lot_size_converter.lot_size),
+                "QuantityLots": quantity_lots,
+            }
+        )
+        return frame.sort_values("PriceLots", kind="stable").set_index("Price")
+
+    def to_l3_dataframe(self) -> pandas.DataFrame:
+        price_lots: typing.List[int] = self.price_lots.tolist()
+        sequence_numbers: typing.List[int] = self.sequence_numbers.tolist()
+        owners = [self.owners[index] for index in self.owner_indices.tolist()]
+        return pandas.DataFrame(
+            {
+                "Id": [
+                    (price << 64) | sequence
+                    for price, sequence in zip(price_lots, sequence_numbers)
+                ],
+                "ClientId": self.client_ids,
+                "Owner": owners,
+                "Side": self.__side_values(self.sides),
+                "Price": self.prices,
+                "Quantity": self.quantities,
+                "Timestamp": OrderBookSnapshot.__datetimes(self.timestamps),
+                "Expiration": OrderBookSnapshot.__datetimes(self.expirations),
+                "QuantityLots": self.quantity_lots,
+                "PriceLots": self.price_lots,
+                "SequenceNumber": self.sequence_numbers,
+            }
+        )
+
+    def to_csv(self) -> str:
+        return typing.cast(str, self.to_l3_dataframe().to_csv(index=False))
+
+    @staticmethod
+    def __side_values(sides: numpy.ndarray) -> numpy.ndarray:
+        return numpy.where(sides == OrderBookSnapshot.BUY, Side.BUY, Side.SELL).astype(
+            object
+        )
+
+    @staticmethod
+    def __datetimes(seconds: numpy.ndarray) -> pandas.Series:
+        values = pandas.Series(
+            pandas.to_datetime(seconds.astype(numpy.int64), unit="s", utc=True)
+        )
+        return values.where(seconds != 0)
+
+    def __str__(self) -> str:
+        levels_to_show = 5
+        frame = self.to_l2_dataframe()
+        bids = frame[frame["Side"] == Side.BUY].iloc[::-1].head(levels_to_show)
+        asks = frame[frame["Side"] == Side.SELL].head(levels_to_show)
+
+        def _level_to_str(side: Side, price: float, quantity: float) -> str:
+            return f"{side} {quantity:>20,.8f} at {price:>20,.8f}"
+
+        lines = []
+        for counter in range(levels_to_show):
+            bid = (
+                _level_to_str(
+                    Side.BUY, bids.index[counter], bids["Quantity"].iloc[counter]
+                )
+                if len(bids) > counter
+                else ""
+            )
+            ask = (
+                _level_to_str(
+                    Side.SELL, asks.index[counter], asks["Quantity"].iloc[counter]
+                )
+                if len(asks) > counter
+                else ""
+            )
+            lines += [f"{bid:50} :: {ask}"]
+
+        text = "\n\t".join(lines)
+        spread_description = "N/A"
+        if len(bids) > 0 and len(asks) > 0:
+            spread = asks.index[0] - bids.index[0]
+            spread_description = f"{spread:,.8f}, {spread / bids.index[0]:,.3%}"
+        return f"« OrderBookSnapshot {self.symbol} [{len(self.sides)} orders from {len(self.owners)} owners, spread: {spread_description}]\n\t{text}\n»"
+
+    def __repr__(self) -> str:
+        return f"{self}"
@@ -44,7 +44,16 @@ from .markets import InventorySource, MarketType, Market
 from .marketoperations import MarketInstructionBuilder, MarketOperations
 from .metadata import Metadata
 from .observables import Disposable
-from .orders import Order, OrderBook, OrderType, Side
+from .orders import (
+    BookOrder,
+    CompactOrder,
+    Order,
+    OrderBook,
+    OrderBookChange,
+    OrderBookSideColumns,
+    OrderType,
+    Side,
+)
 from .perpeventqueue import (
     PerpEvent,
     PerpEventQueue,
@@ -52,6 +61,7 @@ from .perpeventqueue import (
     UnseenPerpEventChangesTracker,
 )
 from .perpmarketdetails import PerpMarketDetails
+from .perporderbookdecoder import PerpOrderBookSideDecoder
 from .publickey import encode_public_key_for_sorting
 from .tokens import Instrument, Token
 from .tokenbank import TokenBank
@@ -162,7 +172,7 @@ class PerpOrderBookSide(AddressableAccount):
         free_list_head: Decimal,
         root_node: Decimal,
         leaf_count: Decimal,
-        nodes: typing.Any,
+        nodes: typing.Any = None,
     ) -> None:
         super().__init__(account_info)
         self.version: Version = version
@@ -174,7 +184,15 @@ class PerpOrderBookSide(AddressableAccount):
         self.free_list_head: Decimal = free_list_head
         self.root_node: Decimal = root_node
         self.leaf_count: Decimal = leaf_count
-        self.nodes: typing.Any = nodes
+        self.__nodes: typing.Any = nodes
+
+    # Parsing all the nodes with `construct` is slow, and `orders()` doesn't need them, so they're
+    # only parsed if something asks for them.
+    @property
+    def nodes(self) -> typing.Any:
+        if self.__nodes is None:
+            self.__nodes = layouts.ORDERBOOK_SIDE.parse(self.account_info.data).nodes
+        return self.__nodes
 
     @staticmethod
     def from_layout(
@@ -214,9 +232,25 @@ class PerpOrderBookSide(AddressableAccount):
                 f"PerpOrderBookSide data length ({len(data)}) does not match expected size ({layouts.ORDERBOOK_SIDE.sizeof()})"
             )
 
-        layout = layouts.ORDERBOOK_SIDE.parse(data)
-        return PerpOrderBookSide.from_layout(
-            layout, account_info, Version.V1, perp_market_details
+        # Only the header is parsed here - see `nodes` and `orders()`.
+        meta_data = Metadata.from_layout(layouts.METADATA.parse(data))
+        (
+            bump_index,
+            free_list_len,
+            free_list_head,
+            root_node,
+            leaf_count,
+        ) = PerpOrderBookSideDecoder.header(data)
+        return PerpOrderBookSide(
+            account_info,
+            Version.V1,
+            meta_data,
+            perp_market_details,
+            Decimal(bump_index),
+            Decimal(free_list_len),
+            Decimal(free_list_head),
+            Decimal(root_node),
+            Decimal(leaf_count),
         )
 
     @staticmethod
@@ -249,6 +283,29 @@ class PerpOrderBookSide(AddressableAccount):
         if self.leaf_count == 0:
             return []
 
+        return PerpOrderBookSideDecoder(self.perp_market_details).orders(
+            self.account_info.data, self.side
+        )
+
+    def compact_orders(self) -> typing.Sequence[CompactOrder]:
+        if self.leaf_count == 0:
+            return []
+
+        return PerpOrderBookSideDecoder(self.perp_market_details).compact_orders(
+            self.account_info.data, self.side
+        )
+
+    @property
+    def side(self) -> Side:
+        if self.meta_data.data_type == layouts.DATA_TYPE.Bids:
+            return Side.BUY
+        return Side.SELL
+
+    # This is the reference implementation of `orders()`, walking the nodes as parsed by `construct`.
+    def orders_from_layout(self) -> typing.Sequence[Order]:
+        if self.leaf_count == 0:
+            return []
+
         if self.meta_data.data_type == layouts.DATA_TYPE.Bids:
             order_side = Side.BUY
         else:
@@ -395,6 +452,32 @@ class PerpMarket(LoadedMarket):
         )
         return side.orders()
 
+    def parse_account_info_to_book_orders(
+        self, account_info: AccountInfo
+    ) -> typing.Sequence[BookOrder]:
+        side: PerpOrderBookSide = PerpOrderBookSide.parse(
+            account_info, self.underlying_perp_market
+        )
+        return side.compact_orders()
+
+    def parse_account_info_to_columns(
+        self, account_info: AccountInfo
+    ) -> OrderBookSideColumns:
+        side: PerpOrderBookSide = PerpOrderBookSide.parse(
+            account_info, self.underlying_perp_market
+        )
+        return PerpOrderBookSideDecoder.columns(account_info.data, side.side)
+
+    def parse_account_info_to_order_changes(
+        self, account_info: AccountInfo, previous: typing.Sequence[Order]
+    ) -> typing.Sequence[OrderBookChange]:
+        side: PerpOrderBookSide = PerpOrderBookSide.parse(
+            account_info, self.underlying_perp_market
+        )
+        return PerpOrderBookSideDecoder(self.underlying_perp_market).changes(
+            account_info.data, side.side, previous
+        )
+
     def fetch_funding(self, context: Context) -> FundingRate:
         stats = context.fetch_stats(
             f"perp/funding_rate?mangoGroup={self.group.name}&market={self.symbol}"
@@ -412,6 +495,11 @@ class PerpMarket(LoadedMarket):
         )
         return event_queue.unprocessed_events
 
+    def parse_account_info_to_event_queue(
+        self, account_info: AccountInfo
+    ) -> PerpEventQueue:
+        return PerpEventQueue.parse(account_info, self.lot_size_converter)
+
     def on_fill(
         self, context: Context, handler: typing.Callable[[PerpFillEvent], None]
     ) -> Disposable:
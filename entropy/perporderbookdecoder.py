@@ -0,0 +1,293 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+import numpy
+import struct
+import typing
+
+from datetime import timedelta
+from decimal import Decimal
+from solana.publickey import PublicKey
+
+from .datetimes import datetime_from_chain
+from .layouts import layouts
+from .orders import (
+    CompactOrder,
+    Order,
+    OrderBookChange,
+    OrderBookSideColumns,
+    OrderType,
+    Side,
+)
+from .perpmarketdetails import PerpMarketDetails
+
+
+# The layout of the `BookSide` header (after its 8-byte `MetaData`) is:
+#   bump_index: usize, free_list_len: usize, free_list_head: u32, root_node: u32, leaf_count: usize
+_HEADER_FORMAT: str = "<QQIIQ"
+_HEADER_OFFSET: int = 8
+_NODES_OFFSET: int = _HEADER_OFFSET + struct.calcsize(_HEADER_FORMAT)
+_NODE_SIZE: int = 88
+
+_INNER_NODE_TAG: int = 1
+_LEAF_NODE_TAG: int = 2
+
+# Inner and leaf nodes overlap in the same 88 bytes - the `tag` says which one a node is. This dtype
+# describes both at once, so a leaf's fields are only meaningful for nodes tagged as leaves.
+_NODE_DTYPE: numpy.dtype = numpy.dtype(
+    {
+        "names": [
+            "tag",
+            "time_in_force",
+            "sequence_number",
+            "price",
+            "owner",
+            "quantity",
+            "client_order_id",
+            "timestamp",
+        ],
+        "formats": ["<u4", "u1", "<u8", "<u8", "V32", "<u8", "<u8", "<u8"],
+        "offsets": [0, 7, 8, 16, 24, 56, 64, 80],
+        "itemsize": _NODE_SIZE,
+    }
+)
+
+
+# # 🥭 PerpOrderBookSideDecoder class
+#
+# A `PerpOrderBookSideDecoder` reads the orders in a perp `BookSide` account straight from the
+# account's raw data, without having `construct` parse all 1,024 nodes into Python objects first.
+#
+# Only nodes reachable from the root are visited, in the same order as the `construct`-based
+# `PerpOrderBookSide.orders_from_layout()`. The fields of all the leaves found are then pulled out
+# together through a (zero-copy) NumPy view of the data, and prices and quantities are converted
+# using factors calculated once for the market rather than once per order. The resulting `Order`s are
+# identical to those from `orders_from_layout()`, which remains the reference implementation.
+#
+# The decoder is also the `OrderLotConverter` for the `CompactOrder`s from `compact_orders()`, which skip
+# building `Decimal`s, `PublicKey`s and `datetime`s for values nobody looks at. `orders()` doesn't go
+# through `CompactOrder`s - it builds each `Order` directly.
+#
+class PerpOrderBookSideDecoder:
+    def __init__(self, perp_market_details: PerpMarketDetails) -> None:
+        decimals_differential = (
+            perp_market_details.base_instrument.decimals
+            - perp_market_details.quote_token.token.decimals
+        )
+        self.native_to_ui: Decimal = Decimal(10) ** decimals_differential
+        self.lot_size_ratio: Decimal = (
+            perp_market_details.quote_lot_size / perp_market_details.base_lot_size
+        )
+        self.base_lot_size: Decimal = perp_market_details.base_lot_size
+        self.base_factor: Decimal = (
+            Decimal(10) ** perp_market_details.base_instrument.decimals
+        )
+
+    @staticmethod
+    def header(data: bytes) -> typing.Tuple[int, int, int, int, int]:
+        (
+            bump_index,
+            free_list_len,
+            free_list_head,
+            root_node,
+            leaf_count,
+        ) = struct.unpack_from(_HEADER_FORMAT, data, _HEADER_OFFSET)
+        return bump_index, free_list_len, free_list_head, root_node, leaf_count
+
+    @staticmethod
+    def leaf_indices(data: bytes, side: Side) -> typing.Sequence[int]:
+        _, _, _, root_node, leaf_count = PerpOrderBookSideDecoder.header(data)
+        if leaf_count == 0:
+            return []
+
+        # Bids are walked highest key first, asks lowest key first, so both come out best price first.
+        first_child, second_child = (0, 1) if side == Side.BUY else (1, 0)
+        unpack_tag = struct.Struct("<I").unpack_from
+        unpack_children = struct.Struct("<II").unpack_from
+        leaves: typing.List[int] = []
+        stack: typing.List[int] = [root_node]
+        while len(stack) > 0:
+            index = stack.pop()
+            offset = _NODES_OFFSET + index * _NODE_SIZE
+            (tag,) = unpack_tag(data, offset)
+            if tag == _LEAF_NODE_TAG:
+                leaves += [index]
+            elif tag == _INNER_NODE_TAG:
+                children = unpack_children(data, offset + 24)
+                stack += [children[first_child], children[second_child]]
+        return leaves
+
+    def orders(self, data: bytes, side: Side) -> typing.Sequence[Order]:
+        indices = PerpOrderBookSideDecoder.leaf_indices(data, side)
+        if len(indices) == 0:
+            return []
+
+        return self.__decode(PerpOrderBookSideDecoder.__nodes(data)[indices], side)
+
+    # The `OrderBookChange`s from the `previous` orders on this side of the book to the orders in
+    # `data`, in the same order as `OrderBookChange.between()` would return them. Only leaves that
+    # are new or have changed quantity are decoded into `Order`s.
+    def changes(
+        self, data: bytes, side: Side, previous: typing.Sequence[Order]
+    ) -> typing.Sequence[OrderBookChange]:
+        indices = PerpOrderBookSideDecoder.leaf_indices(data, side)
+        leaves = PerpOrderBookSideDecoder.__nodes(data)[indices]
+        sequence_numbers: typing.List[int] = leaves["sequence_number"].tolist()
+        prices: typing.List[int] = leaves["price"].tolist()
+        quantities: typing.List[int] = leaves["quantity"].tolist()
+
+        previous_by_id: typing.Dict[int, Order] = {
+            order.id: order for order in previous
+        }
+        changed_positions: typing.List[int] = []
+        earlier_orders: typing.List[typing.Optional[Order]] = []
+        current_ids: typing.Set[int] = set()
+        increased_ids: typing.Set[int] = set()
+        for position in range(len(indices)):
+            id = (prices[position] << 64) | sequence_numbers[position]
+            current_ids.add(id)
+            earlier = previous_by_id.get(id)
+            if earlier is not None:
+                quantity = self.quantity_from_lots(quantities[position])
+                if quantity == earlier.quantity:
+                    continue
+                if quantity > earlier.quantity:
+                    increased_ids.add(id)
+                    earlier = None
+            changed_positions += [position]
+            earlier_orders += [earlier]
+
+        changes: typing.List[OrderBookChange] = [
+            OrderBookChange.remove(order)
+            for order in previous
+            if order.id not in current_ids or order.id in increased_ids
+        ]
+        changed_orders = self.__decode(leaves[changed_positions], side)
+        for order, earlier_or_none in zip(changed_orders, earlier_orders):
+            if earlier_or_none is None:
+                changes += [OrderBookChange.add(order)]
+            else:
+                changes += [OrderBookChange.fill(order, earlier_or_none.quantity)]
+
+        return changes
+
+    @staticmethod
+    def __nodes(data: bytes) -> numpy.ndarray:
+        return numpy.frombuffer(
+            data, dtype=_NODE_DTYPE, count=layouts.MAX_BOOK_NODES, offset=_NODES_OFFSET
+        )
+
+    # The same orders as `orders()`, as `CompactOrder`s that only convert their values when asked.
+    def compact_orders(self, data: bytes, side: Side) -> typing.Sequence[CompactOrder]:
+        indices = PerpOrderBookSideDecoder.leaf_indices(data, side)
+        if len(indices) == 0:
+            return []
+
+        return self.__decode_compact(
+            PerpOrderBookSideDecoder.__nodes(data)[indices], side
+        )
+
+    # The orders in `data` as `OrderBookSideColumns`, best price first, for an `OrderBookSnapshot`.
+    @staticmethod
+    def columns(data: bytes, side: Side) -> OrderBookSideColumns:
+        indices = PerpOrderBookSideDecoder.leaf_indices(data, side)
+        leaves = PerpOrderBookSideDecoder.__nodes(data)[indices]
+        timestamps = leaves["timestamp"]
+        times_in_force = leaves["time_in_force"].astype(numpy.uint64)
+        return OrderBookSideColumns(
+            leaves["price"],
+            leaves["quantity"],
+            leaves["sequence_number"],
+            leaves["client_order_id"],
+            leaves["owner"],
+            timestamps,
+            numpy.where(times_in_force != 0, timestamps + times_in_force, 0).astype(
+                numpy.uint64
+            ),
+        )
+
+    # These calculations deliberately match `PerpOrderBookSide.orders_from_layout()` step by step,
+    # so the `Decimal` results are exactly the same.
+    def price_from_lots(self, price_lots: int) -> Decimal:
+        return Decimal(price_lots) * self.lot_size_ratio * self.native_to_ui
+
+    def quantity_from_lots(self, quantity_lots: int) -> Decimal:
+        return (Decimal(quantity_lots) * self.base_lot_size) / self.base_factor
+
+    def __decode_compact(
+        self, leaves: numpy.ndarray, side: Side
+    ) -> typing.List[CompactOrder]:
+        sequence_numbers: typing.List[int] = leaves["sequence_number"].tolist()
+        prices: typing.List[int] = leaves["price"].tolist()
+        quantities: typing.List[int] = leaves["quantity"].tolist()
+        client_order_ids: typing.List[int] = leaves["client_order_id"].tolist()
+        times_in_force: typing.List[int] = leaves["time_in_force"].tolist()
+        timestamps: typing.List[int] = leaves["timestamp"].tolist()
+        owners: typing.List[bytes] = leaves["owner"].tolist()
+
+        # Most of the orders on a book come from a handful of owners, so share their bytes.
+        shared_owners: typing.Dict[bytes, bytes] = {}
+        return [
+            CompactOrder(
+                (prices[position] << 64) | sequence_numbers[position],
+                client_order_ids[position],
+                side,
+                quantities[position],
+                shared_owners.setdefault(owners[position], owners[position]),
+                timestamps[position],
+                times_in_force[position],
+                self,
+            )
+            for position in range(len(leaves))
+        ]
+
+    def __decode(self, leaves: numpy.ndarray, side: Side) -> typing.Sequence[Order]:
+        sequence_numbers: typing.List[int] = leaves["sequence_number"].tolist()
+        prices: typing.List[int] = leaves["price"].tolist()
+        quantities: typing.List[int] = leaves["quantity"].tolist()
+        client_order_ids: typing.List[int] = leaves["client_order_id"].tolist()
+        times_in_force: typing.List[int] = leaves["time_in_force"].tolist()
+        timestamps: typing.List[int] = leaves["timestamp"].tolist()
+        owners: typing.List[bytes] = leaves["owner"].tolist()
+
+        orders: typing.List[Order] = []
+        for position in range(len(leaves)):
+            timestamp = datetime_from_chain(timestamps[position])
+            expiration = Order.NoExpiration
+            if times_in_force[position] != 0:
+                expiration = timestamp + timedelta(
+                    seconds=float(times_in_force[position])
+                )
+
+            orders += [
+                Order(
+                    (prices[position] << 64) | sequence_numbers[position],
+                    client_order_ids[position],
+                    PublicKey(owners[position]),
+                    side,
+                    self.price_from_lots(prices[position]),
+                    self.quantity_from_lots(quantities[position]),
+                    OrderType.UNKNOWN,
+                    timestamp=timestamp,
+                    expiration=expiration,
+                )
+            ]
+        return orders
+
+    def __str__(self) -> str:
+        return f"« PerpOrderBookSideDecoder lot size ratio: {self.lot_size_ratio}, native to UI: {self.native_to_ui} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
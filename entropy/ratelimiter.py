@@ -0,0 +1,76 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+import asyncio
+import threading
+import time
+
+
+# # 🥭 TokenBucketRateLimiter class
+#
+# A `TokenBucketRateLimiter` allows up to `rate` calls per second on average, with bursts of up to
+# `capacity` calls at once. It is safe to share between threads, and between threads and asyncio
+# tasks.
+#
+# Each call takes a token from the bucket. If there are no tokens left, the caller has to wait until
+# the bucket has refilled enough to cover it. A `rate` of zero (or less) means there is no limit.
+#
+class TokenBucketRateLimiter:
+    def __init__(self, rate: float, capacity: float = 1) -> None:
+        self.rate: float = rate
+        self.capacity: float = max(capacity, 1)
+        self.__tokens: float = self.capacity
+        self.__last_refill: float = time.monotonic()
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def is_limited(self) -> bool:
+        return self.rate > 0
+
+    # Takes a token and returns how many seconds the caller must wait before proceeding. Tokens can
+    # be 'borrowed' from the future, so concurrent callers queue up behind each other rather than all
+    # waking at the same moment.
+    def reserve(self) -> float:
+        if not self.is_limited:
+            return 0
+
+        with self.__lock:
+            now: float = time.monotonic()
+            self.__tokens = min(
+                self.capacity, self.__tokens + ((now - self.__last_refill) * self.rate)
+            )
+            self.__last_refill = now
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0
+            return -self.__tokens / self.rate
+
+    def wait(self) -> None:
+        delay: float = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        delay: float = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def __str__(self) -> str:
+        if not self.is_limited:
+            return "« TokenBucketRateLimiter [unlimited] »"
+        return f"« TokenBucketRateLimiter [{self.rate} per second, bursts of {self.capacity}] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
@@ -40,9 +40,10 @@ from .markets import InventorySource, Market, MarketType
 from .marketoperations import MarketInstructionBuilder, MarketOperations
 from .openorders import OpenOrders
 from .observables import Disposable
-from .orders import Order, OrderBook, Side
+from .orders import Order, OrderBook, OrderBookSideColumns, Side
 from .publickey import encode_public_key_for_sorting
 from .serumeventqueue import SerumEvent, SerumEventQueue, UnseenSerumEventChangesTracker
+from .serumorderbookdecoder import SerumOrderBookSideDecoder
 from .tokens import Instrument, Token
 from .tokenaccount import TokenAccount
 from .wallet import Wallet
@@ -121,12 +122,22 @@ class SerumMarket(LoadedMarket):
         )
         return list(map(Order.from_serum_order, orderbook.orders()))
 
+    def parse_account_info_to_columns(
+        self, account_info: AccountInfo
+    ) -> OrderBookSideColumns:
+        return SerumOrderBookSideDecoder.columns(account_info.data)
+
     def unprocessed_events(self, context: Context) -> typing.Sequence[SerumEvent]:
         event_queue: SerumEventQueue = SerumEventQueue.load(
             context, self.event_queue_address, self.base, self.quote
         )
         return event_queue.unprocessed_events
 
+    def parse_account_info_to_event_queue(
+        self, account_info: AccountInfo
+    ) -> SerumEventQueue:
+        return SerumEventQueue.parse(account_info, self.base, self.quote)
+
     def find_openorders_address_for_owner(
         self, context: Context, owner: PublicKey
     ) -> typing.Optional[PublicKey]:
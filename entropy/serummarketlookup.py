@@ -49,21 +49,39 @@ from .tokens import Instrument, Token
 # the list, check if the item has the optional `extensions` attribute, and in there see if
 # there is a name-value pair for the particular market we're interested in. Also, the
 # current file only lists USDC and USDT markets, so that's all we can support this way.
+#
+# `load()` only reads the token list the first time it's needed, so programs that never look up a
+# Serum market this way don't pay for parsing it.
 class SerumMarketLookup(MarketLookup):
     def __init__(
-        self, serum_program_address: PublicKey, token_data: typing.Dict[str, typing.Any]
+        self,
+        serum_program_address: PublicKey,
+        token_data: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        token_data_filename: typing.Optional[str] = None,
     ) -> None:
         super().__init__()
+        if token_data is None and token_data_filename is None:
+            raise Exception(
+                "SerumMarketLookup needs either token data or a token data filename."
+            )
         self.serum_program_address: PublicKey = serum_program_address
-        self.token_data: typing.Dict[str, typing.Any] = token_data
+        self.token_data_filename: typing.Optional[str] = token_data_filename
+        self.__token_data: typing.Optional[typing.Dict[str, typing.Any]] = token_data
+
+    @property
+    def token_data(self) -> typing.Dict[str, typing.Any]:
+        if self.__token_data is None:
+            with open(str(self.token_data_filename), encoding="utf-8") as json_file:
+                self.__token_data = json.load(json_file)
+        return self.__token_data
 
     @staticmethod
     def load(
         serum_program_address: PublicKey, token_data_filename: str
     ) -> "SerumMarketLookup":
-        with open(token_data_filename, encoding="utf-8") as json_file:
-            token_data = json.load(json_file)
-            return SerumMarketLookup(serum_program_address, token_data)
+        return SerumMarketLookup(
+            serum_program_address, token_data_filename=token_data_filename
+        )
 
     @staticmethod
     def _find_data_by_symbol(
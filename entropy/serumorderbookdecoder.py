@@ -0,0 +1,132 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+import numpy
+import struct
+import typing
+
+from .orders import OrderBookSideColumns, Side
+
+
+# A Serum order book account is 5 bytes of padding, 8 bytes of account flags, then the slab. The slab
+# header is:
+#   bump_index: u32, (4 padding), free_list_len: u32, (4 padding), free_list_head: u32, root: u32,
+#   leaf_count: u32, (4 padding)
+_HEADER_FORMAT: str = "<I4xI4xIII4x"
+_HEADER_OFFSET: int = 13
+_NODES_OFFSET: int = _HEADER_OFFSET + struct.calcsize(_HEADER_FORMAT)
+_NODE_SIZE: int = 72
+
+# The account flags are a little-endian u64 bitset: initialized, market, open_orders, request_queue,
+# event_queue, bids, asks.
+_ACCOUNT_FLAGS_OFFSET: int = 5
+_BIDS_FLAG: int = 1 << 5
+
+_INNER_NODE_TAG: int = 1
+_LEAF_NODE_TAG: int = 2
+
+# Inner and leaf nodes overlap in the same 72 bytes - the `tag` says which one a node is. The 16-byte
+# key of a leaf is the sequence number (low 8 bytes) and the price in lots (high 8 bytes).
+_NODE_DTYPE: numpy.dtype = numpy.dtype(
+    {
+        "names": [
+            "tag",
+            "sequence_number",
+            "price",
+            "owner",
+            "quantity",
+            "client_order_id",
+        ],
+        "formats": ["<u4", "<u8", "<u8", "V32", "<u8", "<u8"],
+        "offsets": [0, 8, 16, 24, 56, 64],
+        "itemsize": _NODE_SIZE,
+    }
+)
+
+
+# # 🥭 SerumOrderBookSideDecoder class
+#
+# Reads the orders in a Serum bids or asks account straight into `OrderBookSideColumns`, without
+# pyserum parsing the slab into a `Slab` of Python objects and then `Order`s.
+#
+# Only nodes reachable from the root are visited, best price first. The leaves' fields are then
+# pulled out together through a NumPy view of the data. Serum orders have no timestamp or expiration,
+# so those columns are all 0.
+#
+class SerumOrderBookSideDecoder:
+    @staticmethod
+    def header(data: bytes) -> typing.Tuple[int, int, int, int, int]:
+        (
+            bump_index,
+            free_list_len,
+            free_list_head,
+            root_node,
+            leaf_count,
+        ) = struct.unpack_from(_HEADER_FORMAT, data, _HEADER_OFFSET)
+        return bump_index, free_list_len, free_list_head, root_node, leaf_count
+
+    @staticmethod
+    def side(data: bytes) -> Side:
+        (flags,) = struct.unpack_from("<Q", data, _ACCOUNT_FLAGS_OFFSET)
+        return Side.BUY if flags & _BIDS_FLAG else Side.SELL
+
+    @staticmethod
+    def leaf_indices(data: bytes, side: Side) -> typing.Sequence[int]:
+        _, _, _, root_node, leaf_count = SerumOrderBookSideDecoder.header(data)
+        if leaf_count == 0:
+            return []
+
+        # Bids are walked highest key first, asks lowest key first, so both come out best price first.
+        first_child, second_child = (0, 1) if side == Side.BUY else (1, 0)
+        unpack_tag = struct.Struct("<I").unpack_from
+        unpack_children = struct.Struct("<II").unpack_from
+        leaves: typing.List[int] = []
+        stack: typing.List[int] = [root_node]
+        while len(stack) > 0:
+            index = stack.pop()
+            offset = _NODES_OFFSET + index * _NODE_SIZE
+            (tag,) = unpack_tag(data, offset)
+            if tag == _LEAF_NODE_TAG:
+                leaves += [index]
+            elif tag == _INNER_NODE_TAG:
+                children = unpack_children(data, offset + 24)
+                stack += [children[first_child], children[second_child]]
+        return leaves
+
+    @staticmethod
+    def columns(data: bytes) -> OrderBookSideColumns:
+        bump_index, _, _, _, _ = SerumOrderBookSideDecoder.header(data)
+        side = SerumOrderBookSideDecoder.side(data)
+        indices = SerumOrderBookSideDecoder.leaf_indices(data, side)
+        nodes = numpy.frombuffer(
+            data, dtype=_NODE_DTYPE, count=bump_index, offset=_NODES_OFFSET
+        )
+        leaves = nodes[indices]
+        no_times = numpy.zeros(len(leaves), dtype=numpy.uint64)
+        return OrderBookSideColumns(
+            leaves["price"],
+            leaves["quantity"],
+            leaves["sequence_number"],
+            leaves["client_order_id"],
+            leaves["owner"],
+            no_times,
+            no_times,
+        )
+
+    def __str__(self) -> str:
+        return "« SerumOrderBookSideDecoder »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
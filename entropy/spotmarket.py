@@ -42,9 +42,10 @@ from .lotsizeconverter import LotSizeConverter, RaisingLotSizeConverter
 from .markets import InventorySource, MarketType, Market
 from .marketoperations import MarketInstructionBuilder, MarketOperations
 from .observables import Disposable
-from .orders import Order, OrderBook
+from .orders import Order, OrderBook, OrderBookSideColumns
 from .publickey import encode_public_key_for_sorting
 from .serumeventqueue import SerumEvent, SerumEventQueue, UnseenSerumEventChangesTracker
+from .serumorderbookdecoder import SerumOrderBookSideDecoder
 from .tokens import Token
 from .wallet import Wallet
 from .websocketsubscription import (
@@ -124,12 +125,22 @@ class SpotMarket(LoadedMarket):
         )
         return list(map(Order.from_serum_order, orderbook.orders()))
 
+    def parse_account_info_to_columns(
+        self, account_info: AccountInfo
+    ) -> OrderBookSideColumns:
+        return SerumOrderBookSideDecoder.columns(account_info.data)
+
     def unprocessed_events(self, context: Context) -> typing.Sequence[SerumEvent]:
         event_queue: SerumEventQueue = SerumEventQueue.load(
             context, self.event_queue_address, self.base, self.quote
         )
         return event_queue.unprocessed_events
 
+    def parse_account_info_to_event_queue(
+        self, account_info: AccountInfo
+    ) -> SerumEventQueue:
+        return SerumEventQueue.parse(account_info, self.base, self.quote)
+
     def derive_open_orders_address(
         self, context: Context, account: Account
     ) -> PublicKey:
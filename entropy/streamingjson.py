@@ -0,0 +1,137 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+import codecs
+import json
+import re
+import typing
+
+
+# # 🥭 StreamingJsonArrayDecoder class
+#
+# A `StreamingJsonArrayDecoder` pulls the items out of one array in a JSON document as the document
+# arrives, without waiting for (or holding) the whole thing.
+#
+# Bytes are `feed()` in whatever chunks they arrive in, and each call returns the items of the
+# `key` array that have been completed so far. Only the unconsumed tail of the document is kept, so
+# memory use is bounded by the largest single item rather than the size of the whole response.
+#
+# Anything that comes before the array is buffered until the array is found. If it never is (say,
+# because a JSON-RPC server returned an `error` instead of a `result`), `finish()` returns `False`
+# and `preamble` holds the complete document for the caller to deal with.
+#
+class StreamingJsonArrayDecoder:
+    __WHITESPACE: str = " \t\n\r"
+    __SEPARATORS: str = ",]" + __WHITESPACE
+
+    def __init__(self, key: str = "result") -> None:
+        self.key: str = key
+        self.__array_start: typing.Pattern[str] = re.compile(
+            json.dumps(key) + r"\s*:\s*\["
+        )
+        self.__text_decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+            "utf-8"
+        )()
+        self.__json_decoder: json.JSONDecoder = json.JSONDecoder()
+        self.__buffer: str = ""
+        self.__in_array: bool = False
+        self.__array_complete: bool = False
+        self.preamble: str = ""
+        self.item_count: int = 0
+
+    @property
+    def in_array(self) -> bool:
+        return self.__in_array
+
+    @property
+    def array_complete(self) -> bool:
+        return self.__array_complete
+
+    def feed(self, data: bytes) -> typing.Sequence[typing.Any]:
+        self.__buffer += self.__text_decoder.decode(data)
+        return self.__decode_available(False)
+
+    # Call when there's no more data. Returns `True` if the whole array was decoded, `False` if the
+    # array was never found. Raises if the document ended part-way through the array.
+    def finish(self) -> bool:
+        self.__buffer += self.__text_decoder.decode(b"", final=True)
+        if not self.__in_array:
+            self.preamble += self.__buffer
+            self.__buffer = ""
+            return False
+
+        self.__decode_available(True)
+        if not self.__array_complete:
+            raise Exception(
+                f"JSON document ended after {self.item_count} items of unterminated '{self.key}' array."
+            )
+        return True
+
+    def __decode_available(self, final: bool) -> typing.Sequence[typing.Any]:
+        if self.__array_complete:
+            return []
+
+        if not self.__in_array:
+            match = self.__array_start.search(self.__buffer)
+            if match is None:
+                return []
+            self.preamble = self.__buffer[: match.start()]
+            self.__buffer = self.__buffer[match.end() :]
+            self.__in_array = True
+
+        items: typing.List[typing.Any] = []
+        buffer: str = self.__buffer
+        position: int = 0
+        length: int = len(buffer)
+        while True:
+            while position < length and buffer[position] in self.__WHITESPACE:
+                position += 1
+            if (
+                position < length
+                and buffer[position] == ","
+                and len(items) + self.item_count > 0
+            ):
+                position += 1
+                while position < length and buffer[position] in self.__WHITESPACE:
+                    position += 1
+            if position >= length:
+                break
+            if buffer[position] == "]":
+                position += 1
+                self.__array_complete = True
+                break
+            try:
+                item, end = self.__json_decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Most likely the item is only partly here - wait for the rest of it.
+                if final:
+                    raise
+                break
+            # A number cut off part-way (like '-2.' of '-2.5e3') still decodes, so an item only
+            # counts once the separator after it has arrived too.
+            if not final and (end == length or buffer[end] not in self.__SEPARATORS):
+                break
+            items += [item]
+            position = end
+
+        self.__buffer = buffer[position:]
+        self.item_count += len(items)
+        return items
+
+    def __str__(self) -> str:
+        return f"« StreamingJsonArrayDecoder '{self.key}', {self.item_count} items decoded »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
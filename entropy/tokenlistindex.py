@@ -0,0 +1,281 @@
+# # ⚠ Warning
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT
+# LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN
+# NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# [🥭 Entropy Markets](https://entropy.trade/) support is available at:
+#   [Docs](https://docs.entropy.trade/)
+#   [Discord](https://discord.gg/67jySBhxrg)
+#   [Twitter](https://twitter.com/entropymarkets)
+#   [Github](https://github.com/blockworks-foundation)
+#   [Email](mailto:hello@blockworks.foundation)
+
+import json
+import logging
+import mmap
+import os
+import stat
+import struct
+import typing
+import zlib
+
+
+# The index file starts with a header of:
+#   magic: [u8; 8], source_mtime_ns: u64, source_size: u64, entry_count: u32, mint_slots: u32, symbol_slots: u32
+_MAGIC: bytes = b"ENTKIDX1"
+_HEADER: struct.Struct = struct.Struct("<8sQQIII")
+_OFFSET: struct.Struct = struct.Struct("<I")
+# Each hash table slot is (hash of key, entry number + 1), with an entry number of 0 meaning empty.
+_SLOT: struct.Struct = struct.Struct("<II")
+
+# Only these fields of each token are kept in the index.
+_FIELDS: typing.Sequence[str] = ["symbol", "name", "decimals", "address"]
+
+
+# # 🥭 TokenListIndex class
+#
+# A `TokenListIndex` gives O(1) lookups by mint address and by (upper-cased) symbol into a token list
+# JSON file like `solana.tokenlist.json`, without parsing the whole file every time.
+#
+# The index is a single file holding two open-addressing hash tables and a blob of compact JSON
+# records, one per token. `open()` memory-maps it, so nothing is read until a lookup touches it, and
+# only the records actually looked up are ever decoded. The index remembers the modification time
+# and size of the token list it was built from, and `open()` rebuilds it if the token list changes or
+# if the index file isn't owned by (and only writable by) the current user.
+#
+# As with a linear search through the `tokens` list, if more than one token has the same mint or
+# symbol, the first one in the list is the one found.
+#
+class TokenListIndex:
+    def __init__(self, buffer: typing.Union[bytes, mmap.mmap]) -> None:
+        magic, _, _, entry_count, mint_slots, symbol_slots = _HEADER.unpack_from(
+            buffer, 0
+        )
+        if magic != _MAGIC:
+            raise Exception(f"Token list index has unexpected magic value {magic!r}.")
+
+        self.__buffer: typing.Union[bytes, mmap.mmap] = buffer
+        self.entry_count: int = entry_count
+        self.__mint_slots: int = mint_slots
+        self.__symbol_slots: int = symbol_slots
+        self.__offsets_start: int = _HEADER.size
+        self.__mint_table_start: int = (
+            self.__offsets_start + (entry_count + 1) * _OFFSET.size
+        )
+        self.__symbol_table_start: int = (
+            self.__mint_table_start + mint_slots * _SLOT.size
+        )
+        self.__records_start: int = (
+            self.__symbol_table_start + symbol_slots * _SLOT.size
+        )
+        self.__records: typing.Dict[int, typing.Dict[str, typing.Any]] = {}
+
+    def find_by_mint(self, mint: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        return self.__find(
+            self.__mint_table_start,
+            self.__mint_slots,
+            mint,
+            lambda record: bool(record["address"] == mint),
+        )
+
+    def find_by_symbol(
+        self, symbol: str
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        normalised: str = TokenListIndex.normalise_symbol(symbol)
+        return self.__find(
+            self.__symbol_table_start,
+            self.__symbol_slots,
+            normalised,
+            lambda record: TokenListIndex.normalise_symbol(record["symbol"])
+            == normalised,
+        )
+
+    # Matches `Instrument.symbols_match()`.
+    @staticmethod
+    def normalise_symbol(symbol: str) -> str:
+        return symbol.upper()
+
+    def __find(
+        self,
+        table_start: int,
+        slot_count: int,
+        key: str,
+        matches: typing.Callable[[typing.Dict[str, typing.Any]], bool],
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        if slot_count == 0:
+            return None
+
+        key_hash: int = TokenListIndex.__hash(key)
+        slot: int = key_hash & (slot_count - 1)
+        while True:
+            slot_hash, entry_plus_one = _SLOT.unpack_from(
+                self.__buffer, table_start + slot * _SLOT.size
+            )
+            if entry_plus_one == 0:
+                return None
+            if slot_hash == key_hash:
+                record = self.__record(entry_plus_one - 1)
+                if matches(record):
+                    return record
+            slot = (slot + 1) & (slot_count - 1)
+
+    def __record(self, entry: int) -> typing.Dict[str, typing.Any]:
+        record = self.__records.get(entry)
+        if record is None:
+            start, end = struct.unpack_from(
+                "<II", self.__buffer, self.__offsets_start + entry * _OFFSET.size
+            )
+            record = json.loads(
+                self.__buffer[self.__records_start + start : self.__records_start + end]
+            )
+            self.__records[entry] = record
+        return record
+
+    @staticmethod
+    def __hash(key: str) -> int:
+        return zlib.crc32(key.encode("utf-8"))
+
+    @staticmethod
+    def __slot_count(key_count: int) -> int:
+        # A power of two, and never more than half full, so probe sequences stay short.
+        slot_count: int = 1
+        while slot_count < key_count * 2:
+            slot_count *= 2
+        return slot_count
+
+    @staticmethod
+    def __build_table(keys: typing.Dict[str, int]) -> bytes:
+        slot_count: int = TokenListIndex.__slot_count(len(keys))
+        slots: typing.List[typing.Tuple[int, int]] = [(0, 0)] * slot_count
+        for key, entry in keys.items():
+            key_hash: int = TokenListIndex.__hash(key)
+            slot: int = key_hash & (slot_count - 1)
+            while slots[slot][1] != 0:
+                slot = (slot + 1) & (slot_count - 1)
+            slots[slot] = (key_hash, entry + 1)
+        return b"".join(_SLOT.pack(*slot) for slot in slots)
+
+    @staticmethod
+    def build(
+        token_data: typing.Dict[str, typing.Any],
+        source_mtime_ns: int = 0,
+        source_size: int = 0,
+    ) -> bytes:
+        records: typing.List[bytes] = []
+        mints: typing.Dict[str, int] = {}
+        symbols: typing.Dict[str, int] = {}
+        for entry, token in enumerate(token_data["tokens"]):
+            records += [
+                json.dumps(
+                    {field: token[field] for field in _FIELDS},
+                    separators=(",", ":"),
+                ).encode("utf-8")
+            ]
+            mints.setdefault(token["address"], entry)
+            symbols.setdefault(TokenListIndex.normalise_symbol(token["symbol"]), entry)
+
+        offsets: typing.List[int] = [0]
+        for record in records:
+            offsets += [offsets[-1] + len(record)]
+
+        mint_table: bytes = TokenListIndex.__build_table(mints)
+        symbol_table: bytes = TokenListIndex.__build_table(symbols)
+        return b"".join(
+            [
+                _HEADER.pack(
+                    _MAGIC,
+                    source_mtime_ns,
+                    source_size,
+                    len(records),
+                    len(mint_table) // _SLOT.size,
+                    len(symbol_table) // _SLOT.size,
+                ),
+                struct.pack(f"<{len(offsets)}I", *offsets),
+                mint_table,
+                symbol_table,
+                *records,
+            ]
+        )
+
+    @staticmethod
+    def is_current(index_filename: str, source_filename: str) -> bool:
+        try:
+            with open(index_filename, "rb") as index_file:
+                return TokenListIndex.__is_current_file(index_file, source_filename)
+        except OSError:
+            return False
+
+    # An index file is only used if it was built from the current version of the token list, and if
+    # it belongs to the current user and no-one else can write to it. Otherwise anyone able to write
+    # to the index directory could plant an index that returns the wrong mint for a symbol.
+    @staticmethod
+    def __is_current_file(index_file: typing.BinaryIO, source_filename: str) -> bool:
+        index = os.fstat(index_file.fileno())
+        if hasattr(os, "getuid") and index.st_uid != os.getuid():
+            return False
+        if index.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return False
+
+        source = os.stat(source_filename)
+        header = index_file.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            return False
+
+        magic, mtime_ns, size, _, _, _ = _HEADER.unpack(header)
+        return (
+            magic == _MAGIC
+            and mtime_ns == source.st_mtime_ns
+            and size == source.st_size
+        )
+
+    # Opens the index for `source_filename` stored at `index_filename`, (re)building it first if it
+    # is missing, out of date or not trusted. If the index can't be written (say, a read-only
+    # filesystem) the index is built and used in memory instead.
+    @staticmethod
+    def open(source_filename: str, index_filename: str) -> "TokenListIndex":
+        try:
+            with open(index_filename, "rb") as index_file:
+                if TokenListIndex.__is_current_file(index_file, source_filename):
+                    return TokenListIndex(
+                        mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    )
+        except OSError:
+            pass
+
+        source = os.stat(source_filename)
+        with open(source_filename, encoding="utf-8") as json_file:
+            token_data = json.load(json_file)
+        built: bytes = TokenListIndex.build(
+            token_data, source.st_mtime_ns, source.st_size
+        )
+        temporary_filename = f"{index_filename}.{os.getpid()}.tmp"
+        created: bool = False
+        try:
+            os.makedirs(os.path.dirname(index_filename), mode=0o700, exist_ok=True)
+            descriptor = os.open(
+                temporary_filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+            )
+            created = True
+            with os.fdopen(descriptor, "wb") as index_file:
+                index_file.write(built)
+            os.replace(temporary_filename, index_filename)
+        except OSError as exception:
+            logging.getLogger("TokenListIndex").warning(
+                f"Could not write token list index '{index_filename}', using it from memory: {exception}"
+            )
+            if created:
+                try:
+                    os.remove(temporary_filename)
+                except OSError:
+                    pass
+
+        return TokenListIndex(built)
+
+    def __str__(self) -> str:
+        return f"« TokenListIndex [{self.entry_count} tokens] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
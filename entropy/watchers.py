@@ -33,12 +33,12 @@ from .inventory import Inventory
 from .loadedmarket import LoadedMarket
 from .markets import InventorySource
 from .modelstate import EventQueue
-from .observables import Disposable, LatestItemObserverSubscriber
+from .observables import Disposable, EventSource, LatestItemObserverSubscriber
 from .openorders import OpenOrders
 from .oracle import Price
 from .oracle import OracleProvider
 from .oraclefactory import create_oracle_provider
-from .orders import OrderBook
+from .orders import OrderBook, OrderBookDelta, Side
 from .perpeventqueue import PerpEventQueue
 from .perpmarket import PerpMarket
 from .placedorder import PlacedOrdersContainer
@@ -356,12 +356,20 @@ def build_serum_inventory_watcher(
     return LamdaUpdateWatcher(serum_inventory_accessor)
 
 
+# In `incremental` mode, each update to the bids or asks account is diffed against the orders already
+# in the book, and only the changes are applied. If `changes` is passed, an `OrderBookDelta` is
+# published to it for every update that changed anything.
 def build_orderbook_watcher(
     context: Context,
     manager: WebSocketSubscriptionManager,
     health_check: HealthCheck,
     market: LoadedMarket,
+    incremental: bool = False,
+    changes: typing.Optional[EventSource[OrderBookDelta]] = None,
 ) -> Watcher[OrderBook]:
+    if changes is not None and not incremental:
+        raise Exception("Order book changes are only published in incremental mode.")
+
     orderbook_addresses: typing.List[PublicKey] = [
         market.bids_address,
         market.asks_address,
@@ -383,14 +391,32 @@ def build_orderbook_watcher(
         orderbook_infos[0], orderbook_infos[1]
     )
 
+    def _apply_changes(side: Side, account_info: AccountInfo) -> OrderBook:
+        previous = (
+            updatable_orderbook.bids_at(None)
+            if side == Side.BUY
+            else updatable_orderbook.asks_at(None)
+        )
+        side_changes = market.parse_account_info_to_order_changes(
+            account_info, previous
+        )
+        updatable_orderbook.apply_changes(side, side_changes)
+        if changes is not None and len(side_changes) > 0:
+            changes.on_next(OrderBookDelta(side, side_changes, updatable_orderbook))
+        return updatable_orderbook
+
     def _update_bids(account_info: AccountInfo) -> OrderBook:
-        new_bids = market.parse_account_info_to_orders(account_info)
-        updatable_orderbook.bids = new_bids
+        if incremental:
+            return _apply_changes(Side.BUY, account_info)
+        new_bids = market.parse_account_info_to_book_orders(account_info)
+        updatable_orderbook.replace_orders(Side.BUY, new_bids)
         return updatable_orderbook
 
     def _update_asks(account_info: AccountInfo) -> OrderBook:
-        new_asks = market.parse_account_info_to_orders(account_info)
-        updatable_orderbook.asks = new_asks
+        if incremental:
+            return _apply_changes(Side.SELL, account_info)
+        new_asks = market.parse_account_info_to_book_orders(account_info)
+        updatable_orderbook.replace_orders(Side.SELL, new_asks)
         return updatable_orderbook
 
     bids_subscription = WebSocketAccountSubscription[OrderBook](
@@ -15,8 +15,12 @@
 
 import abc
 import logging
+import queue
+import threading
+import traceback
 import typing
 import websocket
+import zlib
 
 from dataclasses import dataclass
 from rx.subject.behaviorsubject import BehaviorSubject
@@ -233,15 +237,203 @@ class WebSocketLogSubscription(AddressWebSocketSubscription[LogEvent]):
         return LogEvent.from_response(response)
 
 
+# # 🥭 NotificationPipeline class
+#
+# A `NotificationPipeline` takes the raw `params` of a subscription notification, builds the
+# subscription's object from it (for instance parsing an `Account` or an orderbook side) and publishes
+# that object to the subscription's subscribers.
+#
+class NotificationPipeline(RxDisposable, metaclass=abc.ABCMeta):
+    @property
+    def queue_depth(self) -> int:
+        return 0
+
+    @property
+    def dropped(self) -> int:
+        return 0
+
+    @property
+    def processed(self) -> int:
+        return 0
+
+    @abc.abstractmethod
+    def submit(
+        self, subscription: WebSocketSubscription[typing.Any], params: RPCResponse
+    ) -> None:
+        raise NotImplementedError(
+            "NotificationPipeline.submit() is not implemented on the base type."
+        )
+
+    def dispose(self) -> None:
+        pass
+
+
+# # 🥭 NullNotificationPipeline class
+#
+# The `NullNotificationPipeline` does all the work on the calling thread - usually the websocket's
+# receiving thread - as soon as the notification arrives. This is how notifications have always been
+# handled.
+#
+class NullNotificationPipeline(NotificationPipeline):
+    def submit(
+        self, subscription: WebSocketSubscription[typing.Any], params: RPCResponse
+    ) -> None:
+        built = subscription.build_subscribed_instance(params)
+        subscription.publisher.publish(built)
+
+
+@dataclass
+class _PendingNotification:
+    subscription: WebSocketSubscription[typing.Any]
+    params: RPCResponse
+    slot: typing.Optional[int]
+
+
+# # 🥭 ThreadedNotificationPipeline class
+#
+# The `ThreadedNotificationPipeline` hands notifications to a pool of worker threads, so slow
+# parsing doesn't hold up the websocket thread (and every message queued up behind it).
+#
+# Each subscription is always handled by the same worker, so updates for an account are still
+# published in the order they arrived.
+#
+# Account updates are superseded by newer updates of the same account. If a newer notification for an
+# account arrives while an older one is still waiting to be parsed, the older one is dropped and only
+# the newer one is parsed. Notifications from an older slot than one already handled are dropped too.
+# (Program subscriptions are coalesced per account, not per subscription. Signature and log
+# notifications are never dropped - each is a separate event.)
+#
+class ThreadedNotificationPipeline(NotificationPipeline):
+    def __init__(self, worker_count: int = 2) -> None:
+        self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        self.__lock: threading.Lock = threading.Lock()
+        self.__pending: typing.Dict[typing.Any, _PendingNotification] = {}
+        self.__latest_slots: typing.Dict[typing.Any, int] = {}
+        self.__dropped: int = 0
+        self.__processed: int = 0
+        self.__queues: typing.Sequence["queue.Queue[typing.Any]"] = [
+            queue.Queue() for _ in range(worker_count)
+        ]
+        for index, work_queue in enumerate(self.__queues):
+            thread = threading.Thread(
+                target=self.__run,
+                args=(work_queue,),
+                name=f"notification-parser-{index}",
+                daemon=True,
+            )
+            thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(work_queue.qsize() for work_queue in self.__queues)
+
+    @property
+    def dropped(self) -> int:
+        return self.__dropped
+
+    @property
+    def processed(self) -> int:
+        return self.__processed
+
+    def submit(
+        self, subscription: WebSocketSubscription[typing.Any], params: RPCResponse
+    ) -> None:
+        work_queue = self.__queues[subscription.id % len(self.__queues)]
+        key = self.__coalescing_key(subscription, params)
+        if key is None:
+            work_queue.put(_PendingNotification(subscription, params, None))
+            return
+
+        slot: typing.Optional[int] = self.__slot(params)
+        with self.__lock:
+            latest_slot: typing.Optional[int] = self.__latest_slots.get(key)
+            pending = self.__pending.get(key)
+            if pending is not None and pending.slot is not None:
+                latest_slot = max(latest_slot or 0, pending.slot)
+            if slot is not None and latest_slot is not None and slot < latest_slot:
+                self.__dropped += 1
+                return
+
+            self.__pending[key] = _PendingNotification(subscription, params, slot)
+            if pending is not None:
+                # The worker hasn't got to the older update yet, and now it never needs to.
+                self.__dropped += 1
+                return
+
+        work_queue.put(key)
+
+    def dispose(self) -> None:
+        for work_queue in self.__queues:
+            work_queue.put(None)
+
+    def __run(self, work_queue: "queue.Queue[typing.Any]") -> None:
+        while True:
+            item = work_queue.get()
+            if item is None:
+                return
+
+            notification: _PendingNotification
+            if isinstance(item, _PendingNotification):
+                notification = item
+            else:
+                with self.__lock:
+                    notification = self.__pending.pop(item)
+                    if notification.slot is not None:
+                        self.__latest_slots[item] = notification.slot
+
+            try:
+                subscription = notification.subscription
+                built = subscription.build_subscribed_instance(notification.params)
+                subscription.publisher.publish(built)
+            except Exception:
+                self._logger.error(
+                    f"Problem processing notification: {traceback.format_exc()}"
+                )
+            with self.__lock:
+                self.__processed += 1
+
+    @staticmethod
+    def __coalescing_key(
+        subscription: WebSocketSubscription[typing.Any], params: RPCResponse
+    ) -> typing.Any:
+        if isinstance(subscription, WebSocketAccountSubscription):
+            return subscription.id
+        if isinstance(subscription, WebSocketProgramSubscription):
+            return (subscription.id, params["result"]["value"]["pubkey"])
+        return None
+
+    @staticmethod
+    def __slot(params: RPCResponse) -> typing.Optional[int]:
+        try:
+            return int(params["result"]["context"]["slot"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def __str__(self) -> str:
+        return f"« ThreadedNotificationPipeline with {len(self.__queues)} workers - queue depth: {self.queue_depth}, processed: {self.processed}, dropped: {self.dropped} »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
+
+
 # # 🥭 WebSocketSubscriptionManager class
 #
 # The `WebSocketSubscriptionManager` is a base class for different websocket management approaches.
 #
+# Notifications are passed to the `pipeline` to be parsed and published. The default
+# `NullNotificationPipeline` does that immediately, on the websocket's thread.
+#
 class WebSocketSubscriptionManager(RxDisposable, metaclass=abc.ABCMeta):
-    def __init__(self, context: Context, ping_interval: int = 10) -> None:
+    def __init__(
+        self,
+        context: Context,
+        ping_interval: int = 10,
+        pipeline: typing.Optional[NotificationPipeline] = None,
+    ) -> None:
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.context: Context = context
         self.ping_interval: int = ping_interval
+        self.pipeline: NotificationPipeline = pipeline or NullNotificationPipeline()
         self.subscriptions: typing.List[WebSocketSubscription[typing.Any]] = []
 
     def add(self, subscription: WebSocketSubscription[typing.Any]) -> None:
@@ -275,14 +467,25 @@ class ActiveWebSocket:
         context: Context,
         subscription: WebSocketSubscription[typing.Any],
         pong: BehaviorSubject,
+        pipeline: typing.Optional[NotificationPipeline] = None,
     ) -> "ActiveWebSocket":
         def on_open(sock: websocket.WebSocketApp) -> None:
             sock.send(subscription.build_request())
 
+        notification_pipeline: NotificationPipeline = (
+            pipeline or NullNotificationPipeline()
+        )
+
+        def on_item(response: typing.Dict[str, typing.Any]) -> None:
+            if "method" in response:
+                notification_pipeline.submit(subscription, response["params"])
+            else:
+                subscription._on_item(response)
+
         ws: ReconnectingWebsocket = ReconnectingWebsocket(
             context.client.cluster_ws_url, on_open
         )
-        ws.item.subscribe(on_next=subscription._on_item)  # type: ignore[call-arg]
+        ws.item.subscribe(on_next=on_item)  # type: ignore[call-arg]
         ws.ping_interval = context.ping_interval
         ws.open()
         pong_subscription = ws.pong.subscribe(pong)
@@ -301,8 +504,13 @@ class ActiveWebSocket:
 # own websocket.
 #
 class IndividualWebSocketSubscriptionManager(WebSocketSubscriptionManager):
-    def __init__(self, context: Context, ping_interval: int = 10) -> None:
-        super().__init__(context, ping_interval)
+    def __init__(
+        self,
+        context: Context,
+        ping_interval: int = 10,
+        pipeline: typing.Optional[NotificationPipeline] = None,
+    ) -> None:
+        super().__init__(context, ping_interval, pipeline)
         self.pong: BehaviorSubject = BehaviorSubject(local_now())
         self.__subscriptions: typing.Sequence[ActiveWebSocket] = []
 
@@ -310,7 +518,9 @@ class IndividualWebSocketSubscriptionManager(WebSocketSubscriptionManager):
         individual_subscriptions: typing.List[ActiveWebSocket] = []
         for subscription in self.subscriptions:
             individual_subscriptions += [
-                ActiveWebSocket.create(self.context, subscription, self.pong)
+                ActiveWebSocket.create(
+                    self.context, subscription, self.pong, self.pipeline
+                )
             ]
 
         self.__subscriptions = individual_subscriptions
@@ -330,22 +540,44 @@ class IndividualWebSocketSubscriptionManager(WebSocketSubscriptionManager):
 # The `SharedWebSocketSubscriptionManager` runs a single websocket and sends updates to the correct
 # `WebSocketSubscription`.
 #
+# Subscriptions are indexed by both their request ID (used to match the server's confirmation of a
+# subscription request) and their server-assigned subscription ID (used to match notifications), so
+# dispatching a notification takes the same time no matter how many subscriptions share the websocket.
+#
+# Subscription IDs are only valid for the websocket connection that created them. When the websocket
+# reconnects, all the subscription requests are resent and the subscription ID index is rebuilt from
+# the new confirmations.
+#
 class SharedWebSocketSubscriptionManager(WebSocketSubscriptionManager):
-    def __init__(self, context: Context, ping_interval: int = 10) -> None:
-        super().__init__(context, ping_interval)
+    def __init__(
+        self,
+        context: Context,
+        ping_interval: int = 10,
+        websocket_url: typing.Optional[str] = None,
+        pipeline: typing.Optional[NotificationPipeline] = None,
+    ) -> None:
+        super().__init__(context, ping_interval, pipeline)
+        self.websocket_url: typing.Optional[str] = websocket_url
         self.ws: typing.Optional[ReconnectingWebsocket] = None
         self.pong: BehaviorSubject = BehaviorSubject(local_now())
         self._pong_subscription: typing.Optional[RxDisposable] = None
+        self.__subscriptions_by_id: typing.Dict[
+            int, WebSocketSubscription[typing.Any]
+        ] = {}
+        self.__subscriptions_by_subscription_id: typing.Dict[
+            int, WebSocketSubscription[typing.Any]
+        ] = {}
 
     def add(self, subscription: WebSocketSubscription[typing.Any]) -> None:
         self.subscriptions += [subscription]
+        self.__subscriptions_by_id[subscription.id] = subscription
         if self.ws is not None:
             request = subscription.build_request()
             self._logger.info(f"Sending request {request}")
             self.ws.send(subscription.build_request())
 
     def open(self) -> None:
-        websocket_url = self.context.client.cluster_ws_url
+        websocket_url = self.websocket_url or self.context.client.cluster_ws_url
         ws: ReconnectingWebsocket = ReconnectingWebsocket(
             websocket_url, self.open_handler
         )
@@ -364,24 +596,31 @@ class SharedWebSocketSubscriptionManager(WebSocketSubscriptionManager):
             self.ws = None
 
     def add_subscription_id(self, id: int, subscription_id: int) -> None:
-        for subscription in self.subscriptions:
-            if subscription.id == id:
-                self._logger.info(
-                    f"Setting ID {subscription_id} on subscription {subscription.id}."
-                )
-                subscription.subscription_id = subscription_id
-                return
-        self._logger.error(f"[{self.context.name}] Subscription ID {id} not found")
+        subscription = self.__subscriptions_by_id.get(id)
+        if subscription is None:
+            self._logger.error(f"[{self.context.name}] Subscription ID {id} not found")
+            return
+
+        self._logger.info(
+            f"Setting ID {subscription_id} on subscription {subscription.id}."
+        )
+        if (
+            self.__subscriptions_by_subscription_id.get(subscription.subscription_id)
+            is subscription
+        ):
+            del self.__subscriptions_by_subscription_id[subscription.subscription_id]
+        subscription.subscription_id = subscription_id
+        self.__subscriptions_by_subscription_id[subscription_id] = subscription
 
     def subscription_by_subscription_id(
         self, subscription_id: int
     ) -> WebSocketSubscription[typing.Any]:
-        for subscription in self.subscriptions:
-            if subscription.subscription_id == subscription_id:
-                return subscription
-        raise Exception(
-            f"[{self.context.name}] No subscription with subscription ID {subscription_id} could be found."
-        )
+        subscription = self.__subscriptions_by_subscription_id.get(subscription_id)
+        if subscription is None:
+            raise Exception(
+                f"[{self.context.name}] No subscription with subscription ID {subscription_id} could be found."
+            )
+        return subscription
 
     def on_item(self, response: typing.Dict[str, typing.Any]) -> None:
         if "method" not in response:
@@ -396,13 +635,16 @@ class SharedWebSocketSubscriptionManager(WebSocketSubscriptionManager):
         ):
             subscription_id = response["params"]["subscription"]
             subscription = self.subscription_by_subscription_id(subscription_id)
-            built = subscription.build_subscribed_instance(response["params"])
-            subscription.publisher.publish(built)
+            self.pipeline.submit(subscription, response["params"])
         else:
             self._logger.error(f"[{self.context.name}] Unknown response: {response}")
 
     def open_handler(self, ws: websocket.WebSocketApp) -> None:
+        # This is called on every (re)connection. Any subscription IDs we have came from a previous
+        # connection, so forget them - the server will send new ones when it confirms these requests.
+        self.__subscriptions_by_subscription_id = {}
         for subscription in self.subscriptions:
+            subscription.subscription_id = 0
             ws.send(subscription.build_request())
 
     def dispose(self) -> None:
@@ -413,3 +655,112 @@ class SharedWebSocketSubscriptionManager(WebSocketSubscriptionManager):
                 self._pong_subscription = None
             self.ws.close()
             self.ws = None
+
+
+# # 🥭 ShardedWebSocketSubscriptionManager class
+#
+# The `ShardedWebSocketSubscriptionManager` spreads `WebSocketSubscription`s across a fixed number of
+# websockets. Each shard is a `SharedWebSocketSubscriptionManager` with its own websocket, so each has
+# its own reader thread doing the JSON decoding and parsing for its subscriptions, and a reconnect on
+# one shard doesn't interrupt the feeds on the others.
+#
+# Shards can be spread across several websocket URLs (for instance all the `cluster_ws_urls`) - shard
+# N uses URL N modulo the number of URLs.
+#
+# By default a subscription is placed on a shard using a stable hash of what it's subscribed to, so
+# the same account always ends up on the same shard. If `weights` are given instead, each new
+# subscription goes to the shard with the lowest number of subscriptions relative to its weight - for
+# instance weights of [2, 1] put twice as many subscriptions on the first shard as on the second.
+#
+class ShardedWebSocketSubscriptionManager(WebSocketSubscriptionManager):
+    def __init__(
+        self,
+        context: Context,
+        ping_interval: int = 10,
+        shard_count: int = 4,
+        websocket_urls: typing.Optional[typing.Sequence[str]] = None,
+        weights: typing.Optional[typing.Sequence[float]] = None,
+        pipeline: typing.Optional[NotificationPipeline] = None,
+    ) -> None:
+        super().__init__(context, ping_interval, pipeline)
+        if shard_count < 1:
+            raise Exception(
+                f"Shard count must be at least 1 - {shard_count} is invalid."
+            )
+        if weights is not None and len(weights) != shard_count:
+            raise Exception(
+                f"There must be one weight for each of the {shard_count} shards - got {len(weights)} weights."
+            )
+        if weights is not None and any(weight <= 0 for weight in weights):
+            raise Exception(f"Shard weights must all be positive - got {weights}.")
+
+        urls: typing.Sequence[str] = websocket_urls or [context.client.cluster_ws_url]
+        self.weights: typing.Optional[typing.Sequence[float]] = weights
+        self.shards: typing.Sequence[SharedWebSocketSubscriptionManager] = [
+            SharedWebSocketSubscriptionManager(
+                context, ping_interval, urls[index % len(urls)], self.pipeline
+            )
+            for index in range(shard_count)
+        ]
+        self.pong: BehaviorSubject = BehaviorSubject(local_now())
+        self.__pong_subscriptions: typing.List[RxDisposable] = []
+        self.__opened: bool = False
+
+    def shard_for(
+        self, subscription: WebSocketSubscription[typing.Any]
+    ) -> SharedWebSocketSubscriptionManager:
+        if self.weights is not None:
+            weights: typing.Sequence[float] = self.weights
+            index: int = min(
+                range(len(self.shards)),
+                key=lambda i: (len(self.shards[i].subscriptions) + 1) / weights[i],
+            )
+            return self.shards[index]
+
+        # Python's own `hash()` of a `str` changes from run to run, so use CRC32 to keep placement
+        # the same across restarts.
+        key: str = (
+            str(subscription.address)
+            if isinstance(subscription, AddressWebSocketSubscription)
+            else str(subscription.id)
+        )
+        return self.shards[zlib.crc32(key.encode()) % len(self.shards)]
+
+    def add(self, subscription: WebSocketSubscription[typing.Any]) -> None:
+        self.subscriptions += [subscription]
+        shard = self.shard_for(subscription)
+        shard.add(subscription)
+        if self.__opened and shard.ws is None:
+            self.__open_shard(shard)
+
+    def open(self) -> None:
+        self.__opened = True
+        for shard in self.shards:
+            # Don't open websockets that would have nothing to do.
+            if len(shard.subscriptions) > 0:
+                self.__open_shard(shard)
+
+    def __open_shard(self, shard: SharedWebSocketSubscriptionManager) -> None:
+        shard.open()
+        self.__pong_subscriptions += [shard.pong.subscribe(self.pong)]
+
+    def close(self) -> None:
+        self.__opened = False
+        for pong_subscription in self.__pong_subscriptions:
+            pong_subscription.dispose()
+        self.__pong_subscriptions = []
+        for shard in self.shards:
+            shard.close()
+
+    def dispose(self) -> None:
+        # Each shard disposes of its own subscriptions.
+        self.close()
+        for shard in self.shards:
+            shard.dispose()
+
+    def __str__(self) -> str:
+        counts = [len(shard.subscriptions) for shard in self.shards]
+        return f"« ShardedWebSocketSubscriptionManager with {len(self.shards)} shards holding {counts} subscriptions »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
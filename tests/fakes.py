@@ -1,6 +1,10 @@
 import construct
+import contextlib
 import entropy
 import entropy.marketmaking
+import http.server
+import json
+import threading
 import typing
 
 from decimal import Decimal
@@ -54,6 +58,51 @@ class MockClient(entropy.BetterClient):
         )
 
 
+# A tiny local JSON-RPC server for tests that need a real HTTP round trip. `responder` is called
+# with each decoded request and returns an (HTTP status code, JSON-RPC response body) tuple.
+@contextlib.contextmanager
+def fake_rpc_server(
+    responder: typing.Callable[
+        [typing.Dict[str, typing.Any]], typing.Tuple[int, typing.Any]
+    ]
+) -> typing.Iterator[str]:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            status, response = responder(request)
+            body = json.dumps(response).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: typing.Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def fake_rpc_caller(url: str) -> entropy.RPCCaller:
+    return entropy.RPCCaller(
+        "Fake",
+        url,
+        url.replace("http:", "ws:", 1),
+        -1,
+        [],
+        entropy.NullSlotHolder(),
+        entropy.InstructionReporter(),
+    )
+
+
 def fake_public_key() -> PublicKey:
     return PublicKey("11111111111111111111111111111112")
 
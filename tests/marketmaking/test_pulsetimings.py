@@ -0,0 +1,106 @@
+import entropy
+import entropy.marketmaking
+import json
+import pathlib
+import types
+import typing
+
+from decimal import Decimal
+from entropy.marketmaking.orderchain.chain import Chain
+from entropy.marketmaking.orderchain.element import Element
+
+from ..fakes import fake_context, fake_loaded_market, fake_order, fake_wallet
+
+
+class AddOrderElement(Element):
+    def process(
+        self,
+        context: entropy.Context,
+        model_state: entropy.ModelState,
+        orders: typing.Sequence[entropy.Order],
+    ) -> typing.Sequence[entropy.Order]:
+        return [*orders, fake_order(price=Decimal(len(orders) + 1))]
+
+
+def test_chain_records_element_timings() -> None:
+    chain = Chain([AddOrderElement(), AddOrderElement(), AddOrderElement()])
+    timings = entropy.marketmaking.PulseTimings("TEST", entropy.local_now())
+    model_state = typing.cast(entropy.ModelState, None)
+
+    actual = chain.process(fake_context(), model_state, timings)
+
+    assert len(actual) == 3
+    assert [stage for stage, _ in timings.stages] == [
+        "chain[0] AddOrderElement",
+        "chain[1] AddOrderElement",
+        "chain[2] AddOrderElement",
+    ]
+    assert all(seconds >= 0 for _, seconds in timings.stages)
+    assert chain.process(fake_context(), model_state) == actual
+
+
+def test_pulse_publishes_timings_when_not_quoting() -> None:
+    market_maker = entropy.marketmaking.MarketMaker(
+        fake_wallet(),
+        fake_loaded_market(),
+        entropy.NullMarketInstructionBuilder("TEST"),
+        Chain([AddOrderElement()]),
+        entropy.marketmaking.NullOrderReconciler(),
+        None,
+    )
+    published: typing.List[entropy.marketmaking.PulseTimings] = []
+    market_maker.pulse_timings.subscribe(on_next=published.append)
+    model_state = typing.cast(
+        entropy.ModelState, types.SimpleNamespace(price=None, not_quoting=True)
+    )
+
+    market_maker.pulse(fake_context(), model_state)
+
+    assert len(published) == 1
+    assert published[0].outcome == "not quoting"
+    assert [stage for stage, _ in published[0].stages] == ["chain[0] AddOrderElement"]
+
+
+def test_timings_record_stages() -> None:
+    actual = entropy.marketmaking.PulseTimings("TEST", entropy.local_now())
+    actual.record("chunk", 0.002)
+    with actual.time("send"):
+        pass
+
+    assert [stage for stage, _ in actual.stages] == ["chunk", "send"]
+    assert actual.total >= 0.002
+    assert "send" in str(actual)
+
+
+def test_histograms_bucket_stages(tmp_path: pathlib.Path) -> None:
+    actual = entropy.marketmaking.PulseTimingHistograms()
+    first = entropy.marketmaking.PulseTimings("TEST", entropy.local_now())
+    first.record("reconcile", 0.0004)
+    first.record("send", 0.3)
+    first.transaction_sizes = [1100, 300]
+    first.outcome = "complete"
+    second = entropy.marketmaking.PulseTimings("TEST", entropy.local_now())
+    second.record("reconcile", 0.001)
+    second.outcome = "not quoting"
+
+    actual.add(first)
+    actual.add(second)
+
+    bounds = list(entropy.marketmaking.PulseTimingHistograms.DURATION_BOUNDS_MS)
+    reconcile = actual.durations["reconcile"]
+    assert sum(reconcile) == 2
+    assert reconcile[bounds.index(0.5)] == 1
+    assert reconcile[bounds.index(1)] == 1
+    assert actual.durations["send"][bounds.index(500)] == 1
+    assert sum(actual.durations["total"]) == 2
+    assert actual.transaction_sizes == [0, 1, 0, 0, 1, 0]
+    assert actual.transaction_counts == {2: 1, 0: 1}
+    assert actual.outcomes == {"complete": 1, "not quoting": 1}
+
+    filename = str(tmp_path / "timings.json")
+    actual.write(filename)
+    with open(filename) as json_file:
+        written = json.load(json_file)
+    assert written["pulses"] == 2
+    assert written["durations_ms"]["stages"]["reconcile"] == reconcile
+    assert written["transactions_per_pulse"] == {"0": 1, "2": 1}
@@ -1,4 +1,6 @@
 import entropy
+import random
+import typing
 
 from datetime import timedelta
 from decimal import Decimal
@@ -437,3 +439,78 @@ def test_reconcile_two_acceptable_two_unacceptable_orders() -> None:
     # Desired 4 outcomes
     assert result.to_place[1] == desired[3]
     assert result.to_cancel[1] == existing[3]
+
+
+def __random_orders(generator: random.Random, count: int) -> typing.List[entropy.Order]:
+    return [
+        entropy.Order.from_values(
+            generator.choice([entropy.Side.BUY, entropy.Side.SELL]),
+            price=Decimal(generator.randint(9900, 10100)) / 100,
+            quantity=Decimal(generator.choice([5, 10, 10, 20])),
+        )
+        for _ in range(count)
+    ]
+
+
+def __assert_same_outcomes(
+    tolerance: Decimal,
+    existing: typing.Sequence[entropy.Order],
+    desired: typing.Sequence[entropy.Order],
+) -> None:
+    # ModelState is ignored when matching.
+    model_state = typing.cast(entropy.ModelState, None)
+    linear = ToleranceOrderReconciler(
+        tolerance, tolerance, timedelta(seconds=0), indexed=False
+    ).reconcile(model_state, existing, desired)
+    indexed = ToleranceOrderReconciler(
+        tolerance, tolerance, timedelta(seconds=0), indexed=True
+    ).reconcile(model_state, existing, desired)
+
+    # Orders compare equal by value, so check identity to be sure the same orders were picked.
+    for actual, expected in [
+        (indexed.to_place, linear.to_place),
+        (indexed.to_cancel, linear.to_cancel),
+        (indexed.to_keep, linear.to_keep),
+        (indexed.to_ignore, linear.to_ignore),
+    ]:
+        assert [id(order) for order in actual] == [id(order) for order in expected]
+
+
+def test_reconcile_indexed_matches_linear() -> None:
+    generator = random.Random(7)
+    for tolerance in ["0", "0.0005", "0.001", "0.01", "1", "2"]:
+        for _ in range(20):
+            __assert_same_outcomes(
+                Decimal(tolerance),
+                __random_orders(generator, generator.randint(0, 40)),
+                __random_orders(generator, generator.randint(0, 40)),
+            )
+
+
+def test_reconcile_indexed_falls_back_for_negative_prices() -> None:
+    existing = [
+        entropy.Order.from_values(
+            entropy.Side.BUY, price=Decimal(-1), quantity=Decimal(10)
+        ),
+        entropy.Order.from_values(
+            entropy.Side.BUY, price=Decimal(1), quantity=Decimal(10)
+        ),
+    ]
+    desired = [
+        entropy.Order.from_values(
+            entropy.Side.BUY, price=Decimal("-1.001"), quantity=Decimal(10)
+        ),
+    ]
+
+    __assert_same_outcomes(Decimal("0.01"), existing, desired)
+
+
+def test_reconcile_indexed_matches_linear_for_many_orders() -> None:
+    generator = random.Random(11)
+    existing = __random_orders(generator, 1000)
+    desired = [
+        order.with_update(price=order.price * Decimal("1.0001"))
+        for order in generator.sample(existing, 1000)
+    ]
+
+    __assert_same_outcomes(Decimal("0.001"), existing, desired)
@@ -1,5 +1,5 @@
 import pytest
-
+import typing
 from .context import entropy
 from .data import load_data_from_directory
 from .fakes import (
@@ -450,3 +450,56 @@ def test_derive_referrer_memory_address() -> None:
     expected = PublicKey("3CMpC1UzdLrAnGz6HZVoBsDLAHpTABkUJr8iPyEHwehr")
 
     assert actual == expected
+
+
+def test_account_parser_matches_account_parse() -> None:
+    group, cache, account, _ = load_data_from_directory("tests/testdata/account5")
+    actual = entropy.AccountParser(group, cache).parse(account.account_info)
+
+    assert str(actual) == str(account)
+    assert actual.slots_by_index[1] is not None
+    assert actual.slots_by_index[1].base_instrument.symbol == "BTC"
+
+
+def test_account_parser_streams_accounts_in_order() -> None:
+    group, cache, account, _ = load_data_from_directory("tests/testdata/account5")
+    account_infos = [account.account_info] * 5
+    parser = entropy.AccountParser(group, cache)
+
+    streamed = parser.parse_all(iter(account_infos))
+    first = next(streamed)
+    assert str(first) == str(account)
+    assert len(list(streamed)) == 4
+
+    pooled = list(parser.parse_all(account_infos, worker_count=2))
+    assert [str(parsed) for parsed in pooled] == [str(account)] * 5
+
+
+def test_account_parser_pool_reads_account_infos_as_they_are_needed() -> None:
+    group, cache, account, _ = load_data_from_directory("tests/testdata/account5")
+    chunk_size = entropy.AccountParser.WORKER_CHUNK_SIZE
+    read = [0]
+
+    def __account_infos() -> typing.Iterator[entropy.AccountInfo]:
+        for _ in range(chunk_size * 5):
+            read[0] += 1
+            yield account.account_info
+
+    pooled = entropy.AccountParser(group, cache).parse_all(
+        __account_infos(), worker_count=1
+    )
+    first = next(pooled)
+
+    # One worker has at most `WORKER_CHUNKS_IN_FLIGHT` chunks submitted at a time.
+    assert read[0] == chunk_size * entropy.AccountParser.WORKER_CHUNKS_IN_FLIGHT
+    assert [str(parsed) for parsed in [first, *pooled]] == [str(account)] * (
+        chunk_size * 5
+    )
+
+
+def test_account_parser_rejects_wrong_size() -> None:
+    group, cache, _, _ = load_data_from_directory("tests/testdata/account5")
+    parser = entropy.AccountParser(group, cache)
+
+    with pytest.raises(Exception):
+        parser.parse(fake_account_info(data=bytes(100)))
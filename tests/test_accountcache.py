@@ -0,0 +1,193 @@
+import threading
+import time
+import typing
+
+from .context import entropy
+
+
+class FetchRecorder:
+    def __init__(self, slot: int = 10, pause: float = 0) -> None:
+        self.slot: int = slot
+        self.pause: float = pause
+        self.calls: typing.List[typing.Sequence[str]] = []
+
+    def __call__(
+        self, addresses: typing.Sequence[str]
+    ) -> typing.Tuple[int, typing.Sequence[typing.Any]]:
+        self.calls += [addresses]
+        time.sleep(self.pause)
+        return self.slot, [f"value-{address}" for address in addresses]
+
+
+def test_second_load_is_served_from_cache() -> None:
+    fetch = FetchRecorder()
+    actual = entropy.AccountCache(60, 100, lambda: 0)
+
+    slot, values = actual.load("v", ["a", "b"], fetch)
+    assert slot == 10
+    assert values == ["value-a", "value-b"]
+
+    _, values = actual.load("v", ["b", "c", "a"], fetch)
+    assert values == ["value-b", "value-c", "value-a"]
+    assert fetch.calls == [["a", "b"], ["c"]]
+    assert actual.hits == 2
+    assert actual.misses == 3
+
+
+def test_variants_are_cached_separately() -> None:
+    fetch = FetchRecorder()
+    actual = entropy.AccountCache(60, 100, lambda: 0)
+
+    actual.load("processed", ["a"], fetch)
+    actual.load("finalized", ["a"], fetch)
+    assert fetch.calls == [["a"], ["a"]]
+
+
+def test_expired_entries_are_refetched() -> None:
+    fetch = FetchRecorder()
+    actual = entropy.AccountCache(0.01, 100, lambda: 0)
+
+    actual.load("v", ["a"], fetch)
+    time.sleep(0.02)
+    actual.load("v", ["a"], fetch)
+    assert fetch.calls == [["a"], ["a"]]
+
+
+def test_entries_from_stale_slots_are_refetched() -> None:
+    fetch = FetchRecorder(slot=10)
+    slot_holder = entropy.CheckingSlotHolder()
+    actual = entropy.AccountCache(60, 100, lambda: slot_holder.latest_slot)
+
+    actual.load("v", ["a"], fetch)
+    actual.load("v", ["a"], fetch)
+    assert len(fetch.calls) == 1
+
+    slot_holder.require_data_from_fresh_slot(10)
+    fetch.slot = 11
+    slot, _ = actual.load("v", ["a"], fetch)
+    assert len(fetch.calls) == 2
+    assert slot == 11
+
+
+def test_least_recently_used_is_evicted() -> None:
+    fetch = FetchRecorder()
+    actual = entropy.AccountCache(60, 2, lambda: 0)
+
+    actual.load("v", ["a", "b"], fetch)
+    actual.load("v", ["a"], fetch)
+    actual.load("v", ["c"], fetch)
+    assert actual.size == 2
+
+    actual.load("v", ["a", "b"], fetch)
+    assert fetch.calls == [["a", "b"], ["c"], ["b"]]
+
+
+def test_concurrent_identical_requests_are_coalesced() -> None:
+    fetch = FetchRecorder(pause=0.1)
+    actual = entropy.AccountCache(60, 100, lambda: 0)
+    results: typing.List[typing.Sequence[typing.Any]] = []
+
+    def __load() -> None:
+        results.append(actual.load("v", ["a"], fetch)[1])
+
+    threads = [threading.Thread(target=__load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fetch.calls) == 1
+    assert results == [["value-a"]] * 4
+    assert actual.misses == 1
+    assert actual.coalesced == 3
+
+
+class BlockingFetch:
+    def __init__(
+        self, results: typing.Sequence[typing.Tuple[int, typing.Sequence[typing.Any]]]
+    ) -> None:
+        self.results: typing.List[
+            typing.Tuple[int, typing.Sequence[typing.Any]]
+        ] = list(results)
+        self.calls: typing.List[typing.Sequence[str]] = []
+        self.release = threading.Event()
+
+    def __call__(
+        self, addresses: typing.Sequence[str]
+    ) -> typing.Tuple[int, typing.Sequence[typing.Any]]:
+        self.calls += [addresses]
+        if len(self.calls) == 1:
+            self.release.wait(5)
+        return self.results.pop(0)
+
+
+def __wait_for_coalesced(actual: entropy.AccountCache) -> None:
+    for _ in range(500):
+        if actual.coalesced > 0:
+            return
+        time.sleep(0.01)
+
+
+def test_joined_fetch_from_stale_slot_is_refetched() -> None:
+    fetch = BlockingFetch([(10, ["old-a"]), (11, ["new-a"])])
+    latest_slot: typing.List[int] = [0]
+    actual = entropy.AccountCache(60, 100, lambda: latest_slot[0])
+    results: typing.List[typing.Tuple[int, typing.Sequence[typing.Any]]] = []
+
+    first = threading.Thread(target=lambda: actual.load("v", ["a"], fetch))
+    first.start()
+    while len(fetch.calls) == 0:
+        time.sleep(0.01)
+
+    # The first fetch was sent before slot 11 was required, so its data is too old for this load.
+    latest_slot[0] = 11
+    second = threading.Thread(
+        target=lambda: results.append(actual.load("v", ["a"], fetch))
+    )
+    second.start()
+    __wait_for_coalesced(actual)
+    fetch.release.set()
+    first.join(5)
+    second.join(5)
+
+    assert results == [(11, ["new-a"])]
+    assert fetch.calls == [["a"], ["a"]]
+    assert actual.load("v", ["a"], fetch) == (11, ["new-a"])
+
+
+def test_short_fetch_fails_every_waiting_load() -> None:
+    fetch = BlockingFetch([(10, [])])
+    actual = entropy.AccountCache(60, 100, lambda: 0)
+    errors: typing.List[Exception] = []
+
+    def __load() -> None:
+        try:
+            actual.load("v", ["a"], fetch)
+        except Exception as exception:
+            errors.append(exception)
+
+    threads = [threading.Thread(target=__load) for _ in range(2)]
+    threads[0].start()
+    while len(fetch.calls) == 0:
+        time.sleep(0.01)
+    threads[1].start()
+    __wait_for_coalesced(actual)
+    fetch.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 2
+    assert len(fetch.calls) == 1
+
+    # Nothing is left in flight, so the next load fetches again.
+    _, values = actual.load("v", ["a"], FetchRecorder())
+    assert values == ["value-a"]
+
+
+def test_null_account_cache_always_fetches() -> None:
+    fetch = FetchRecorder()
+    actual = entropy.NullAccountCache()
+
+    actual.load("v", ["a"], fetch)
+    actual.load("v", ["a"], fetch)
+    assert fetch.calls == [["a"], ["a"]]
@@ -1,7 +1,13 @@
+import pytest
+import time
+import typing
+
 from .context import entropy
+from .fakes import fake_context
 
 from decimal import Decimal
 from solana.publickey import PublicKey
+from solana.rpc.types import DataSliceOpts
 
 
 def test_constructor() -> None:
@@ -40,3 +46,97 @@ def test_split_list_into_chunks() -> None:
     split_20 = entropy.AccountInfo._split_list_into_chunks(list_to_split, 20)
     assert len(split_20) == 1
     assert split_20[0] == ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"]
+
+
+def __fake_context_returning_accounts(
+    addresses: typing.Sequence[PublicKey],
+    gma_concurrency: int,
+    missing: typing.Optional[PublicKey] = None,
+) -> entropy.Context:
+    context = fake_context()
+    context.gma_chunk_size = Decimal(2)
+    context.gma_concurrency = gma_concurrency
+    context.gma_rate_limiter = entropy.TokenBucketRateLimiter(0)
+
+    def __get_multiple_accounts(
+        pubkeys: typing.Sequence[PublicKey], *args: typing.Any
+    ) -> typing.Any:
+        # Make early chunks slowest so concurrent calls complete out of order.
+        time.sleep(0.01 * (len(addresses) - addresses.index(pubkeys[0])))
+        return [
+            None
+            if pubkey == missing
+            else {
+                "executable": False,
+                "lamports": 1,
+                "owner": str(pubkey),
+                "rentEpoch": 0,
+                "data": ["", "base64"],
+            }
+            for pubkey in pubkeys
+        ]
+
+    setattr(context.client, "get_multiple_accounts", __get_multiple_accounts)
+    return context
+
+
+def test_load_multiple_concurrently_keeps_order() -> None:
+    addresses = [PublicKey(index + 1) for index in range(9)]
+    sequential = entropy.AccountInfo.load_multiple(
+        __fake_context_returning_accounts(addresses, 1), addresses
+    )
+    concurrent = entropy.AccountInfo.load_multiple(
+        __fake_context_returning_accounts(addresses, 4), addresses
+    )
+    assert [info.address for info in sequential] == addresses
+    assert [info.address for info in concurrent] == addresses
+    assert [info.owner for info in concurrent] == addresses
+
+
+def test_load_multiple_concurrently_raises_for_missing_account() -> None:
+    addresses = [PublicKey(index + 1) for index in range(9)]
+    context = __fake_context_returning_accounts(addresses, 4, missing=addresses[5])
+    with pytest.raises(Exception, match=f"Failed to fetch account {addresses[5]}"):
+        entropy.AccountInfo.load_multiple(context, addresses)
+
+
+def test_load_by_program_prefiltered_fetches_only_matches() -> None:
+    addresses = [PublicKey(index + 1) for index in range(9)]
+    context = __fake_context_returning_accounts(addresses, 2)
+    requested_slices: typing.List[typing.Any] = []
+
+    def __get_program_accounts_streaming(
+        pubkey: PublicKey, data_slice: typing.Any = None, **kwargs: typing.Any
+    ) -> typing.Iterator[typing.Any]:
+        requested_slices.append(data_slice)
+        for address in addresses:
+            yield {
+                "pubkey": str(address),
+                "account": {
+                    "executable": False,
+                    "lamports": 1,
+                    "owner": str(address),
+                    "rentEpoch": 0,
+                    "data": ["", "base64"],
+                },
+            }
+
+    setattr(
+        context.client,
+        "get_program_accounts_streaming",
+        __get_program_accounts_streaming,
+    )
+    data_slice = DataSliceOpts(offset=0, length=1)
+    actual = list(
+        entropy.AccountInfo.load_by_program_prefiltered(
+            context,
+            PublicKey(99),
+            data_slice,
+            lambda partial: partial.address != addresses[4],
+        )
+    )
+
+    assert requested_slices == [data_slice]
+    assert [info.address for info in actual] == [
+        address for address in addresses if address != addresses[4]
+    ]
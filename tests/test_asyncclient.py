@@ -0,0 +1,147 @@
+import asyncio
+import httpx
+import pytest
+import time
+import typing
+
+from .context import entropy
+from .fakes import fake_context, fake_rpc_caller, fake_rpc_server
+
+from solana.rpc.types import RPCMethod
+
+
+__FAKE_RPC_METHOD = RPCMethod("fake")
+
+
+def __ok(request: typing.Dict[str, typing.Any]) -> typing.Tuple[int, typing.Any]:
+    return 200, {"jsonrpc": "2.0", "id": request["id"], "result": request["method"]}
+
+
+def __rate_limited(
+    request: typing.Dict[str, typing.Any]
+) -> typing.Tuple[int, typing.Any]:
+    return 429, {}
+
+
+def test_async_rpc_caller_makes_request() -> None:
+    with fake_rpc_server(__ok) as url:
+        actual = entropy.AsyncRPCCaller(fake_rpc_caller(url))
+        response = asyncio.run(actual.make_request(__FAKE_RPC_METHOD))
+        assert response["result"] == "fake"
+
+
+def test_async_rpc_caller_maps_rate_limit_exception() -> None:
+    with fake_rpc_server(__rate_limited) as url:
+        actual = entropy.AsyncRPCCaller(fake_rpc_caller(url))
+        with pytest.raises(entropy.TooManyRequestsRateLimitException):
+            asyncio.run(actual.make_request(__FAKE_RPC_METHOD))
+
+
+def test_async_compound_rpc_caller_fails_over_and_rebases() -> None:
+    with fake_rpc_server(__rate_limited) as url1, fake_rpc_server(__ok) as url2:
+        provider1 = fake_rpc_caller(url1)
+        provider2 = fake_rpc_caller(url2)
+        compound = entropy.CompoundRPCCaller("fake", [provider1, provider2])
+        actual = entropy.AsyncCompoundRPCCaller(compound)
+
+        response = asyncio.run(actual.make_request(__FAKE_RPC_METHOD))
+
+        assert response["result"] == "fake"
+        assert compound.current == provider2
+        assert actual.current.rpc_caller == provider2
+
+
+def test_async_compound_rpc_caller_all_failing_raises_exception() -> None:
+    with fake_rpc_server(__rate_limited) as url1, fake_rpc_server(
+        __rate_limited
+    ) as url2:
+        compound = entropy.CompoundRPCCaller(
+            "fake", [fake_rpc_caller(url1), fake_rpc_caller(url2)]
+        )
+        actual = entropy.AsyncCompoundRPCCaller(compound)
+
+        with pytest.raises(entropy.CompoundException):
+            asyncio.run(actual.make_request(__FAKE_RPC_METHOD))
+
+
+def test_async_requests_overlap() -> None:
+    import threading
+    import time
+
+    in_flight: typing.List[int] = [0, 0]
+    lock = threading.Lock()
+
+    def __slow(request: typing.Dict[str, typing.Any]) -> typing.Tuple[int, typing.Any]:
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.2)
+        with lock:
+            in_flight[0] -= 1
+        return __ok(request)
+
+    with fake_rpc_server(__slow) as url:
+        actual = entropy.AsyncRPCCaller(fake_rpc_caller(url))
+
+        async def __gather() -> typing.Sequence[typing.Any]:
+            return await asyncio.gather(
+                *[actual.make_request(__FAKE_RPC_METHOD) for _ in range(4)]
+            )
+
+        responses = asyncio.run(__gather())
+
+        assert len(responses) == 4
+        assert in_flight[1] == 4
+
+
+def test_async_compound_rpc_caller_hedges_slow_reads() -> None:
+    def __slow(request: typing.Dict[str, typing.Any]) -> typing.Tuple[int, typing.Any]:
+        time.sleep(1)
+        return __ok(request)
+
+    with fake_rpc_server(__slow) as url1, fake_rpc_server(__ok) as url2:
+        provider1 = fake_rpc_caller(url1)
+        provider2 = fake_rpc_caller(url2)
+        compound = entropy.CompoundRPCCaller("test", [provider1, provider2], 95, 0.05)
+        actual = entropy.AsyncCompoundRPCCaller(compound)
+
+        started_at = time.monotonic()
+        response = asyncio.run(actual.make_request(RPCMethod("getSlot")))
+
+        assert response["result"] == "getSlot"
+        assert time.monotonic() - started_at < 1
+        assert compound.hedged_requests == 1
+        assert compound.current == provider2
+
+
+def test_async_better_client_runs_coroutines_on_one_loop() -> None:
+    actual = entropy.AsyncBetterClient(fake_context().client)
+
+    async def __running_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    first = actual.run(__running_loop())
+    second = actual.run(__running_loop())
+
+    assert first is second
+    assert first.is_running()
+
+    actual.dispose()
+    assert first.is_closed()
+
+
+def test_async_better_client_opens_no_unused_session(monkeypatch: typing.Any) -> None:
+    created: typing.List[typing.Any] = []
+    original_init = httpx.AsyncClient.__init__
+
+    def __tracking_init(
+        self: typing.Any, *args: typing.Any, **kwargs: typing.Any
+    ) -> None:
+        created.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(httpx.AsyncClient, "__init__", __tracking_init)
+    actual = entropy.AsyncBetterClient(fake_context().client)
+
+    assert actual.compatible_client._provider is actual.rpc_caller
+    assert created == []
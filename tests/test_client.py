@@ -1,7 +1,9 @@
 import pytest
+import time
 import typing
 
 from .context import entropy
+from .fakes import fake_rpc_caller, fake_rpc_server
 
 from solana.rpc.types import RPCMethod, RPCResponse
 
@@ -170,3 +172,249 @@ def test_all_failing_raises_exception() -> None:
         actual.make_request(__FAKE_RPC_METHOD, "fake")
 
     assert actual.current == provider1
+
+
+def test_pooled_session_reuses_connection() -> None:
+    with fake_rpc_server(
+        lambda request: (200, {"jsonrpc": "2.0", "id": request["id"], "result": 1})
+    ) as url:
+        actual = fake_rpc_caller(url)
+        for _ in range(3):
+            assert actual.make_request(__FAKE_RPC_METHOD)["result"] == 1
+
+        assert actual.connection_statistics.opened == 1
+        assert actual.connection_statistics.reused == 2
+        actual.close()
+
+
+def test_hedged_read_uses_first_response() -> None:
+    def __slow(request: typing.Dict[str, typing.Any]) -> typing.Tuple[int, typing.Any]:
+        time.sleep(1)
+        return (200, {"jsonrpc": "2.0", "id": request["id"], "result": "slow"})
+
+    def __fast(request: typing.Dict[str, typing.Any]) -> typing.Tuple[int, typing.Any]:
+        return (200, {"jsonrpc": "2.0", "id": request["id"], "result": "fast"})
+
+    with fake_rpc_server(__slow) as slow_url, fake_rpc_server(__fast) as fast_url:
+        slow = fake_rpc_caller(slow_url)
+        fast = fake_rpc_caller(fast_url)
+        actual = entropy.CompoundRPCCaller("test", [slow, fast], 95, 0.05)
+
+        started_at = time.monotonic()
+        response = actual.make_request(RPCMethod("getAccountInfo"), "fake")
+
+        assert response["result"] == "fast"
+        assert time.monotonic() - started_at < 1
+        assert actual.hedged_requests == 1
+        assert actual.current == fast
+        actual.close()
+
+
+def test_hedged_reads_never_hedge_transactions() -> None:
+    provider1 = FakeRPCCaller()
+    provider2 = FakeRPCCaller()
+    actual = entropy.CompoundRPCCaller("test", [provider1, provider2], 95, 0.05)
+
+    assert actual.should_hedge(RPCMethod("getMultipleAccounts"))
+    assert not actual.should_hedge(RPCMethod("sendTransaction"))
+
+    actual.make_request(RPCMethod("sendTransaction"), "fake")
+    assert provider1.called
+    assert not provider2.called
+    assert actual.hedged_requests == 0
+
+
+def test_hedge_delay_uses_percentile_of_read_latencies() -> None:
+    actual = entropy.CompoundRPCCaller(
+        "test", [FakeRPCCaller(), FakeRPCCaller()], 90, 0.05
+    )
+    assert actual.hedge_delay == 0.05
+
+    for index in range(1, 11):
+        actual.record_read_latency(RPCMethod("getAccountInfo"), index / 10)
+    actual.record_read_latency(RPCMethod("sendTransaction"), 100)
+
+    assert actual.hedge_delay == pytest.approx(0.9)
+
+
+def test_provider_statistics_tracks_latency_and_errors() -> None:
+    actual = entropy.ProviderStatistics(window_size=4)
+    actual.record_success(0.1, 10)
+    actual.record_success(0.3, 12)
+    actual.record_success(0.2, None)
+    actual.record_error()
+
+    assert actual.samples == 4
+    assert actual.error_rate == 0.25
+    assert actual.median_latency == 0.2
+    assert actual.latency_percentile(95) == 0.3
+    assert actual.latest_slot == 12
+
+    # The window only holds the latest 4 outcomes.
+    actual.record_success(0.1, None)
+    assert actual.error_rate == 0.25
+    actual.record_success(0.1, None)
+    actual.record_success(0.1, None)
+    actual.record_success(0.1, None)
+    assert actual.error_rate == 0
+
+
+def test_rpc_caller_records_provider_statistics() -> None:
+    with fake_rpc_server(
+        lambda request: (
+            200,
+            {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "result": {"context": {"slot": 1234}, "value": None},
+            },
+        )
+    ) as url:
+        actual = fake_rpc_caller(url)
+        actual.make_request(RPCMethod("getAccountInfo"), "fake")
+        actual.close()
+
+    assert actual.provider_statistics.samples == 1
+    assert actual.provider_statistics.error_rate == 0
+    assert actual.provider_statistics.latest_slot == 1234
+
+    with fake_rpc_server(lambda request: (429, {})) as url:
+        actual = fake_rpc_caller(url)
+        with pytest.raises(entropy.RateLimitException):
+            actual.make_request(RPCMethod("getAccountInfo"), "fake")
+        actual.close()
+
+    assert actual.provider_statistics.error_rate == 1
+
+
+def test_ranking_promotes_faster_healthy_provider() -> None:
+    slow = FakeRPCCaller()
+    fast = FakeRPCCaller()
+    lagging = FakeRPCCaller()
+    for _ in range(10):
+        slow.provider_statistics.record_success(0.5, 100)
+        slow.provider_statistics.record_probe(0.5)
+        fast.provider_statistics.record_success(0.05, 100)
+        fast.provider_statistics.record_probe(0.05)
+        lagging.provider_statistics.record_success(0.01, 90)
+        lagging.provider_statistics.record_probe(0.01)
+
+    actual = entropy.CompoundRPCCaller("test", [slow, lagging, fast])
+    changes: typing.List[entropy.RPCCaller] = []
+    actual.on_provider_change = lambda: changes.append(actual.current)
+    actual.rank_providers()
+
+    assert actual.all_providers == [fast, slow, lagging]
+    assert changes == [fast]
+
+    rankings = actual.rankings
+    assert [ranking.cluster_rpc_url for ranking in rankings] == [
+        fast.cluster_rpc_url,
+        slow.cluster_rpc_url,
+        lagging.cluster_rpc_url,
+    ]
+    assert rankings[2].slot_lag == 10
+
+
+def test_ranking_keeps_head_unless_clearly_better() -> None:
+    head = FakeRPCCaller()
+    other = FakeRPCCaller()
+    unknown = FakeRPCCaller()
+    for _ in range(10):
+        head.provider_statistics.record_success(0.10, 100)
+        head.provider_statistics.record_probe(0.10)
+        other.provider_statistics.record_success(0.09, 100)
+        other.provider_statistics.record_probe(0.09)
+
+    actual = entropy.CompoundRPCCaller("test", [head, unknown, other])
+    actual.rank_providers()
+    assert actual.all_providers == [head, other, unknown]
+
+    # A head with no statistics at all is replaced by the best known provider.
+    actual = entropy.CompoundRPCCaller("test", [unknown, head, other])
+    actual.rank_providers()
+    assert actual.all_providers == [other, head, unknown]
+
+
+def test_ranking_compares_probe_latencies_only() -> None:
+    head = FakeRPCCaller()
+    other = FakeRPCCaller()
+    for _ in range(10):
+        # The head handles the heavy requests, the other provider only sees probes.
+        head.provider_statistics.record_success(2.0, 100)
+        head.provider_statistics.record_probe(0.10)
+        other.provider_statistics.record_success(0.09, 100)
+        other.provider_statistics.record_probe(0.09)
+
+    actual = entropy.CompoundRPCCaller("test", [head, other])
+    actual.rank_providers()
+
+    assert actual.all_providers == [head, other]
+    assert actual.rankings[0].probe_latency == pytest.approx(0.10)
+
+
+def test_ranking_probes_all_providers_when_due() -> None:
+    provider1 = FakeRPCCaller()
+    provider2 = FakeRPCCaller()
+    actual = entropy.CompoundRPCCaller(
+        "test", [provider1, provider2], ranking_interval=0.01
+    )
+    time.sleep(0.02)
+    actual.make_request(__FAKE_RPC_METHOD, "fake")
+    actual.close()
+
+    # The probes run in the background, so give them a moment.
+    time.sleep(0.1)
+    assert provider2.called
+    assert provider2.provider_statistics.probe_samples == 1
+
+
+def test_streaming_request_yields_result_items() -> None:
+    items = [{"pubkey": f"key {index}", "account": {}} for index in range(500)]
+    with fake_rpc_server(
+        lambda request: (200, {"jsonrpc": "2.0", "result": items, "id": request["id"]})
+    ) as url:
+        actual = fake_rpc_caller(url)
+        streamed = actual.make_streaming_request(
+            RPCMethod("getProgramAccounts"), "fake"
+        )
+        assert next(streamed) == items[0]
+        assert list(streamed) == items[1:]
+        actual.close()
+
+    assert actual.provider_statistics.samples == 1
+    assert actual.provider_statistics.error_rate == 0
+
+
+def test_streaming_request_raises_error_response() -> None:
+    with fake_rpc_server(
+        lambda request: (
+            200,
+            {
+                "jsonrpc": "2.0",
+                "error": {"code": -32005, "message": "behind", "data": {}},
+                "id": request["id"],
+            },
+        )
+    ) as url:
+        actual = fake_rpc_caller(url)
+        with pytest.raises(entropy.NodeIsBehindException):
+            list(actual.make_streaming_request(RPCMethod("getProgramAccounts"), "x"))
+        actual.close()
+
+    assert actual.provider_statistics.error_rate == 1
+
+
+def test_streaming_request_moves_to_next_provider() -> None:
+    with fake_rpc_server(lambda request: (429, {})) as limited_url, fake_rpc_server(
+        lambda request: (200, {"jsonrpc": "2.0", "result": [1, 2], "id": 1})
+    ) as working_url:
+        limited = fake_rpc_caller(limited_url)
+        working = fake_rpc_caller(working_url)
+        actual = entropy.CompoundRPCCaller("test", [limited, working])
+
+        streamed = actual.make_streaming_request(RPCMethod("getProgramAccounts"), "x")
+
+        assert list(streamed) == [1, 2]
+        assert actual.current == working
+        actual.close()
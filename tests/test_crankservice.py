@@ -0,0 +1,188 @@
+import threading
+import typing
+
+from .context import entropy
+from .fakes import (
+    fake_account_info,
+    fake_context,
+    fake_loaded_market,
+    fake_seeded_public_key,
+    fake_wallet,
+)
+
+from datetime import timedelta
+from decimal import Decimal
+from solana.publickey import PublicKey
+from solana.transaction import TransactionInstruction
+
+
+class FakeEvent:
+    def __init__(self, *names: str) -> None:
+        self.accounts_to_crank: typing.Sequence[PublicKey] = [
+            fake_seeded_public_key(name) for name in names
+        ]
+
+
+class FakeEventQueue:
+    def __init__(self, sequence_number: int, *events: FakeEvent) -> None:
+        self.sequence_number: Decimal = Decimal(sequence_number)
+        self.count: Decimal = Decimal(len(events))
+        self.unprocessed_events: typing.Sequence[FakeEvent] = events
+
+
+class FakeCrankInstructionBuilder(entropy.NullMarketInstructionBuilder):
+    def __init__(self) -> None:
+        super().__init__("FAKE")
+        self.cranked: typing.List[typing.Sequence[PublicKey]] = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def build_crank_instructions(
+        self, addresses: typing.Sequence[PublicKey], limit: Decimal = Decimal(32)
+    ) -> entropy.CombinableInstructions:
+        self.cranked += [addresses]
+        self.entered.set()
+        self.release.wait(5)
+        instruction = TransactionInstruction(
+            keys=[], program_id=fake_seeded_public_key("program"), data=bytes()
+        )
+        return entropy.CombinableInstructions([], [instruction])
+
+
+def __build_service(
+    threshold: int = 1, resend_after: timedelta = timedelta(seconds=30)
+) -> typing.Tuple[
+    entropy.CrankService,
+    FakeCrankInstructionBuilder,
+    typing.List[str],
+    typing.List[int],
+]:
+    context = fake_context()
+    sent: typing.List[str] = []
+
+    def __send_transaction(*_: typing.Any) -> str:
+        sent.append("signature")
+        return "signature"
+
+    context.client.send_transaction = __send_transaction  # type: ignore[assignment]
+    actual = entropy.CrankService(
+        context, fake_wallet(), threshold=threshold, resend_after=resend_after
+    )
+    builder = FakeCrankInstructionBuilder()
+    actual.add(fake_loaded_market(), builder)
+    pulses: typing.List[int] = []
+    actual.pulse_complete.subscribe(on_next=lambda _: pulses.append(1))
+    return actual, builder, sent, pulses
+
+
+def test_cranks_when_accounts_are_waiting() -> None:
+    actual, builder, sent, pulses = __build_service()
+
+    actual.handle(actual.markets[0], FakeEventQueue(0))
+    assert builder.cranked == []
+
+    actual.handle(
+        actual.markets[0], FakeEventQueue(2, FakeEvent("a", "b"), FakeEvent("a"))
+    )
+    assert builder.cranked == [
+        [
+            fake_seeded_public_key("a"),
+            fake_seeded_public_key("b"),
+            fake_seeded_public_key("a"),
+        ]
+    ]
+    assert sent == ["signature"]
+    assert actual.markets[0].crank_count == 1
+    assert len(pulses) == 2
+
+
+def test_threshold_counts_distinct_accounts() -> None:
+    actual, builder, sent, pulses = __build_service(threshold=2)
+
+    actual.handle(actual.markets[0], FakeEventQueue(2, FakeEvent("a"), FakeEvent("a")))
+    assert builder.cranked == []
+
+    actual.handle(actual.markets[0], FakeEventQueue(3, FakeEvent("a"), FakeEvent("b")))
+    assert len(builder.cranked) == 1
+    assert len(sent) == 1
+    assert len(pulses) == 2
+
+
+def test_updates_during_crank_are_coalesced() -> None:
+    actual, builder, sent, _ = __build_service()
+    builder.release.clear()
+
+    cranking = threading.Thread(
+        target=actual.handle,
+        args=(actual.markets[0], FakeEventQueue(1, FakeEvent("first"))),
+    )
+    cranking.start()
+    assert builder.entered.wait(5)
+
+    # These arrive while the first crank is still being built, so only the last is cranked.
+    actual.handle(actual.markets[0], FakeEventQueue(2, FakeEvent("second")))
+    actual.handle(actual.markets[0], FakeEventQueue(3, FakeEvent("third")))
+    builder.release.set()
+    cranking.join(5)
+
+    assert builder.cranked == [
+        [fake_seeded_public_key("first")],
+        [fake_seeded_public_key("third")],
+    ]
+    assert len(sent) == 2
+
+
+def test_poll_handles_all_markets() -> None:
+    actual, builder, sent, _ = __build_service()
+    other_builder = FakeCrankInstructionBuilder()
+    other_market = actual.add(fake_loaded_market(), other_builder)
+    setattr(
+        actual.markets[0].market,
+        "parse_account_info_to_event_queue",
+        lambda _: FakeEventQueue(1, FakeEvent("a")),
+    )
+    setattr(
+        other_market.market,
+        "parse_account_info_to_event_queue",
+        lambda _: FakeEventQueue(0),
+    )
+    original_load_multiple = entropy.AccountInfo.load_multiple
+    entropy.AccountInfo.load_multiple = lambda context, addresses: [  # type: ignore[assignment]
+        fake_account_info(address) for address in addresses
+    ]
+    try:
+        actual.poll()
+    finally:
+        entropy.AccountInfo.load_multiple = original_load_multiple  # type: ignore[assignment]
+
+    assert builder.cranked == [[fake_seeded_public_key("a")]]
+    assert other_builder.cranked == []
+    assert len(sent) == 1
+
+
+def test_unconfirmed_crank_is_not_sent_again() -> None:
+    actual, builder, sent, pulses = __build_service()
+    event_queue = FakeEventQueue(5, FakeEvent("a"), FakeEvent("b"))
+
+    # The crank hasn't landed yet, so the second update still shows the same events.
+    actual.handle(actual.markets[0], event_queue)
+    actual.handle(actual.markets[0], event_queue)
+    assert len(builder.cranked) == 1
+    assert sent == ["signature"]
+    assert len(pulses) == 2
+
+    # The queue has moved past the first crank, so new events are cranked.
+    actual.handle(actual.markets[0], FakeEventQueue(7, FakeEvent("c")))
+    assert builder.cranked[-1] == [fake_seeded_public_key("c")]
+    assert len(sent) == 2
+
+
+def test_crank_is_sent_again_after_resend_after() -> None:
+    actual, builder, sent, _ = __build_service(resend_after=timedelta(seconds=0))
+    event_queue = FakeEventQueue(5, FakeEvent("a"), FakeEvent("b"))
+
+    actual.handle(actual.markets[0], event_queue)
+    actual.handle(actual.markets[0], event_queue)
+    assert len(builder.cranked) == 2
+    assert len(sent) == 2
@@ -0,0 +1,69 @@
+import pytest
+
+from .context import entropy
+from .data import load_data_from_directory
+
+
+__FIXTURES = [
+    "empty",
+    "1deposit",
+    "account1",
+    "account2",
+    "account3",
+    "account4",
+    "account5",
+    "account6",
+    "account7",
+    "account8",
+    "account9",
+    "account10",
+    "account11",
+]
+
+
+def __approx(value: object) -> object:
+    return pytest.approx(float(str(value)), rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("fixture", __FIXTURES)
+def test_engine_matches_dataframe_health(fixture: str) -> None:
+    group, cache, account, open_orders = load_data_from_directory(
+        f"tests/testdata/{fixture}"
+    )
+    frame = account.to_dataframe(group, open_orders, cache)
+
+    actual = entropy.HealthEngine(group, cache).evaluate([account], open_orders)
+
+    assert actual.init_health[0] == __approx(account.init_health(frame).value)
+    assert actual.maint_health[0] == __approx(account.maint_health(frame).value)
+    assert actual.init_health_ratio[0] == __approx(account.init_health_ratio(frame))
+    assert actual.maint_health_ratio[0] == __approx(account.maint_health_ratio(frame))
+    assert bool(actual.is_liquidatable[0]) == account.is_liquidatable(frame)
+
+
+def test_engine_evaluates_batch() -> None:
+    group, cache, account, open_orders = load_data_from_directory(
+        "tests/testdata/account4"
+    )
+    engine = entropy.HealthEngine(group, cache)
+    single = engine.evaluate([account], open_orders)
+
+    actual = engine.evaluate([account, account, account], open_orders)
+
+    assert list(actual.init_health) == [single.init_health[0]] * 3
+    assert list(actual.maint_health) == [single.maint_health[0]] * 3
+    assert actual.liquidatable_accounts == [account, account, account]
+    assert engine.evaluate([], open_orders).init_health.shape == (0,)
+
+
+def test_engine_batch_matches_dataframe_health() -> None:
+    group, cache, account, open_orders = load_data_from_directory(
+        "tests/testdata/account3"
+    )
+    accounts = [account] * 20
+
+    actual = entropy.HealthEngine(group, cache).evaluate(accounts, open_orders)
+
+    for index, each in enumerate(accounts):
+        frame = each.to_dataframe(group, open_orders, cache)
+        assert actual.maint_health[index] == __approx(each.maint_health(frame).value)
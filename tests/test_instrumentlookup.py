@@ -135,3 +135,17 @@ def test_all_expected_v3_instruments() -> None:
     check_expected("BNB", "9gP2kCy3wA1ctvYWQk75guqXuHfrEomqydHLtcTCqiLa")
     check_expected("AVAX", "KgV1GvrHQmRBY8sHQQeUKwTm2r2h8t4C8qt12Cw1HVE")
     check_expected("LUNA", "F6v4wfAdJB8D8p77bMXZgYt8TDKsYxLYxH5AFhUkYx9W")
+
+
+def test_ids_json_token_lookup() -> None:
+    actual = entropy.IdsJsonTokenLookup("mainnet", "mainnet.2")
+
+    mngo = actual.find_by_symbol("mngo")
+    assert mngo is not None
+    assert mngo.symbol == "MNGO"
+    assert actual.find_by_mint(mngo.mint) is mngo
+    assert actual.find_by_symbol("MNGO") is mngo
+    assert actual.find_by_symbol("DOGE") is None
+    assert (
+        entropy.IdsJsonTokenLookup("mainnet", "no group").find_by_symbol("MNGO") is None
+    )
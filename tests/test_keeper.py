@@ -0,0 +1,183 @@
+import typing
+
+from .context import entropy
+from .fakes import fake_context, fake_seeded_public_key
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from solana.publickey import PublicKey
+
+
+NOW = datetime(2022, 3, 1, 12, 0, 0, tzinfo=entropy.utc_now().tzinfo)
+FRESH = NOW - timedelta(seconds=2)
+STALE = NOW - timedelta(seconds=30)
+
+
+class FakeTokenBank:
+    def __init__(self, name: str) -> None:
+        self.root_bank_address = fake_seeded_public_key(f"root bank {name}")
+
+
+class FakeSlot:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.base_token_bank = FakeTokenBank(f"base {index}")
+        self.oracle = fake_seeded_public_key(f"oracle {index}")
+
+
+class FakeGroup:
+    def __init__(self) -> None:
+        self.name = "FAKE"
+        self.address = fake_seeded_public_key("group")
+        self.cache = fake_seeded_public_key("cache")
+        self.shared_quote = FakeTokenBank("quote")
+        self.slots = [FakeSlot(0), FakeSlot(1)]
+
+
+class FakeCache:
+    def __init__(self) -> None:
+        count = entropy.layouts.MAX_TOKENS
+        self.price_cache = [entropy.PriceCache(Decimal(1), FRESH)] * count
+        self.root_bank_cache = [
+            entropy.RootBankCache(Decimal(1), Decimal(1), FRESH)
+        ] * count
+        self.perp_market_cache = [
+            entropy.PerpMarketCache(Decimal(0), Decimal(0), FRESH)
+        ] * count
+
+
+class FakePerpMarketDetails:
+    def __init__(self, index: int) -> None:
+        self.market_index = index
+        self.address = fake_seeded_public_key(f"perp market {index}")
+        self.bids = fake_seeded_public_key(f"bids {index}")
+        self.asks = fake_seeded_public_key(f"asks {index}")
+        self.event_queue = fake_seeded_public_key(f"event queue {index}")
+        self.last_updated = FRESH
+
+
+class FakePerpEventQueue:
+    def __init__(self, index: int, sequence_number: int, *names: str) -> None:
+        self.address = fake_seeded_public_key(f"event queue {index}")
+        self.sequence_number = Decimal(sequence_number)
+        self.count = Decimal(len(names))
+        self.accounts_to_crank: typing.Sequence[PublicKey] = [
+            fake_seeded_public_key(name) for name in names
+        ]
+
+
+def __build_keeper() -> entropy.Keeper:
+    group = FakeGroup()
+    node_bank_addresses = {
+        str(bank.root_bank_address): [fake_seeded_public_key("node bank")]
+        for bank in [
+            group.shared_quote,
+            *[slot.base_token_bank for slot in group.slots],
+        ]
+    }
+    return entropy.Keeper(
+        fake_context(),
+        typing.cast(entropy.Group, group),
+        node_bank_addresses,
+        typing.cast(entropy.Cache, FakeCache()),
+        typing.cast(
+            typing.Sequence[entropy.PerpMarketDetails],
+            [FakePerpMarketDetails(0), FakePerpMarketDetails(1)],
+        ),
+        typing.cast(
+            typing.Sequence[entropy.PerpEventQueue],
+            [FakePerpEventQueue(0, 0), FakePerpEventQueue(1, 0)],
+        ),
+        timedelta(seconds=10),
+    )
+
+
+def __instructions(
+    instructions: entropy.CombinableInstructions,
+) -> typing.Sequence[typing.Tuple[bytes, typing.Sequence[PublicKey]]]:
+    # Each instruction as its data and the accounts after the group and cache.
+    return [
+        (instruction.data, [key.pubkey for key in instruction.keys[2:]])
+        for instruction in instructions.instructions
+    ]
+
+
+def test_fresh_keeper_builds_nothing() -> None:
+    actual = __build_keeper()
+
+    assert actual.build_instructions(NOW).instructions == []
+
+
+def test_only_stale_items_are_updated() -> None:
+    actual = __build_keeper()
+    cache = typing.cast(FakeCache, actual.cache)
+    cache.price_cache = list(cache.price_cache)
+    cache.price_cache[1] = entropy.PriceCache(Decimal(1), STALE)
+    cache.root_bank_cache = list(cache.root_bank_cache)
+    cache.root_bank_cache[entropy.layouts.QUOTE_INDEX] = None  # type: ignore[call-overload]
+    typing.cast(FakePerpMarketDetails, actual.perp_markets[0]).last_updated = STALE
+
+    quote_root_bank = fake_seeded_public_key("root bank quote")
+    perp_market = actual.perp_markets[0]
+    assert __instructions(actual.build_instructions(NOW)) == [
+        (entropy.layouts.CACHE_ROOT_BANKS.build({}), [quote_root_bank]),
+        (entropy.layouts.CACHE_PRICES.build({}), [fake_seeded_public_key("oracle 1")]),
+        (
+            entropy.layouts.UPDATE_ROOT_BANK.build({}),
+            [quote_root_bank, fake_seeded_public_key("node bank")],
+        ),
+        (
+            entropy.layouts.UPDATE_FUNDING.build({}),
+            [perp_market.address, perp_market.bids, perp_market.asks],
+        ),
+    ]
+
+    # Sent updates aren't repeated while waiting for them to land, but are after they go stale.
+    assert actual.build_instructions(NOW + timedelta(seconds=5)).instructions == []
+    later = __instructions(actual.build_instructions(NOW + timedelta(seconds=11)))
+    assert (
+        entropy.layouts.UPDATE_FUNDING.build({}),
+        [perp_market.address, perp_market.bids, perp_market.asks],
+    ) in later
+
+
+def test_only_waiting_event_queues_are_cranked() -> None:
+    actual = __build_keeper()
+    actual.event_queues[1] = typing.cast(
+        entropy.PerpEventQueue, FakePerpEventQueue(1, 2, "a", "b")
+    )
+
+    [(_, accounts)] = __instructions(actual.build_instructions(NOW))
+    assert accounts == [
+        actual.perp_markets[1].address,
+        actual.perp_markets[1].event_queue,
+        fake_seeded_public_key("a"),
+        fake_seeded_public_key("b"),
+    ]
+
+    # An update showing the same events (as a new object, like every websocket update) is still
+    # waiting for the crank to land.
+    assert actual.build_instructions(NOW).instructions == []
+    actual.event_queues[1] = typing.cast(
+        entropy.PerpEventQueue, FakePerpEventQueue(1, 2, "a", "b")
+    )
+    assert actual.build_instructions(NOW).instructions == []
+
+    # Once the queue has moved past the crank, new events are cranked.
+    actual.event_queues[1] = typing.cast(
+        entropy.PerpEventQueue, FakePerpEventQueue(1, 3, "c")
+    )
+    assert len(actual.build_instructions(NOW).instructions) == 1
+
+    # A crank that never lands is sent again once it's stale.
+    assert actual.build_instructions(NOW + timedelta(seconds=5)).instructions == []
+    later = __instructions(actual.build_instructions(NOW + timedelta(seconds=11)))
+    assert [
+        accounts for _, accounts in later if fake_seeded_public_key("c") in accounts
+    ] == [
+        [
+            actual.perp_markets[1].address,
+            actual.perp_markets[1].event_queue,
+            fake_seeded_public_key("c"),
+        ]
+    ]
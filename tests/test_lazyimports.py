@@ -0,0 +1,74 @@
+import ast
+import importlib
+import os.path
+import subprocess
+import sys
+import typing
+
+from .context import entropy
+
+
+def __type_checking_imports() -> typing.Dict[str, str]:
+    with open(entropy.__file__) as init_file:
+        tree = ast.parse(init_file.read())
+    imports: typing.Dict[str, str] = {}
+    for statement in tree.body:
+        if isinstance(statement, ast.If):
+            for node in statement.body:
+                assert isinstance(node, ast.ImportFrom)
+                assert node.module is not None
+                for alias in node.names:
+                    imports[alias.name] = node.module
+    return imports
+
+
+def __run(code: str) -> str:
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_exports_match_type_checking_imports() -> None:
+    exports = {
+        name: module
+        for module, names in entropy._exports_by_module.items()
+        for name in names
+    }
+
+    assert len(exports) > 300
+    assert __type_checking_imports() == exports
+
+
+def test_exports_resolve_to_module_values() -> None:
+    for module_name, names in entropy._exports_by_module.items():
+        module = importlib.import_module(f"entropy.{module_name}")
+        for name in names:
+            assert getattr(entropy, name) is getattr(module, name)
+            assert name in dir(entropy)
+
+
+def test_unknown_name_raises_attribute_error() -> None:
+    assert not hasattr(entropy, "NoSuchName")
+
+
+def test_import_does_not_load_modules() -> None:
+    actual = __run(
+        "import sys, entropy; print('entropy.account' in sys.modules, 'entropy.context' in sys.modules)"
+    )
+
+    assert actual == "False False"
+
+
+def test_submodule_imports_do_not_hide_names() -> None:
+    actual = __run(
+        "import entropy, entropy.hedging, entropy.version, entropy.output; entropy.Account; "
+        "print(callable(entropy.output), callable(entropy.version), entropy.layouts.__name__)"
+    )
+
+    assert actual == "True True entropy.layouts.layouts"
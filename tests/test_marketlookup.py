@@ -1,5 +1,6 @@
 from .context import entropy, disable_logging
 
+from decimal import Decimal
 from solana.publickey import PublicKey
 
 from .fakes import fake_seeded_public_key
@@ -207,3 +208,47 @@ def test_compound_lookups_with_full_data() -> None:
 
         non_existant_market = actual.find_by_symbol("ETH/BTC")
         assert non_existant_market is None  # No such market
+
+
+class CountingInstrumentLookup(entropy.InstrumentLookup):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def find_by_symbol(self, symbol: str) -> entropy.Token:
+        self.calls += 1
+        return entropy.Token(symbol, symbol, Decimal(6), fake_seeded_public_key(symbol))
+
+    def find_by_mint(self, mint: PublicKey) -> None:
+        return None
+
+
+def test_ids_json_market_lookup_memoises_markets() -> None:
+    instruments = CountingInstrumentLookup()
+    actual = entropy.IdsJsonMarketLookup("mainnet", instruments)
+
+    btc_perp = actual.find_by_symbol("btc-perp")
+    assert btc_perp is not None
+    assert btc_perp.base.symbol == "BTC"
+    assert btc_perp.quote.symbol == "USDC"
+    assert btc_perp.address == PublicKey("9GE4Q4RR6jTXZSGMf9GK4purKxSPVgRCVM7WLqxi8k8i")
+    calls = instruments.calls
+
+    assert actual.find_by_symbol("PERP:BTC-PERP") is btc_perp
+    assert actual.find_by_address(btc_perp.address) is btc_perp
+    assert instruments.calls == calls
+
+
+def test_ids_json_market_lookup_qualified_symbols() -> None:
+    actual = entropy.IdsJsonMarketLookup("mainnet", CountingInstrumentLookup())
+
+    assert actual.find_by_symbol("SPOT:BTC-PERP") is None
+    assert actual.find_by_symbol("PERP:BTC^2-PERP") is not None
+    assert actual.find_by_symbol("BTC/USDC") is None
+    assert actual.find_by_address(fake_seeded_public_key("no market")) is None
+    assert (
+        entropy.IdsJsonMarketLookup(
+            "nocluster", CountingInstrumentLookup()
+        ).find_by_symbol("BTC-PERP")
+        is None
+    )
@@ -1,11 +1,13 @@
 import random
 import typing
 
+from datetime import timedelta
+
 from .context import entropy
 
 from decimal import Decimal
 
-from .fakes import fake_order_id
+from .fakes import fake_order, fake_order_id, fake_seeded_public_key
 
 
 def test_order_book_sides_sorted_by_price() -> None:
@@ -47,6 +49,264 @@ def test_orderbook_spread() -> None:
     assert orderBook.spread == _get_order(asks).price - _get_order(bids, -1).price
 
 
+def test_orderbook_price_levels_and_depth() -> None:
+    bids = [
+        entropy.Order.from_ids(
+            fake_order_id(1, 10), 0, entropy.Side.BUY, Decimal(10), Decimal(1)
+        ),
+        entropy.Order.from_ids(
+            fake_order_id(2, 10), 0, entropy.Side.BUY, Decimal(10), Decimal(2)
+        ),
+        entropy.Order.from_ids(
+            fake_order_id(3, 9), 0, entropy.Side.BUY, Decimal(9), Decimal(5)
+        ),
+    ]
+    asks = [
+        entropy.Order.from_ids(
+            fake_order_id(4, 12), 0, entropy.Side.SELL, Decimal(12), Decimal(3)
+        ),
+        entropy.Order.from_ids(
+            fake_order_id(5, 11), 0, entropy.Side.SELL, Decimal(11), Decimal(4)
+        ),
+    ]
+    order_book = _construct_order_book(bids=bids, asks=asks)
+
+    assert order_book.bid_levels == [
+        entropy.PriceLevel(Decimal(10), Decimal(3), Decimal(3), 2),
+        entropy.PriceLevel(Decimal(9), Decimal(5), Decimal(8), 1),
+    ]
+    assert order_book.ask_levels == [
+        entropy.PriceLevel(Decimal(11), Decimal(4), Decimal(4), 1),
+        entropy.PriceLevel(Decimal(12), Decimal(3), Decimal(7), 1),
+    ]
+
+    assert order_book.depth_at(entropy.Side.BUY, Decimal(11)) == Decimal(0)
+    assert order_book.depth_at(entropy.Side.BUY, Decimal(10)) == Decimal(3)
+    assert order_book.depth_at(entropy.Side.BUY, Decimal("9.5")) == Decimal(3)
+    assert order_book.depth_at(entropy.Side.BUY, Decimal(1)) == Decimal(8)
+    assert order_book.depth_at(entropy.Side.SELL, Decimal(10)) == Decimal(0)
+    assert order_book.depth_at(entropy.Side.SELL, Decimal(11)) == Decimal(4)
+    assert order_book.depth_at(entropy.Side.SELL, Decimal(100)) == Decimal(7)
+
+
+def test_orderbook_views_follow_expiration() -> None:
+    now = entropy.utc_now()
+    expiring = entropy.Order.from_ids(
+        fake_order_id(1, 20), 0, entropy.Side.BUY, Decimal(20), Decimal(1)
+    ).with_update(expiration=now + timedelta(seconds=10))
+    resting = entropy.Order.from_ids(
+        fake_order_id(2, 10), 0, entropy.Side.BUY, Decimal(10), Decimal(1)
+    )
+    order_book = _construct_order_book(bids=[expiring, resting], asks=[])
+
+    assert order_book.top_bid_at(now) == expiring
+    assert order_book.top_bid_at(now + timedelta(seconds=10)) == resting
+    assert order_book.top_bid_at(now + timedelta(seconds=20)) == resting
+    # Going back before the expiration brings the order back.
+    assert order_book.top_bid_at(now + timedelta(seconds=5)) == expiring
+    assert order_book.bids_at(None) == [expiring, resting]
+    assert order_book.depth_at(entropy.Side.BUY, Decimal(10), cutoff=now) == Decimal(2)
+    assert order_book.depth_at(
+        entropy.Side.BUY, Decimal(10), cutoff=now + timedelta(seconds=30)
+    ) == Decimal(1)
+
+
+def test_orderbook_views_cached_until_book_changes() -> None:
+    order_book = _construct_order_book(
+        bids=_construct_order_book_side(entropy.Side.BUY, 20),
+        asks=_construct_order_book_side(entropy.Side.SELL, 20),
+    )
+
+    first = order_book.bids
+    assert order_book.bids is first
+    assert order_book.bid_levels is order_book.bid_levels
+
+    update = _construct_order_book_side(entropy.Side.BUY, 3)
+    order_book.bids = update
+    assert order_book.bids is not first
+    assert len(order_book.bids) == 3
+    assert order_book.top_bid == _get_order(update, -1)
+
+
+def test_orderbook_depth_queries_exclude_owner() -> None:
+    owner = fake_seeded_public_key("order owner")
+    bids = [
+        fake_order(price=Decimal(78), quantity=Decimal(1), side=entropy.Side.BUY),
+        fake_order(price=Decimal(77), quantity=Decimal(2), side=entropy.Side.BUY),
+        fake_order(price=Decimal(76), quantity=Decimal(1), side=entropy.Side.BUY),
+        fake_order(
+            price=Decimal(75), quantity=Decimal(5), side=entropy.Side.BUY
+        ).with_update(owner=owner),
+        fake_order(price=Decimal(74), quantity=Decimal(3), side=entropy.Side.BUY),
+        fake_order(price=Decimal(73), quantity=Decimal(7), side=entropy.Side.BUY),
+    ]
+    asks = [
+        fake_order(
+            price=Decimal(82), quantity=Decimal(3), side=entropy.Side.SELL
+        ).with_update(owner=owner),
+        fake_order(price=Decimal(83), quantity=Decimal(1), side=entropy.Side.SELL),
+        fake_order(price=Decimal(84), quantity=Decimal(1), side=entropy.Side.SELL),
+    ]
+    order_book = _construct_order_book(bids=bids, asks=asks)
+
+    assert order_book.price_at_depth(entropy.Side.BUY, Decimal(6)) == Decimal(75)
+    assert order_book.price_at_depth(
+        entropy.Side.BUY, Decimal(6), exclude_owner=owner
+    ) == Decimal(74)
+    assert order_book.price_at_depth(entropy.Side.BUY, Decimal(4)) == Decimal(76)
+    assert order_book.price_at_depth(entropy.Side.BUY, Decimal(20)) is None
+    assert order_book.price_at_depth(
+        entropy.Side.SELL, Decimal(2), exclude_owner=owner
+    ) == Decimal(84)
+
+    assert order_book.top_price(entropy.Side.SELL) == Decimal(82)
+    assert order_book.top_price(entropy.Side.SELL, exclude_owner=owner) == Decimal(83)
+    assert order_book.top_price(entropy.Side.BUY, exclude_owner=owner) == Decimal(78)
+
+    # NullLotSizeConverter has a tick size of 1.
+    assert order_book.depth_within_ticks(entropy.Side.BUY, Decimal(0)) == Decimal(1)
+    assert order_book.depth_within_ticks(entropy.Side.BUY, Decimal(3)) == Decimal(9)
+    assert order_book.depth_within_ticks(
+        entropy.Side.BUY, Decimal(3), exclude_owner=owner
+    ) == Decimal(4)
+    assert order_book.depth_within_ticks(
+        entropy.Side.SELL, Decimal(1), exclude_owner=owner
+    ) == Decimal(2)
+
+
+def test_orderbook_depth_queries_on_empty_book() -> None:
+    order_book = _construct_order_book(bids=[], asks=[])
+
+    assert order_book.top_price(entropy.Side.BUY) is None
+    assert order_book.price_at_depth(entropy.Side.SELL, Decimal(1)) is None
+    assert order_book.depth_within_ticks(entropy.Side.SELL, Decimal(5)) == Decimal(0)
+
+
+def test_orderbook_changes_between_sides() -> None:
+    kept = entropy.Order.from_ids(
+        fake_order_id(1, 10), 0, entropy.Side.BUY, Decimal(10), Decimal(5)
+    )
+    filled = entropy.Order.from_ids(
+        fake_order_id(2, 9), 0, entropy.Side.BUY, Decimal(9), Decimal(5)
+    )
+    removed = entropy.Order.from_ids(
+        fake_order_id(3, 8), 0, entropy.Side.BUY, Decimal(8), Decimal(5)
+    )
+    added = entropy.Order.from_ids(
+        fake_order_id(4, 11), 0, entropy.Side.BUY, Decimal(11), Decimal(1)
+    )
+
+    actual = entropy.OrderBookChange.between(
+        [kept, filled, removed], [added, kept, filled.with_update(quantity=Decimal(2))]
+    )
+
+    assert actual == [
+        entropy.OrderBookChange.remove(removed),
+        entropy.OrderBookChange.add(added),
+        entropy.OrderBookChange.fill(
+            filled.with_update(quantity=Decimal(2)), Decimal(5)
+        ),
+    ]
+
+
+def test_orderbook_apply_changes_matches_rebuild() -> None:
+    generator = random.Random(7)
+    for side in [entropy.Side.BUY, entropy.Side.SELL]:
+        before = [
+            entropy.Order.from_ids(
+                fake_order_id(index, price), 0, side, Decimal(price), Decimal(10)
+            )
+            for index, price in enumerate(generator.sample(range(1, 1000), 200))
+        ]
+        after = [
+            order.with_update(quantity=Decimal(generator.randint(1, 10)))
+            for order in before
+            if generator.random() > 0.2
+        ] + [
+            entropy.Order.from_ids(
+                fake_order_id(1000 + index, price), 0, side, Decimal(price), Decimal(3)
+            )
+            for index, price in enumerate(generator.sample(range(1, 1000), 30))
+        ]
+        order_book = _construct_order_book(
+            bids=before if side == entropy.Side.BUY else [],
+            asks=before if side == entropy.Side.SELL else [],
+        )
+        rebuilt = _construct_order_book(
+            bids=after if side == entropy.Side.BUY else [],
+            asks=after if side == entropy.Side.SELL else [],
+        )
+
+        order_book.apply_changes(side, entropy.OrderBookChange.between(before, after))
+
+        assert order_book.bids == rebuilt.bids
+        assert order_book.asks == rebuilt.asks
+
+
+def test_orderbook_snapshot_levels() -> None:
+    owner = fake_seeded_public_key("owner")
+    bids = [
+        entropy.Order.from_ids(
+            fake_order_id(1, 10), 1, entropy.Side.BUY, Decimal(10), Decimal(1)
+        ).with_update(owner=owner),
+        entropy.Order.from_ids(
+            fake_order_id(2, 10), 2, entropy.Side.BUY, Decimal(10), Decimal(2)
+        ).with_update(owner=owner),
+        entropy.Order.from_ids(
+            fake_order_id(3, 9), 3, entropy.Side.BUY, Decimal(9), Decimal(4)
+        ).with_update(owner=owner),
+    ]
+    asks = [
+        entropy.Order.from_ids(
+            fake_order_id(4, 12), 4, entropy.Side.SELL, Decimal(12), Decimal(3)
+        ),
+        entropy.Order.from_ids(
+            fake_order_id(5, 13), 5, entropy.Side.SELL, Decimal(13), Decimal(5)
+        ),
+    ]
+    order_book = _construct_order_book(bids=bids, asks=asks)
+    actual = order_book.snapshot()
+
+    l1 = actual.to_l1_dataframe()
+    assert list(l1.index) == [10, 12]
+    assert list(l1["Quantity"]) == [3, 3]
+
+    l2 = actual.to_l2_dataframe()
+    assert list(l2.index) == [9, 10, 12, 13]
+    assert list(l2["Side"]) == [entropy.Side.BUY] * 2 + [entropy.Side.SELL] * 2
+    assert list(l2["QuantityLots"]) == [4, 3, 3, 5]
+
+    l3 = actual.to_l3_dataframe()
+    # Lowest price first: the bids in reverse, then the asks.
+    expected = [*reversed(order_book.bids), *order_book.asks]
+    assert list(l3["Id"]) == [order.id for order in expected]
+    assert list(l3["ClientId"]) == [order.client_id for order in expected]
+    assert list(l3["Owner"])[:3] == [owner] * 3
+
+
+def test_orderbook_snapshot_drops_expired_orders() -> None:
+    now = entropy.utc_now()
+    expiring = entropy.Order.from_ids(
+        fake_order_id(1, 10), 0, entropy.Side.BUY, Decimal(10), Decimal(1)
+    ).with_update(expiration=now + timedelta(seconds=30))
+    lasting = entropy.Order.from_ids(
+        fake_order_id(2, 9), 0, entropy.Side.BUY, Decimal(9), Decimal(2)
+    )
+    actual = _construct_order_book(bids=[expiring, lasting], asks=[]).snapshot()
+
+    assert len(actual.unexpired_at(now).to_l3_dataframe()) == 2
+    later = actual.unexpired_at(now + timedelta(seconds=60)).to_l3_dataframe()
+    assert list(later["Price"]) == [9]
+
+
+def test_orderbook_snapshot_of_empty_book() -> None:
+    actual = _construct_order_book(bids=[], asks=[]).snapshot()
+
+    assert len(actual.to_l1_dataframe()) == 0
+    assert len(actual.to_l2_dataframe()) == 0
+    assert len(actual.to_l3_dataframe()) == 0
+
+
 # ASK is SELL, BID is BUY
 def _construct_order_book_side(
     askOrBidSide: entropy.Side, size: int
@@ -0,0 +1,290 @@
+import random
+import struct
+import tracemalloc
+import typing
+
+from .context import entropy
+from .fakes import fake_account_info, fake_seeded_public_key
+
+from decimal import Decimal
+
+
+class FakeInstrument:
+    def __init__(self, decimals: int) -> None:
+        self.decimals = Decimal(decimals)
+
+
+class FakeTokenBank:
+    def __init__(self, decimals: int) -> None:
+        self.token = FakeInstrument(decimals)
+
+
+class FakePerpMarketDetails:
+    def __init__(self) -> None:
+        self.base_instrument = FakeInstrument(9)
+        self.quote_token = FakeTokenBank(6)
+        self.base_lot_size = Decimal(10000000)
+        self.quote_lot_size = Decimal(100)
+
+
+__NODE_SIZE = 88
+
+
+def __leaf(key: int, owner: bytes, quantity: int, client_id: int, tif: int) -> bytes:
+    return struct.pack(
+        "<IBBBB16s32sQQqQ",
+        2,
+        1,
+        0,
+        0,
+        tif,
+        key.to_bytes(16, "little"),
+        owner,
+        quantity,
+        client_id,
+        0,
+        1650000000 + client_id,
+    )
+
+
+def __inner(key: int, left: int, right: int) -> bytes:
+    return struct.pack("<II16sII", 1, 0, key.to_bytes(16, "little"), left, right).ljust(
+        __NODE_SIZE, b"\0"
+    )
+
+
+def __free(next: int) -> bytes:
+    return struct.pack("<II", 3, next).ljust(__NODE_SIZE, b"\0")
+
+
+# Leaves are (key, owner, quantity, client ID, time in force).
+__Leaf = typing.Tuple[int, bytes, int, int, int]
+
+
+def __random_leaves(count: int, seed: int = 42) -> typing.List[__Leaf]:
+    generator = random.Random(seed)
+    owners = [bytes(fake_seeded_public_key(f"owner {index}")) for index in range(5)]
+    keys = sorted(
+        (generator.randint(1000, 2000) << 64) | sequence
+        for sequence in generator.sample(range(1, 1_000_000), count)
+    )
+    return [
+        (
+            key,
+            generator.choice(owners),
+            generator.randint(1, 500),
+            index,
+            generator.choice([0, 0, 30]),
+        )
+        for index, key in enumerate(keys)
+    ]
+
+
+# Builds a `BookSide` account holding the leaves, scattered among free and uninitialised nodes.
+def __build_book_side(
+    is_bids: bool, leaves: typing.Sequence[__Leaf], seed: int = 42
+) -> bytes:
+    generator = random.Random(seed)
+    ordered = sorted(leaves)
+    count = len(ordered)
+    node_count = 2 * count - 1 if count > 0 else 0
+    slots = generator.sample(range(entropy.layouts.MAX_BOOK_NODES), node_count)
+    nodes: typing.Dict[int, bytes] = {}
+
+    def __build(low: int, high: int) -> int:
+        index = slots.pop()
+        if high - low == 1:
+            nodes[index] = __leaf(*ordered[low])
+        else:
+            middle = (low + high) // 2
+            left = __build(low, middle)
+            right = __build(middle, high)
+            nodes[index] = __inner(ordered[middle][0], left, right)
+        return index
+
+    root = __build(0, count) if count > 0 else 0
+    body = b"".join(
+        nodes.get(index, __free(0) if index % 3 else bytes(__NODE_SIZE))
+        for index in range(entropy.layouts.MAX_BOOK_NODES)
+    )
+    metadata = struct.pack("<BBB5x", 5 if is_bids else 6, 0, 1)
+    header = struct.pack("<QQIIQ", node_count, 0, 0, root, count)
+    return metadata + header + body
+
+
+def __book_side(is_bids: bool, count: int) -> entropy.PerpOrderBookSide:
+    details = typing.cast(entropy.PerpMarketDetails, FakePerpMarketDetails())
+    account_info = fake_account_info(
+        data=__build_book_side(is_bids, __random_leaves(count))
+    )
+    return entropy.PerpOrderBookSide.parse(account_info, details)
+
+
+def test_decoder_matches_construct_for_bids() -> None:
+    actual = __book_side(True, 200)
+    orders = actual.orders()
+
+    assert len(orders) == 200
+    assert list(orders) == list(actual.orders_from_layout())
+    assert all(order.side == entropy.Side.BUY for order in orders)
+    assert [order.price for order in orders] == sorted(
+        [order.price for order in orders], reverse=True
+    )
+
+
+def test_decoder_matches_construct_for_asks() -> None:
+    actual = __book_side(False, 37)
+    orders = actual.orders()
+
+    assert len(orders) == 37
+    assert list(orders) == list(actual.orders_from_layout())
+    assert [order.price for order in orders] == sorted(
+        [order.price for order in orders]
+    )
+
+
+def test_decoder_handles_empty_book() -> None:
+    actual = __book_side(True, 0)
+
+    assert actual.orders() == []
+    assert actual.orders_from_layout() == []
+
+
+def test_decoder_changes_match_full_diff() -> None:
+    details = typing.cast(entropy.PerpMarketDetails, FakePerpMarketDetails())
+    decoder = entropy.PerpOrderBookSideDecoder(details)
+    before = __random_leaves(100)
+    after = [
+        (key, owner, quantity - 1 if index % 10 == 0 else quantity, client_id, tif)
+        for index, (key, owner, quantity, client_id, tif) in enumerate(before)
+        if index % 7 != 0
+    ]
+    after[3] = (after[3][0], after[3][1], after[3][2] + 5, after[3][3], after[3][4])
+    after += [((3000 << 64) | 17, after[0][1], 10, 1000, 0)]
+    before_data = __build_book_side(False, before, seed=1)
+    after_data = __build_book_side(False, after, seed=2)
+
+    previous = decoder.orders(before_data, entropy.Side.SELL)
+    actual = decoder.changes(after_data, entropy.Side.SELL, previous)
+    expected = entropy.OrderBookChange.between(
+        previous, decoder.orders(after_data, entropy.Side.SELL)
+    )
+
+    assert list(actual) == list(expected)
+    change_types = [change.change_type for change in actual]
+    assert change_types.count(entropy.OrderBookChangeType.REMOVE) == 16
+    assert change_types.count(entropy.OrderBookChangeType.FILL) == 8
+    assert change_types.count(entropy.OrderBookChangeType.ADD) == 2
+
+    assert (
+        decoder.changes(
+            after_data, entropy.Side.SELL, decoder.orders(after_data, entropy.Side.SELL)
+        )
+        == []
+    )
+
+
+def test_compact_orders_match_orders() -> None:
+    actual = __book_side(True, 120)
+    compact = actual.compact_orders()
+    orders = actual.orders()
+
+    assert [order.to_order() for order in compact] == list(orders)
+    for compact_order, order in zip(compact, orders):
+        assert compact_order.price == order.price
+        assert compact_order.quantity == order.quantity
+        assert compact_order.owner == order.owner
+        assert compact_order.expiration == order.expiration
+        assert compact_order.is_owned_by(order.owner)
+
+    smaller = compact[0].with_quantity_lots(compact[0].quantity_lots - 1)
+    assert smaller.id == compact[0].id
+    assert smaller.price == compact[0].price
+    assert smaller.quantity < compact[0].quantity
+
+
+def test_orderbook_from_compact_orders_matches_orderbook_from_orders() -> None:
+    bids = __book_side(True, 150)
+    asks = __book_side(False, 90)
+    converter = entropy.NullLotSizeConverter()
+    from_orders = entropy.OrderBook("TEST", converter, bids.orders(), asks.orders())
+    from_compact = entropy.OrderBook(
+        "TEST", converter, bids.compact_orders(), asks.compact_orders()
+    )
+    owner = bids.orders()[0].owner
+
+    for cutoff in [
+        None,
+        entropy.datetime_from_timestamp(1650000000 + 40),
+        entropy.datetime_from_timestamp(1650000000 + 100),
+        entropy.utc_now(),
+    ]:
+        assert from_compact.bids_at(cutoff) == from_orders.bids_at(cutoff)
+        assert from_compact.asks_at(cutoff) == from_orders.asks_at(cutoff)
+        assert from_compact.top_bid_at(cutoff) == from_orders.top_bid_at(cutoff)
+        assert from_compact.bid_levels_at(cutoff) == from_orders.bid_levels_at(cutoff)
+        assert from_compact.ask_levels_at(cutoff) == from_orders.ask_levels_at(cutoff)
+        for side in [entropy.Side.BUY, entropy.Side.SELL]:
+            assert from_compact.price_at_depth(
+                side, Decimal(1), owner, cutoff
+            ) == from_orders.price_at_depth(side, Decimal(1), owner, cutoff)
+
+    assert all(isinstance(order, entropy.Order) for order in from_compact.bids_at(None))
+
+
+def test_compact_orders_use_less_memory() -> None:
+    details = typing.cast(entropy.PerpMarketDetails, FakePerpMarketDetails())
+    decoder = entropy.PerpOrderBookSideDecoder(details)
+    # 512 leaves and 511 inner nodes is as deep as a `BookSide` can get.
+    data = __build_book_side(True, __random_leaves(512))
+
+    def __measure(
+        decode: typing.Callable[[], typing.Sequence[typing.Any]]
+    ) -> typing.Tuple[int, int]:
+        tracemalloc.start()
+        try:
+            decoded = decode()
+            retained, _ = tracemalloc.get_traced_memory()
+            allocations = sum(
+                stat.count
+                for stat in tracemalloc.take_snapshot().statistics("filename")
+            )
+        finally:
+            tracemalloc.stop()
+        assert len(decoded) == 512
+        return retained, allocations
+
+    order_bytes, order_allocations = __measure(
+        lambda: decoder.orders(data, entropy.Side.BUY)
+    )
+    compact_bytes, compact_allocations = __measure(
+        lambda: decoder.compact_orders(data, entropy.Side.BUY)
+    )
+    assert compact_bytes * 2 < order_bytes
+    assert compact_allocations * 2 < order_allocations
+
+
+def test_columns_match_orders() -> None:
+    details = typing.cast(entropy.PerpMarketDetails, FakePerpMarketDetails())
+    decoder = entropy.PerpOrderBookSideDecoder(details)
+    data = __build_book_side(False, __random_leaves(90))
+    actual = entropy.PerpOrderBookSideDecoder.columns(data, entropy.Side.SELL)
+    orders = decoder.orders(data, entropy.Side.SELL)
+
+    assert len(actual) == 90
+    assert [
+        (price << 64) | sequence
+        for price, sequence in zip(
+            actual.price_lots.tolist(), actual.sequence_numbers.tolist()
+        )
+    ] == [order.id for order in orders]
+    assert [
+        decoder.quantity_from_lots(quantity)
+        for quantity in actual.quantity_lots.tolist()
+    ] == [order.quantity for order in orders]
+    assert [bytes(owner) for owner in actual.owners.tolist()] == [
+        bytes(order.owner) for order in orders
+    ]
+    assert [expiration == 0 for expiration in actual.expirations.tolist()] == [
+        order.expiration == entropy.Order.NoExpiration for order in orders
+    ]
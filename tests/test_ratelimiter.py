@@ -0,0 +1,25 @@
+from .context import entropy
+
+
+def test_unlimited_never_waits() -> None:
+    actual = entropy.TokenBucketRateLimiter(0)
+    assert not actual.is_limited
+    for _ in range(100):
+        assert actual.reserve() == 0
+
+
+def test_burst_up_to_capacity_does_not_wait() -> None:
+    actual = entropy.TokenBucketRateLimiter(1, 3)
+    assert actual.is_limited
+    assert actual.reserve() == 0
+    assert actual.reserve() == 0
+    assert actual.reserve() == 0
+
+
+def test_waits_queue_up_after_burst() -> None:
+    actual = entropy.TokenBucketRateLimiter(10, 1)
+    assert actual.reserve() == 0
+    first_wait = actual.reserve()
+    second_wait = actual.reserve()
+    assert 0.05 < first_wait <= 0.1
+    assert 0.15 < second_wait <= 0.2
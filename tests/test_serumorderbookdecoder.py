@@ -0,0 +1,132 @@
+import random
+import struct
+import typing
+
+from .context import entropy
+from .fakes import fake_seeded_public_key
+
+from pyserum._layouts.slab import SLAB_LAYOUT
+from pyserum.market._internal.slab import Slab
+
+
+__NODE_SIZE = 72
+__NODE_COUNT = 200
+
+
+def __leaf(key: int, owner: bytes, quantity: int, client_id: int) -> bytes:
+    return struct.pack(
+        "<IBB2x16s32sQQ",
+        2,
+        0,
+        0,
+        key.to_bytes(16, "little"),
+        owner,
+        quantity,
+        client_id,
+    )
+
+
+def __inner(key: int, left: int, right: int) -> bytes:
+    return struct.pack("<II16sII", 1, 0, key.to_bytes(16, "little"), left, right).ljust(
+        __NODE_SIZE, b"\0"
+    )
+
+
+def __free(next: int) -> bytes:
+    return struct.pack("<II", 3, next).ljust(__NODE_SIZE, b"\0")
+
+
+# Leaves are (key, owner, quantity, client ID).
+__Leaf = typing.Tuple[int, bytes, int, int]
+
+
+def __random_leaves(count: int, seed: int = 42) -> typing.List[__Leaf]:
+    generator = random.Random(seed)
+    owners = [bytes(fake_seeded_public_key(f"owner {index}")) for index in range(5)]
+    keys = sorted(
+        (generator.randint(1000, 2000) << 64) | sequence
+        for sequence in generator.sample(range(1, 1_000_000), count)
+    )
+    return [
+        (key, generator.choice(owners), generator.randint(1, 500), index)
+        for index, key in enumerate(keys)
+    ]
+
+
+# Builds a Serum bids or asks account holding the leaves, scattered among free nodes.
+def __build_book_side(
+    is_bids: bool, leaves: typing.Sequence[__Leaf], seed: int = 42
+) -> bytes:
+    generator = random.Random(seed)
+    ordered = sorted(leaves)
+    count = len(ordered)
+    node_count = 2 * count - 1 if count > 0 else 0
+    slots = generator.sample(range(__NODE_COUNT), node_count)
+    nodes: typing.Dict[int, bytes] = {}
+
+    def __build(low: int, high: int) -> int:
+        index = slots.pop()
+        if high - low == 1:
+            nodes[index] = __leaf(*ordered[low])
+        else:
+            middle = (low + high) // 2
+            left = __build(low, middle)
+            right = __build(middle, high)
+            nodes[index] = __inner(ordered[middle][0], left, right)
+        return index
+
+    root = __build(0, count) if count > 0 else 0
+    body = b"".join(nodes.get(index, __free(0)) for index in range(__NODE_COUNT))
+    flags = 1 | (1 << 5 if is_bids else 1 << 6)
+    padding_and_flags = b"serum" + struct.pack("<Q", flags)
+    header = struct.pack("<I4xI4xIII4x", __NODE_COUNT, 0, 0, root, count)
+    return padding_and_flags + header + body
+
+
+def __assert_matches_pyserum(is_bids: bool, count: int) -> None:
+    data = __build_book_side(is_bids, __random_leaves(count))
+    actual = entropy.SerumOrderBookSideDecoder.columns(data)
+    expected = list(Slab.from_bytes(data[13:]).items(descending=is_bids))
+
+    assert len(actual) == count
+    assert actual.price_lots.tolist() == [node.key >> 64 for node in expected]
+    assert actual.sequence_numbers.tolist() == [
+        node.key & 0xFFFFFFFFFFFFFFFF for node in expected
+    ]
+    assert actual.quantity_lots.tolist() == [node.quantity for node in expected]
+    assert actual.client_ids.tolist() == [node.client_order_id for node in expected]
+    assert [bytes(owner) for owner in actual.owners.tolist()] == [
+        bytes(node.owner) for node in expected
+    ]
+    assert actual.expirations.tolist() == [0] * count
+
+
+def test_layout_matches_pyserum() -> None:
+    data = __build_book_side(True, __random_leaves(3))
+    slab = SLAB_LAYOUT.parse(data[13:])
+
+    assert entropy.SerumOrderBookSideDecoder.header(data) == (
+        slab.header.bump_index,
+        slab.header.free_list_length,
+        slab.header.free_list_head,
+        slab.header.root,
+        slab.header.leaf_count,
+    )
+
+
+def test_columns_match_pyserum_for_bids() -> None:
+    data = __build_book_side(True, [])
+    assert entropy.SerumOrderBookSideDecoder.side(data) == entropy.Side.BUY
+    __assert_matches_pyserum(True, 80)
+
+
+def test_columns_match_pyserum_for_asks() -> None:
+    data = __build_book_side(False, [])
+    assert entropy.SerumOrderBookSideDecoder.side(data) == entropy.Side.SELL
+    __assert_matches_pyserum(False, 33)
+
+
+def test_columns_of_empty_book() -> None:
+    actual = entropy.SerumOrderBookSideDecoder.columns(__build_book_side(False, []))
+
+    assert len(actual) == 0
@@ -0,0 +1,65 @@
+import json
+import pytest
+import typing
+
+from .context import entropy
+
+
+def __decode_in_chunks(
+    document: bytes, chunk_size: int
+) -> typing.Tuple[entropy.StreamingJsonArrayDecoder, typing.List[typing.Any], bool]:
+    actual = entropy.StreamingJsonArrayDecoder("result")
+    items: typing.List[typing.Any] = []
+    for start in range(0, len(document), chunk_size):
+        items += actual.feed(document[start : start + chunk_size])
+    return actual, items, actual.finish()
+
+
+def test_decodes_items_whatever_the_chunk_size() -> None:
+    expected = [
+        {"pubkey": f"key {index}", "account": {"data": ["AAAA", "base64"]}}
+        for index in range(20)
+    ] + [17, -2.5e3, "€ and 🥭", None, [1, [2, 3]], {"]": "[,"}]
+    document = json.dumps(
+        {"jsonrpc": "2.0", "result": expected, "id": 1}, ensure_ascii=False
+    ).encode()
+
+    for chunk_size in [1, 2, 7, 64, len(document)]:
+        actual, items, complete = __decode_in_chunks(document, chunk_size)
+        assert complete
+        assert items == expected
+        assert actual.item_count == len(expected)
+        assert actual.preamble == '{"jsonrpc": "2.0", '
+
+
+def test_yields_items_before_document_is_complete() -> None:
+    actual = entropy.StreamingJsonArrayDecoder("result")
+
+    assert actual.feed(b'{"result": [{"a": 1}, {"b"') == [{"a": 1}]
+    assert actual.feed(b": 2}, 3") == [{"b": 2}]
+    assert actual.feed(b"4]}") == [34]
+    assert actual.array_complete
+
+
+def test_empty_array() -> None:
+    _, items, complete = __decode_in_chunks(b'{"result":[],"id":1}', 3)
+
+    assert complete
+    assert items == []
+
+
+def test_error_document_is_kept_as_preamble() -> None:
+    document = b'{"jsonrpc":"2.0","error":{"code":-32005,"message":"behind"},"id":1}'
+    actual, items, complete = __decode_in_chunks(document, 5)
+
+    assert not complete
+    assert items == []
+    assert json.loads(actual.preamble)["error"]["code"] == -32005
+
+
+def test_truncated_array_raises() -> None:
+    actual = entropy.StreamingJsonArrayDecoder("result")
+    actual.feed(b'{"result": [1, 2, {"a": ')
+
+    with pytest.raises(Exception):
+        actual.finish()
@@ -0,0 +1,126 @@
+import json
+import os
+import stat
+import typing
+
+from .context import entropy
+
+from solana.publickey import PublicKey
+
+
+def __token(address: str, symbol: str, name: str) -> typing.Dict[str, typing.Any]:
+    return {"address": address, "symbol": symbol, "name": name, "decimals": 6}
+
+
+__TOKEN_DATA = {
+    "tokens": [
+        __token("So11111111111111111111111111111111111111112", "SOL", "Wrapped SOL"),
+        __token("9n4nbM75f5Ui33ZbPYXn59EwSgE8CGsHtAeTH5YFeJ9E", "BTC", "Sollet BTC"),
+        __token("2FPyTwcZLUg1MDrwsyoP4D6s1tM7hAkHYRjkNb5w6Pxk", "ETH", "Sollet ETH"),
+        __token("7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs", "eth", "Wormhole ETH"),
+        __token("2FPyTwcZLUg1MDrwsyoP4D6s1tM7hAkHYRjkNb5w6Pxk", "soETH", "Duplicate"),
+    ]
+}
+
+
+def test_lookups_find_first_match() -> None:
+    actual = entropy.TokenListIndex(entropy.TokenListIndex.build(__TOKEN_DATA))
+
+    assert actual.entry_count == 5
+    eth = actual.find_by_symbol("Eth")
+    assert eth is not None
+    assert eth["name"] == "Sollet ETH"
+    by_mint = actual.find_by_mint("2FPyTwcZLUg1MDrwsyoP4D6s1tM7hAkHYRjkNb5w6Pxk")
+    assert by_mint is not None
+    assert by_mint["symbol"] == "ETH"
+    assert actual.find_by_symbol("SOETH") is not None
+    assert actual.find_by_symbol("DOGE") is None
+    assert actual.find_by_mint("11111111111111111111111111111111") is None
+
+
+def test_empty_token_list() -> None:
+    actual = entropy.TokenListIndex(entropy.TokenListIndex.build({"tokens": []}))
+
+    assert actual.find_by_symbol("SOL") is None
+    assert actual.find_by_mint("So11111111111111111111111111111111111111112") is None
+
+
+def test_index_is_rebuilt_when_source_changes(tmp_path: typing.Any) -> None:
+    source = os.path.join(tmp_path, "tokens.json")
+    with open(source, "w") as source_file:
+        json.dump(__TOKEN_DATA, source_file)
+    lookup = entropy.SPLTokenLookup.load(source, str(tmp_path))
+    index_filename = entropy.SPLTokenLookup.index_filename(source, str(tmp_path))
+
+    assert entropy.TokenListIndex.is_current(index_filename, source)
+    assert lookup.find_by_symbol("DOGE") is None
+
+    with open(source, "w") as source_file:
+        json.dump(
+            {"tokens": [*__TOKEN_DATA["tokens"], __token("D" * 44, "DOGE", "Doge")]},
+            source_file,
+        )
+    os.utime(source, ns=(0, 0))
+
+    assert not entropy.TokenListIndex.is_current(index_filename, source)
+    reloaded = entropy.SPLTokenLookup.load(source, str(tmp_path))
+    doge = reloaded.find_by_symbol("doge")
+    assert doge is not None
+    assert doge.name == "Doge"
+    assert entropy.TokenListIndex.is_current(index_filename, source)
+
+
+def test_index_writable_by_others_is_rebuilt(tmp_path: typing.Any) -> None:
+    source = os.path.join(tmp_path, "tokens.json")
+    with open(source, "w") as source_file:
+        json.dump(__TOKEN_DATA, source_file)
+    entropy.SPLTokenLookup.load(source, str(tmp_path))
+    index_filename = entropy.SPLTokenLookup.index_filename(source, str(tmp_path))
+    assert stat.S_IMODE(os.stat(index_filename).st_mode) == 0o600
+
+    os.chmod(index_filename, 0o666)
+    assert not entropy.TokenListIndex.is_current(index_filename, source)
+
+    entropy.SPLTokenLookup.load(source, str(tmp_path))
+    assert entropy.TokenListIndex.is_current(index_filename, source)
+
+
+def test_temporary_file_is_removed_when_rename_fails(
+    tmp_path: typing.Any, monkeypatch: typing.Any
+) -> None:
+    source = os.path.join(tmp_path, "tokens.json")
+    with open(source, "w") as source_file:
+        json.dump(__TOKEN_DATA, source_file)
+
+    def __fail_replace(*_: typing.Any) -> None:
+        raise OSError("Rename failed")
+
+    monkeypatch.setattr(os, "replace", __fail_replace)
+    actual = entropy.SPLTokenLookup.load(source, str(tmp_path))
+
+    assert actual.find_by_symbol("SOL") is not None
+    assert sorted(os.listdir(tmp_path)) == ["tokens.json"]
+
+
+def test_index_matches_linear_search_of_token_list(tmp_path: typing.Any) -> None:
+    filename = entropy.SPLTokenLookup.DefaultDataFilepath
+    with open(filename, encoding="utf-8") as json_file:
+        token_data = json.load(json_file)
+    linear = entropy.SPLTokenLookup(filename, token_data)
+    entropy.SPLTokenLookup.load(filename, str(tmp_path))
+    actual = entropy.SPLTokenLookup.load(filename, str(tmp_path))
+
+    def __expected_by_symbol(symbol: str) -> typing.Optional[str]:
+        for token in token_data["tokens"]:
+            if entropy.Instrument.symbols_match(token["symbol"], symbol):
+                return str(token["address"])
+        return None
+
+    for token in token_data["tokens"][::25]:
+        by_mint = actual.find_by_mint(PublicKey(token["address"]))
+        assert by_mint is not None
+        found_by_symbol = actual.find_by_symbol(token["symbol"])
+        assert found_by_symbol is not None
+        assert str(found_by_symbol.mint) == __expected_by_symbol(token["symbol"])
+
+    assert actual.find_by_symbol("ETH") == linear.find_by_symbol("ETH")
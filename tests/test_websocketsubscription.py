@@ -0,0 +1,247 @@
+import pytest
+import threading
+import time
+import typing
+
+from .context import entropy
+from .fakes import fake_context, fake_seeded_public_key
+
+from solana.rpc.types import RPCResponse
+
+
+class FakeWebSocketSubscription(entropy.WebSocketSubscription[int]):
+    def build_request(self) -> str:
+        return f"request {self.id}"
+
+    def build_subscribed_instance(self, response: RPCResponse) -> int:
+        return int(response["result"])
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: typing.List[str] = []
+
+    def send(self, data: str) -> None:
+        self.sent += [data]
+
+
+def __confirmation(id: int, subscription_id: int) -> typing.Dict[str, typing.Any]:
+    return {"jsonrpc": "2.0", "id": id, "result": subscription_id}
+
+
+def __notification(subscription_id: int, value: int) -> typing.Dict[str, typing.Any]:
+    return {
+        "jsonrpc": "2.0",
+        "method": "accountNotification",
+        "params": {"subscription": subscription_id, "result": value},
+    }
+
+
+def __build_manager(
+    count: int,
+) -> typing.Tuple[
+    entropy.SharedWebSocketSubscriptionManager,
+    typing.Sequence[FakeWebSocketSubscription],
+]:
+    context = fake_context()
+    manager = entropy.SharedWebSocketSubscriptionManager(context)
+    subscriptions = [FakeWebSocketSubscription(context) for _ in range(count)]
+    for index, subscription in enumerate(subscriptions):
+        manager.add(subscription)
+        manager.on_item(__confirmation(subscription.id, 1000 + index))
+    return manager, subscriptions
+
+
+def test_notification_dispatched_to_subscription() -> None:
+    manager, subscriptions = __build_manager(3)
+    received: typing.List[int] = []
+    subscriptions[1].publisher.subscribe(on_next=received.append)
+
+    manager.on_item(__notification(1001, 17))
+
+    assert received == [17]
+    assert manager.subscription_by_subscription_id(1001) is subscriptions[1]
+
+
+def test_reconnect_replaces_subscription_ids() -> None:
+    manager, subscriptions = __build_manager(2)
+    websocket = FakeWebSocket()
+
+    manager.open_handler(websocket)  # type: ignore[arg-type]
+
+    assert websocket.sent == [f"request {sub.id}" for sub in subscriptions]
+    assert all(subscription.subscription_id == 0 for subscription in subscriptions)
+
+    manager.on_item(__confirmation(subscriptions[0].id, 2000))
+    received: typing.List[int] = []
+    subscriptions[0].publisher.subscribe(on_next=received.append)
+    manager.on_item(__notification(2000, 5))
+    assert received == [5]
+
+    # Notifications for subscription IDs from the old connection can't be dispatched.
+    try:
+        manager.subscription_by_subscription_id(1000)
+        assert False, "Stale subscription ID should not be found."
+    except Exception as exception:
+        assert "1000" in str(exception)
+
+
+def test_notifications_reach_the_right_subscription_among_many() -> None:
+    manager, subscriptions = __build_manager(5000)
+    received: typing.Dict[int, typing.List[int]] = {}
+    for subscription in subscriptions:
+        received[subscription.id] = []
+        subscription.publisher.subscribe(on_next=received[subscription.id].append)
+
+    for index in range(2000):
+        manager.on_item(__notification(1000 + (index * 7919) % 5000, index))
+
+    for position, subscription in enumerate(subscriptions):
+        assert received[subscription.id] == [
+            index for index in range(2000) if (index * 7919) % 5000 == position
+        ]
+
+
+def test_sharded_manager_hash_placement_is_stable() -> None:
+    context = fake_context()
+    actual = entropy.ShardedWebSocketSubscriptionManager(context, shard_count=4)
+    addresses = [fake_seeded_public_key(f"account {index}") for index in range(40)]
+    for address in addresses:
+        actual.add(
+            entropy.WebSocketAccountSubscription(context, address, lambda info: info)
+        )
+
+    # The same address always goes to the same shard, even in a different manager.
+    other = entropy.ShardedWebSocketSubscriptionManager(context, shard_count=4)
+    for shard, other_shard in zip(actual.shards, other.shards):
+        for subscription in shard.subscriptions:
+            duplicate = entropy.WebSocketAccountSubscription(
+                context, subscription.address, lambda info: info
+            )
+            assert other.shard_for(duplicate) is other_shard
+
+    assert len(actual.subscriptions) == 40
+    assert sum(len(shard.subscriptions) for shard in actual.shards) == 40
+    assert all(len(shard.subscriptions) > 0 for shard in actual.shards)
+
+
+def test_sharded_manager_weight_placement() -> None:
+    context = fake_context()
+    actual = entropy.ShardedWebSocketSubscriptionManager(
+        context, shard_count=2, weights=[2, 1]
+    )
+    for _ in range(30):
+        actual.add(FakeWebSocketSubscription(context))
+
+    assert [len(shard.subscriptions) for shard in actual.shards] == [20, 10]
+
+
+def test_sharded_manager_spreads_shards_across_urls() -> None:
+    context = fake_context()
+    actual = entropy.ShardedWebSocketSubscriptionManager(
+        context, shard_count=3, websocket_urls=["ws://first", "ws://second"]
+    )
+
+    assert [shard.websocket_url for shard in actual.shards] == [
+        "ws://first",
+        "ws://second",
+        "ws://first",
+    ]
+
+
+def test_sharded_manager_rejects_bad_weights() -> None:
+    context = fake_context()
+    with pytest.raises(Exception):
+        entropy.ShardedWebSocketSubscriptionManager(context, shard_count=2, weights=[1])
+    with pytest.raises(Exception):
+        entropy.ShardedWebSocketSubscriptionManager(
+            context, shard_count=2, weights=[1, 0]
+        )
+
+
+class BlockingAccountSubscription(entropy.WebSocketAccountSubscription[int]):
+    def __init__(self, context: entropy.Context) -> None:
+        super().__init__(context, fake_seeded_public_key("blocking"), lambda _: 0)
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def build_subscribed_instance(self, response: RPCResponse) -> int:
+        self.entered.set()
+        self.release.wait(5)
+        return int(response["result"]["context"]["slot"])
+
+
+def __account_params(slot: int) -> typing.Dict[str, typing.Any]:
+    return {"subscription": 1, "result": {"context": {"slot": slot}, "value": None}}
+
+
+def __wait_for(condition: typing.Callable[[], bool]) -> None:
+    for _ in range(500):
+        if condition():
+            return
+        time.sleep(0.01)
+    assert False, "Timed out waiting for condition."
+
+
+def test_threaded_pipeline_drops_superseded_account_updates() -> None:
+    context = fake_context()
+    subscription = BlockingAccountSubscription(context)
+    received: typing.List[int] = []
+    subscription.publisher.subscribe(on_next=received.append)
+    actual = entropy.ThreadedNotificationPipeline(worker_count=2)
+
+    # The first update is taken by the worker, which then blocks parsing it.
+    actual.submit(subscription, __account_params(10))
+    assert subscription.entered.wait(5)
+
+    actual.submit(subscription, __account_params(11))
+    actual.submit(subscription, __account_params(12))
+    actual.submit(subscription, __account_params(13))
+    assert actual.queue_depth == 1
+    assert actual.dropped == 2
+
+    # Older than an update that's already waiting, so dropped.
+    actual.submit(subscription, __account_params(9))
+    assert actual.dropped == 3
+
+    subscription.release.set()
+    __wait_for(lambda: actual.processed == 2)
+    assert received == [10, 13]
+
+    # Older than the newest update already handled, so dropped.
+    actual.submit(subscription, __account_params(12))
+    assert actual.dropped == 4
+    actual.dispose()
+
+
+def test_threaded_pipeline_never_drops_non_account_notifications() -> None:
+    context = fake_context()
+    subscription = FakeWebSocketSubscription(context)
+    received: typing.List[int] = []
+    subscription.publisher.subscribe(on_next=received.append)
+    actual = entropy.ThreadedNotificationPipeline(worker_count=3)
+
+    for value in range(100):
+        actual.submit(subscription, {"result": value})
+    __wait_for(lambda: actual.processed == 100)
+
+    assert received == list(range(100))
+    assert actual.dropped == 0
+    actual.dispose()
+
+
+def test_shared_manager_uses_pipeline() -> None:
+    context = fake_context()
+    pipeline = entropy.ThreadedNotificationPipeline(worker_count=1)
+    manager = entropy.SharedWebSocketSubscriptionManager(context, pipeline=pipeline)
+    subscription = FakeWebSocketSubscription(context)
+    received: typing.List[int] = []
+    subscription.publisher.subscribe(on_next=received.append)
+    manager.add(subscription)
+    manager.on_item(__confirmation(subscription.id, 77))
+
+    manager.on_item(__notification(77, 3))
+    __wait_for(lambda: pipeline.processed == 1)
+
+    assert received == [3]
+    pipeline.dispose()